@@ -1,7 +1,8 @@
 import streamlit as st
 from pathlib import Path
 import streamlit.components.v1 as components
-from sections import employment, inflation
+from sections import diagnostics
+from data_fetcher import trace
 
 # ── Page-wide setup ─────────────────────────────────────
 st.set_page_config(page_title="Dual Mandate Monitor", layout="wide")
@@ -23,13 +24,30 @@ st.markdown("""
 
 st.markdown("# The Dual Mandate Monitor")
 
-# ── Tabs & Sections ─────────────────────────────────────
-from sections import employment, inflation  
-
-employment_tab, inflation_tab = st.tabs(["Employment", "Inflation"])
-
-with employment_tab:
-    employment.render()       
-
-with inflation_tab:
-    inflation.render()        
+# ── Navigation & Sections ───────────────────────────────
+# Only the selected page renders; the rest are prefetched in the background,
+# and a per-process warm-up thread keeps every page's panels built.
+from sections import pages, warmup
+warmup.start()
+
+# hidden diagnostics tab: DASHBOARD_TRACE=1 or ?diagnostics=1
+show_diagnostics = trace.ENABLED or st.query_params.get("diagnostics") == "1"
+if show_diagnostics:
+    run_trace = trace.start()
+    trace.instrument_streamlit()
+
+section = st.radio("Section", list(pages.PAGES), horizontal=True,
+                   label_visibility="collapsed", key="nav_section")
+page    = st.radio("Page", list(pages.PAGES[section]), horizontal=True,
+                   label_visibility="collapsed", key=f"nav_{section}")
+
+if show_diagnostics:
+    page_tab, diagnostics_tab = st.tabs([page, "Diagnostics"])
+    with page_tab:
+        pages.render(section, page)
+    with diagnostics_tab:
+        diagnostics.render(run_trace)
+else:
+    pages.render(section, page)
+
+pages.prefetch_others(section, page)
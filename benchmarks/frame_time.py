@@ -0,0 +1,125 @@
+"""
+Client-side frame time of dense charts, SVG vs WebGL, against recorded fixtures.
+
+    python -m benchmarks.frame_time fixtures --frames 60 --out frame_time.html
+
+Renders the pages holding the densest figures (claims, wage sub-sectors) once
+with DASHBOARD_RENDER=svg and once with webgl, captures every figure passed to
+st.plotly_chart and writes a self-contained HTML page that replays a pan
+across each figure's x-axis, timing every frame with requestAnimationFrame.
+With playwright installed (`pip install playwright && playwright install
+chromium`) the page is run headless and the median / p95 frame times are
+printed; otherwise only the captured figures (points, trace type) are, and
+the HTML is opened in a browser to measure.
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+PAGES = [("Employment", "General"), ("Employment", "Wages")]
+
+_PAGE = """<!doctype html><html><head><meta charset="utf-8">
+<script>{plotlyjs}</script></head><body>
+<pre id="out">measuring…</pre>
+<script>
+const FIGS = {figs}, FRAMES = {frames};
+const nextFrame = () => new Promise(r => requestAnimationFrame(r));
+async function pan(fig) {{
+  const div = document.createElement("div");
+  div.style.width = "640px"; div.style.height = "390px";
+  document.body.appendChild(div);
+  await Plotly.newPlot(div, fig.data, fig.layout);
+  const x = div._fullLayout.xaxis.range.map(v => new Date(v).getTime());
+  const step = (x[1] - x[0]) / 20, times = [];
+  for (let i = 0; i < FRAMES; i++) {{
+    const t0 = performance.now();
+    await Plotly.relayout(div, {{"xaxis.range": [x[0] - i * step, x[1] - i * step]}});
+    await nextFrame();
+    times.push(performance.now() - t0);
+  }}
+  Plotly.purge(div); div.remove();
+  times.sort((a, b) => a - b);
+  return {{median: times[times.length >> 1], p95: times[Math.floor(times.length * 0.95)]}};
+}}
+(async () => {{
+  const rows = [];
+  for (const f of FIGS) rows.push(Object.assign({{name: f.name, mode: f.mode, points: f.points, trace: f.trace}}, await pan(f.fig)));
+  window.__results = rows;
+  document.getElementById("out").textContent = JSON.stringify(rows, null, 1);
+}})();
+</script></body></html>"""
+
+
+def _figures(mode: str) -> list:
+    import streamlit as st
+    from sections import charts, pages
+
+    charts.RENDER_MODE = mode
+    captured = []
+
+    def plotly_chart(fig, *args, **kwargs):
+        points = sum(len(t.x) for t in fig.data if getattr(t, "x", None) is not None)
+        trace  = fig.data[0].type if fig.data else "-"
+        captured.append({"mode": mode, "points": points, "trace": trace,
+                         "fig": json.loads(fig.to_json())})
+
+    st.plotly_chart = plotly_chart
+    for section, page in PAGES:
+        for fn in pages.PAGES[section][page].renders:
+            start = len(captured)
+            fn()
+            for i, c in enumerate(captured[start:]):
+                c["name"] = f"{fn.__name__}[{i}]"
+    return captured
+
+
+def run(fixtures: str, port: int, frames: int, out: str):
+    os.environ["FRED_STANDIN_URL"] = f"http://127.0.0.1:{port}"
+    os.environ.pop("FRED_RECORD_DIR", None)
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+    from plotly.offline import get_plotlyjs
+    from data_fetcher import offline
+
+    server = offline.serve(fixtures, port=port)
+    try:
+        figs = _figures("svg") + _figures("webgl")
+    finally:
+        server.shutdown()
+
+    html = _PAGE.format(plotlyjs=get_plotlyjs(), figs=json.dumps(figs), frames=frames)
+    Path(out).write_text(html, encoding="utf-8")
+
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        return [dict(f, median=None, p95=None) for f in figs]
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        page = browser.new_page()
+        page.goto(Path(out).resolve().as_uri())
+        page.wait_for_function("window.__results !== undefined", timeout=0)
+        rows = page.evaluate("window.__results")
+        browser.close()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", help="directory recorded with FRED_RECORD_DIR")
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--out", default="frame_time.html")
+    args = parser.parse_args()
+
+    rows = run(args.fixtures, args.port, args.frames, args.out)
+    print(f"{'figure':<34}{'mode':>7}{'points':>8}{'trace':>11}{'median_ms':>11}{'p95_ms':>9}")
+    for r in rows:
+        timed = (f"{r['median']:>11.1f}{r['p95']:>9.1f}" if r["median"] is not None
+                 else f"{'-':>11}{'-':>9}")
+        print(f"{r['name']:<34}{r['mode']:>7}{r['points']:>8}{r['trace']:>11}{timed}")
+    if rows[0]["median"] is None:
+        print(f"playwright not installed; open {args.out} in a browser to measure",
+              file=sys.stderr)
@@ -0,0 +1,114 @@
+"""
+FRED download benchmark: pandas_datareader vs data_fetcher.client.
+
+    python -m benchmarks.fred_client fixtures --latency 0.02 --repeat 3
+
+Downloads every code in the series registry from the offline stand-in, once
+over the full history (cold start) and once over the last year only (the
+incremental refresh window), sequentially and on FRED_MAX_WORKERS threads:
+    datareader   pandas_datareader FredReader, as _fred_series used to call it
+    client csv   FredClient without an API key (fredgraph.csv, cosd / coed)
+    client json  FredClient with an API key (series/observations JSON)
+Every client frame is checked against the datareader frame first. Also
+reports the import time of each module on top of pandas.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+_IMPORT = "import pandas, time; t = time.perf_counter(); import {}; print(time.perf_counter() - t)"
+
+
+def _import_s(module: str) -> float:
+    out = subprocess.run([sys.executable, "-c", _IMPORT.format(module)],
+                         capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+
+def _datareader(base: str):
+    from pandas_datareader.fred import FredReader
+
+    class StandInReader(FredReader):
+        url = f"{base}/graph/fredgraph.csv"
+
+    return lambda code, start, end: StandInReader(code, start, end).read()
+
+
+def _timed(fetch, codes, start, end, workers: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        if workers == 1:
+            for code in codes:
+                fetch(code, start, end)
+        else:
+            with ThreadPoolExecutor(workers) as pool:
+                list(pool.map(lambda c: fetch(c, start, end), codes))
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(fixtures: str, port: int, latency: float, repeat: int, workers: int) -> list:
+    import pandas as pd
+    from data_fetcher import offline, registry
+    from data_fetcher.client import FredClient
+
+    base   = f"http://127.0.0.1:{port}"
+    codes  = registry.all_codes()
+    today  = datetime.now().strftime("%Y-%m-%d")
+    windows = {"full history": "1950-01-01",
+               "last year"   : (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")}
+
+    methods = {}
+    try:
+        methods["datareader"] = _datareader(base)
+    except ImportError:
+        print("pandas_datareader not installed; comparing the client only", file=sys.stderr)
+    csv, js = FredClient(None, base, workers), FredClient("benchmark", base, workers)
+    methods["client csv"]  = csv.series
+    methods["client json"] = js.series
+
+    server = offline.serve(fixtures, port=port, latency=latency)
+    rows = []
+    try:
+        if "datareader" in methods:
+            for code in codes:
+                want = methods["datareader"](code, windows["full history"], today)
+                for name in ("client csv", "client json"):
+                    got = methods[name](code, windows["full history"], today)
+                    pd.testing.assert_frame_equal(got, want, check_exact=True)
+
+        for label, start in windows.items():
+            for name, fetch in methods.items():
+                seq = _timed(fetch, codes, start, today, 1, repeat)
+                par = _timed(fetch, codes, start, today, workers, repeat)
+                rows.append((label, name, seq * 1000, par * 1000))
+    finally:
+        server.shutdown()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", help="directory recorded with FRED_RECORD_DIR")
+    parser.add_argument("--port", type=int, default=8768)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("FRED_MAX_WORKERS", 8)))
+    args = parser.parse_args()
+
+    rows = run(args.fixtures, args.port, args.latency, args.repeat, args.workers)
+    print(f"{'window':<14}{'method':<13}{'sequential_ms':>15}{'threads_ms':>12}")
+    for label, name, seq, par in rows:
+        print(f"{label:<14}{name:<13}{seq:>15.0f}{par:>12.0f}")
+
+    print(f"\n{'module':<24}{'import_ms':>10}")
+    for module in ("pandas_datareader.data", "data_fetcher.client"):
+        try:
+            print(f"{module:<24}{_import_s(module) * 1000:>10.0f}")
+        except subprocess.CalledProcessError:
+            print(f"{module:<24}{'n/a':>10}")
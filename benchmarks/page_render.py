@@ -0,0 +1,207 @@
+"""
+Headless page-render benchmark against recorded fixtures.
+
+    python -m benchmarks.page_render fixtures --latency 0.05 --out bench_results.json
+    python -m benchmarks.page_render fixtures --compare bench_results.json
+
+Serves the fixture directory through the offline FRED stand-in and calls every
+section's render functions in Streamlit bare mode (st.plotly_chart stubbed to
+serialise the figure only). Three passes are timed:
+    cold     empty in-process caches and an empty series store
+    restart  empty in-process caches, series store kept on disk
+    warm     everything cached
+For each render function and section: wall time, time spent in downloads
+(summed over worker threads), figure serialisation time, peak traced memory,
+network calls and serialised figure bytes.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+
+class _Probe:
+    """Counters patched into the fetch layer and st.plotly_chart."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.fetch_s = 0.0
+        self.serialize_s = 0.0
+        self.fig_bytes = 0
+        self.figures = 0
+
+    def wrap_fetch(self, fn):
+        def wrapped(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.calls += 1
+                    self.fetch_s += time.perf_counter() - t0
+        return wrapped
+
+    def plotly_chart(self, fig, *args, **kwargs):
+        t0 = time.perf_counter()
+        payload = fig.to_json()
+        with self._lock:
+            self.serialize_s += time.perf_counter() - t0
+            self.fig_bytes += len(payload.encode())
+            self.figures += 1
+
+
+def _targets():
+    """(section, name, callable) for every page in navigation order."""
+    from sections.pages import PAGES
+    return [
+        (section.lower(), fn.__name__, fn)
+        for section, pages in PAGES.items()
+        for page in pages.values()
+        for fn in page.renders
+    ]
+
+
+def _measure(probe, fn) -> dict:
+    probe.reset()
+    t0 = time.perf_counter()
+    fn()
+    wall = time.perf_counter() - t0
+    return {
+        "wall_s"     : round(wall, 4),
+        "fetch_s"    : round(probe.fetch_s, 4),
+        "serialize_s": round(probe.serialize_s, 4),
+        "net_calls"  : probe.calls,
+        "figures"    : probe.figures,
+        "fig_bytes"  : probe.fig_bytes,
+    }
+
+
+def _peak_mem_mb(fn) -> float:
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    fn()
+    return round((tracemalloc.get_traced_memory()[1] - base) / 2**20, 2)
+
+
+def _passes(targets, measure, reset) -> dict:
+    """Run every target cold, after a simulated restart and warm."""
+    out = {}
+    for phase in ("cold", "restart", "warm"):
+        reset(phase)
+        out[phase] = {f"{sec}/{name}": measure(fn) for sec, name, fn in targets}
+    return out
+
+
+def _section_totals(rows: dict) -> dict:
+    totals = {}
+    for key, m in rows.items():
+        section = key.split("/")[0]
+        t = totals.setdefault(section, dict.fromkeys(m, 0))
+        for k, v in m.items():
+            t[k] = max(t[k], v) if k == "peak_mem_mb" else round(t[k] + v, 4)
+    return totals
+
+
+def run(fixtures: str, latency: float, port: int) -> dict:
+    # must be set before data_fetcher is imported
+    os.environ["FRED_STANDIN_URL"] = f"http://127.0.0.1:{port}"
+    os.environ.pop("FRED_RECORD_DIR", None)
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")   # bare-mode warnings
+
+    import streamlit as st
+    from data_fetcher import offline, fred
+    from sections import charts
+
+    server = offline.serve(fixtures, port=port, latency=latency)
+
+    probe = _Probe()
+    fred._download = probe.wrap_fetch(fred._download)
+    offline.read_csv = probe.wrap_fetch(offline.read_csv)
+    st.plotly_chart = probe.plotly_chart
+
+    def reset(phase):
+        if phase == "cold":
+            fred._STORE.root = Path(tempfile.mkdtemp(prefix="fred_store_"))
+        if phase in ("cold", "restart"):     # "restart" keeps the store on disk
+            st.cache_data.clear()
+            st.cache_resource.clear()
+            fred._CACHE.clear()
+            charts._FIGURES.clear()
+
+    targets = _targets()
+    try:
+        timed = _passes(targets, lambda fn: _measure(probe, fn), reset)
+        # tracemalloc slows pandas/plotly several-fold, so memory gets its own passes
+        tracemalloc.start()
+        try:
+            memory = _passes(targets, _peak_mem_mb, reset)
+        finally:
+            tracemalloc.stop()
+    finally:
+        server.shutdown()
+
+    passes = {}
+    for phase, rows in timed.items():
+        for key, m in rows.items():
+            m["peak_mem_mb"] = memory[phase][key]
+        passes[phase] = {"sections": _section_totals(rows), "functions": rows}
+
+    import pandas, plotly
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "fixtures" : os.path.abspath(fixtures),
+            "latency_s": latency,
+            "python"   : platform.python_version(),
+            "pandas"   : pandas.__version__,
+            "plotly"   : plotly.__version__,
+            "streamlit": st.__version__,
+        },
+        "passes": passes,
+    }
+
+
+def _print(result: dict, previous: dict=None) -> None:
+    cols = ["wall_s", "fetch_s", "serialize_s", "peak_mem_mb", "net_calls", "fig_bytes"]
+    print(f"{'pass/section':<24}" + "".join(f"{c:>14}" for c in cols))
+    for phase, data in result["passes"].items():
+        for section, m in data["sections"].items():
+            line = f"{phase + '/' + section:<24}" + "".join(f"{m[c]:>14}" for c in cols)
+            print(line)
+            if previous:
+                old = previous["passes"].get(phase, {}).get("sections", {}).get(section)
+                if old:
+                    print(f"{'  Δ vs previous':<24}" + "".join(
+                        f"{round(m[c] - old.get(c, 0), 4):>+14}" for c in cols))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", help="directory recorded with FRED_RECORD_DIR")
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in latency per request (s)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", help="earlier results JSON to diff against")
+    args = parser.parse_args()
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as fh:
+            previous = json.load(fh)
+
+    result = run(args.fixtures, args.latency, args.port)
+    with open(args.out, "w") as fh:
+        json.dump(result, fh, indent=1)
+    _print(result, previous)
+    print(f"\nwritten to {args.out}", file=sys.stderr)
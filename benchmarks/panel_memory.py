@@ -0,0 +1,135 @@
+"""
+Cached-panel memory benchmark: default vs compact (DASHBOARD_COMPACT=1).
+
+    python -m benchmarks.panel_memory fixtures
+
+Builds every page's panels from the offline stand-in, once per mode, and
+reports per panel what a Streamlit process holds for it:
+    cached_kb   the panel pickled, i.e. what st.cache_data keeps (pandas < 3)
+    copy_kb     the panel unpickled: what st.cache_resource keeps once per
+                process, or st.cache_data hands each run (traced allocations)
+Then renders every page in both modes and checks that each figure matches to
+displayed precision: same traces, x values and layout, y values and axis
+ranges within 1e-4 of the trace's (or axis') largest magnitude.
+"""
+import argparse
+import base64
+import os
+import pickle
+import sys
+import tempfile
+import tracemalloc
+import numpy as np
+
+RTOL = 1e-4
+
+
+def _copy_kb(blob: bytes) -> float:
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        obj  = pickle.loads(blob)
+        size = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+    del obj
+    return size / 1024
+
+
+def _measure(panels) -> dict:
+    out = {}
+    for panel in panels:
+        blob = pickle.dumps(panel())
+        out[f"{panel.__module__.split('.')[-1]}.{panel.__name__}"] = (len(blob) / 1024, _copy_kb(blob))
+    return out
+
+
+def _figures(pages) -> list:
+    import streamlit as st
+    figs = []
+    st.plotly_chart = lambda fig, *a, **k: figs.append(fig)
+    for section in pages.PAGES.values():
+        for page in section.values():
+            for render in page.renders:
+                render()
+    return figs
+
+
+def _numbers(value):
+    """value as a float array if it is numeric data (plain or plotly's bdata)."""
+    if isinstance(value, dict) and "bdata" in value:
+        arr = np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"])
+        return arr.astype(np.float64).reshape(value.get("shape", arr.shape))
+    if isinstance(value, bool) or not isinstance(value, (int, float, np.number, list, tuple, np.ndarray)):
+        return None
+    try:
+        return np.atleast_1d(np.asarray(value, dtype=np.float64))
+    except (TypeError, ValueError):
+        return None
+
+
+def _same(a, b, path="") -> list:
+    """Paths where two figure dicts differ beyond displayed precision."""
+    x, y = _numbers(a), _numbers(b)
+    if x is None and isinstance(a, dict) and isinstance(b, dict):
+        if a.keys() != b.keys():
+            return [path or "/"]
+        return [p for k in a for p in _same(a[k], b[k], f"{path}/{k}")]
+    if x is not None and y is not None and x.shape == y.shape and x.size:
+        scale = np.nanmax(np.abs(np.r_[x.ravel(), y.ravel()])) or 1.0
+        ok = np.allclose(x, y, rtol=0, atol=RTOL * scale, equal_nan=True)
+        return [] if ok else [path]
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)) and len(a) == len(b):
+        return [p for i, (u, v) in enumerate(zip(a, b)) for p in _same(u, v, f"{path}/{i}")]
+    return [] if str(a) == str(b) else [path]
+
+
+def run(fixtures: str, port: int) -> tuple:
+    os.environ["FRED_STANDIN_URL"] = f"http://127.0.0.1:{port}"
+    os.environ["FRED_STORE_DIR"]   = tempfile.mkdtemp(prefix="fred_store_")
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+    import streamlit as st
+    from data_fetcher import compact, offline, fred
+    from sections import charts, pages, warmup
+
+    server = offline.serve(fixtures, port=port)
+    sizes, figures = {}, {}
+    try:
+        fred.fetch_many(warmup.all_codes())
+        for mode in (False, True):
+            compact.ENABLED = mode
+            st.cache_data.clear()
+            st.cache_resource.clear()
+            charts._FIGURES.clear()
+            sizes[mode]   = _measure(warmup.all_panels())
+            figures[mode] = [f.to_plotly_json() for f in _figures(pages)]
+    finally:
+        server.shutdown()
+
+    diffs = [(i, p) for i, (a, b) in enumerate(zip(figures[False], figures[True]))
+             for p in _same(a, b)]
+    if len(figures[False]) != len(figures[True]):
+        diffs.append((None, "figure count"))
+    return sizes, diffs, len(figures[False])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", help="directory recorded with FRED_RECORD_DIR")
+    parser.add_argument("--port", type=int, default=8769)
+    args = parser.parse_args()
+
+    sizes, diffs, n = run(args.fixtures, args.port)
+    print(f"{'panel':<34}{'cached_kb':>10}{'compact':>10}{'copy_kb':>10}{'compact':>10}")
+    total = np.zeros(4)
+    for name, (cached, copy) in sizes[False].items():
+        c_cached, c_copy = sizes[True][name]
+        total += (cached, c_cached, copy, c_copy)
+        print(f"{name:<34}{cached:>10.0f}{c_cached:>10.0f}{copy:>10.0f}{c_copy:>10.0f}")
+    print(f"{'total':<34}" + "".join(f"{v:>10.0f}" for v in total))
+    print(f"\nreduction: cached {1 - total[1] / total[0]:.0%}, in memory {1 - total[3] / total[2]:.0%}")
+    print(f"figures: {n} compared, {len({i for i, _ in diffs})} differ beyond displayed precision")
+    for i, path in diffs[:20]:
+        print(f"  figure {i}: {path}")
+    sys.exit(1 if diffs else 0)
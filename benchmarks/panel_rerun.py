@@ -0,0 +1,94 @@
+"""
+Warm-rerun benchmark: panels from st.cache_data vs shared st.cache_resource.
+
+    python -m benchmarks.panel_rerun fixtures --repeat 20
+
+Fills the series store from the offline stand-in, builds every page's panels
+once, then times warm reruns in each mode (schedule.SHARED_PANELS off / on):
+    panels   every panel builder of every page called once, as reruns do
+    pages    every page rendered (st.plotly_chart stubbed; figures cached)
+Per rerun: median wall time, peak traced allocation, and the memory blocks
+and bytes still held by the rerun's panels (its copies) afterwards.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+
+def _timed(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def _allocations(fn) -> tuple:
+    """(peak KB, blocks held, KB held) of one call, with its result kept alive."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base   = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        peak   = tracemalloc.get_traced_memory()[1] - base
+        diff   = tracemalloc.take_snapshot().compare_to(before, "filename")
+    finally:
+        tracemalloc.stop()
+    del result
+    return (peak / 1024, sum(d.count_diff for d in diff),
+            sum(d.size_diff for d in diff) / 1024)
+
+
+def run(fixtures: str, port: int, repeat: int) -> dict:
+    os.environ["FRED_STANDIN_URL"] = f"http://127.0.0.1:{port}"
+    os.environ["FRED_STORE_DIR"]   = tempfile.mkdtemp(prefix="fred_store_")
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+    import streamlit as st
+    from data_fetcher import fred, offline, schedule
+    from sections import pages, warmup
+
+    st.plotly_chart = lambda *a, **k: None
+    panels  = warmup.all_panels()
+    renders = [r for sec in pages.PAGES.values() for p in sec.values() for r in p.renders]
+
+    server = offline.serve(fixtures, port=port)
+    out = {}
+    try:
+        fred.fetch_many(warmup.all_codes())
+        for shared in (False, True):
+            schedule.SHARED_PANELS = shared
+            st.cache_data.clear()
+            st.cache_resource.clear()
+            for render in renders:                   # build panels and figures
+                render()
+
+            rerun_panels = lambda: [panel() for panel in panels]
+            rerun_pages  = lambda: [render() for render in renders]
+            mode = "cache_resource" if shared else "cache_data"
+            out[mode] = {
+                "panels": (_timed(rerun_panels, repeat), *_allocations(rerun_panels)),
+                "pages" : (_timed(rerun_pages, repeat),  *_allocations(rerun_pages)),
+            }
+    finally:
+        server.shutdown()
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", help="directory recorded with FRED_RECORD_DIR")
+    parser.add_argument("--port", type=int, default=8770)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    result = run(args.fixtures, args.port, args.repeat)
+    print(f"{'mode':<16}{'rerun':<8}{'median_ms':>10}{'peak_kb':>10}{'blocks':>10}{'held_kb':>10}")
+    for mode, rows in result.items():
+        for what, (ms, peak, blocks, held) in rows.items():
+            print(f"{mode:<16}{what:<8}{ms:>10.2f}{peak:>10.0f}{blocks:>10}{held:>10.0f}")
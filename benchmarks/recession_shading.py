@@ -0,0 +1,78 @@
+"""
+Recession-shading micro-benchmark against recorded fixtures.
+
+    python -m benchmarks.recession_shading fixtures --repeat 20
+
+Builds the same line figure over several x-windows with the recession bands
+added two ways and reports mean construction time and serialised JSON size:
+    vrect    one fig.add_vrect per recession period (previous approach)
+    shapes   sections.charts.add_recessions (shared, pre-validated shapes)
+"""
+import argparse
+import os
+import time
+
+WINDOWS = {                      # label → chart start, as used on the pages
+    "full history": "1950-01-01",
+    "since 1995"  : "1995-01-01",
+    "since 2020"  : "2020-01-01",
+}
+
+
+def _vrect(fig, periods):
+    for s, e in periods:
+        fig.add_vrect(x0=s, x1=e, fillcolor="grey",
+                      opacity=0.25, line_width=0, layer="below")
+
+
+def _time(build, repeat: int):
+    fig = build()                # warm-up; also primes the shapes cache
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fig = build()
+    return (time.perf_counter() - t0) / repeat, len(fig.to_json().encode())
+
+
+def run(fixtures: str, port: int, repeat: int) -> list:
+    os.environ["FRED_STANDIN_URL"] = f"http://127.0.0.1:{port}"
+    os.environ.pop("FRED_RECORD_DIR", None)
+
+    import plotly.graph_objects as go
+    from data_fetcher import offline
+    from data_fetcher.fred import _fred_series
+    from data_fetcher.recessions import recession_periods
+    from sections.charts import add_recessions
+
+    server = offline.serve(fixtures, port=port)
+    try:
+        line = _fred_series("UNRATE")["UNRATE"]
+        rows = []
+        for label, start in WINDOWS.items():
+            y = line.loc[start:]
+            periods = recession_periods(y.index.min(), y.index.max())
+
+            def build(add):
+                fig = go.Figure()
+                fig.add_scatter(x=y.index, y=y, mode="lines")
+                add(fig, periods)
+                fig.update_layout(height=390, template="simple_white")
+                return fig
+
+            for method, add in (("vrect", _vrect), ("shapes", add_recessions)):
+                secs, size = _time(lambda: build(add), repeat)
+                rows.append((label, len(periods), method, secs * 1000, size))
+    finally:
+        server.shutdown()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", help="directory recorded with FRED_RECORD_DIR")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'window':<14}{'periods':>8}{'method':>8}{'build_ms':>10}{'json_bytes':>12}")
+    for label, n, method, ms, size in run(args.fixtures, args.port, args.repeat):
+        print(f"{label:<14}{n:>8}{method:>8}{ms:>10.2f}{size:>12}")
@@ -0,0 +1,109 @@
+"""
+Shared series store benchmark: memory per host as Streamlit workers are added.
+
+    python -m benchmarks.shared_store fixtures --workers 1 2 4 8
+
+Fills one series store from the offline stand-in (this process is its
+writer), then for each worker count starts that many processes which, like
+a fresh Streamlit worker, read every series the pages need into fred's
+cache, one at a time. Two modes:
+    private   each worker holds its own copy of every series, as it did
+              when the store was read into process memory
+    mapped    workers keep the store's memory-mapped pages (the default)
+Per run: downloads made by the workers (0 = they started warm), their
+median time to load every series, and the memory the series add to the
+host, summed over workers from /proc/<pid>/smaps_rollup (Pss counts a
+page shared by n processes as 1/n in each). Linux only.
+"""
+import argparse
+import ctypes
+import gc
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+
+
+def _pss_kb() -> int:
+    gc.collect()
+    ctypes.CDLL(None).malloc_trim(0)      # freed heap back to the OS (glibc)
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _worker(private: bool, ready, go, out) -> None:
+    from data_fetcher import fred
+    from data_fetcher.store import SeriesStore
+    from sections import warmup
+
+    if private:
+        fred._STORE.read = lambda code: SeriesStore.read(fred._STORE, code).copy(deep=True)
+    downloads = []
+    download  = fred._download
+    fred._download = lambda *args: downloads.append(1) or download(*args)
+
+    codes = warmup.all_codes()
+    fred._fred_series(codes[0])  # imports a first read pulls in
+    fred._CACHE.discard(lambda key: True)
+    base  = _pss_kb()
+    t0    = time.perf_counter()
+    for code in codes:           # one at a time, as the panels read them
+        fred._fred_series(code)
+    seconds = time.perf_counter() - t0
+    ready.put(None)
+    go.wait()                    # measure once every worker holds its series
+    out.put((len(downloads), seconds, _pss_kb() - base))
+    go.wait()
+
+
+def _run(workers: int, private: bool) -> tuple:
+    ctx   = multiprocessing.get_context("spawn")
+    ready, out = ctx.Queue(), ctx.Queue()
+    go    = ctx.Barrier(workers + 1)
+    procs = [ctx.Process(target=_worker, args=(private, ready, go, out)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    for _ in procs:
+        ready.get()
+    go.wait()
+    rows = [out.get() for _ in procs]
+    go.wait()
+    for p in procs:
+        p.join()
+    return (sum(r[0] for r in rows), statistics.median(r[1] for r in rows) * 1000,
+            sum(r[2] for r in rows))
+
+
+def run(fixtures: str, port: int, workers: list) -> dict:
+    os.environ["FRED_STANDIN_URL"] = f"http://127.0.0.1:{port}"
+    os.environ["FRED_STORE_DIR"]   = tempfile.mkdtemp(prefix="fred_store_")
+    os.environ["FRED_STORE_ROLE"]  = "auto"
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+    from data_fetcher import fred, offline
+    from sections import warmup
+
+    server = offline.serve(fixtures, port=port)
+    try:
+        fred.fetch_many(warmup.all_codes())          # writer fills the store
+        return {(mode, n): _run(n, mode == "private")
+                for mode in ("private", "mapped") for n in workers}
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", help="directory recorded with FRED_RECORD_DIR")
+    parser.add_argument("--port", type=int, default=8771)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    result = run(args.fixtures, args.port, args.workers)
+    print(f"{'mode':<10}{'workers':>8}{'downloads':>10}{'load_ms':>10}{'host_kb':>10}{'per_worker':>11}")
+    for (mode, n), (downloads, ms, kb) in result.items():
+        print(f"{mode:<10}{n:>8}{downloads:>10}{ms:>10.1f}{kb:>10}{kb / n:>11.0f}")
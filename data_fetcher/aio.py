@@ -0,0 +1,107 @@
+"""
+Asyncio front end of data_fetcher.fred, on one event loop thread per process.
+
+    fut = aio.submit(aio.fetch_many(["PAYEMS", "UNRATE"]))   # returns at once
+    ...                                                      # draw placeholders
+    df  = fut.result()                                       # concurrent.futures.Future
+
+The coroutines mirror fred's fetch_many / get_* API. Each series is its own
+task, so callers can start every download a page needs up front and use
+whichever finishes first. The blocking HTTP calls themselves run on a
+pool of FRED_MAX_WORKERS threads of their own, not fred's, so a page's
+queued downloads never hold up the synchronous panel builders reading
+series that are already in; both share fred's cache (a series in flight is
+downloaded once), store, retries and circuit breaker. A caller's trace
+follows its coroutines into the pool.
+"""
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from data_fetcher import fred
+
+_loop = None
+_lock = threading.Lock()
+_POOL = ThreadPoolExecutor(max_workers=fred.MAX_WORKERS, thread_name_prefix="fred-aio")
+
+
+def loop() -> asyncio.AbstractEventLoop:
+    """The shared event loop, started on a daemon thread on first use."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="fred-aio", daemon=True).start()
+    return _loop
+
+
+def submit(coro) -> concurrent.futures.Future:
+    """
+    Schedule `coro` on the shared loop from any thread and return a
+    concurrent.futures.Future for its result. Unlike
+    asyncio.run_coroutine_threadsafe, the task runs in a copy of the
+    caller's context (so trace spans land in the caller's trace).
+    """
+    future = concurrent.futures.Future()
+
+    def settle(task):
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    def start():
+        if future.set_running_or_notify_cancel():
+            asyncio.ensure_future(coro).add_done_callback(settle)
+        else:
+            coro.close()
+
+    loop().call_soon_threadsafe(start, context=contextvars.copy_context())
+    return future
+
+
+async def _call(fn, *args, **kwargs):
+    """fn(*args, **kwargs) on the download pool, in this task's context."""
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_POOL, call)
+
+
+async def fred_series(code: str, start: str=None, end: str=None, name: str=None) -> pd.DataFrame:
+    """Async fred._fred_series."""
+    return await _call(fred._fred_series, code, start, end, name)
+
+
+async def fetch_many(codes, start: str=None, end: str=None) -> pd.DataFrame:
+    """Async fred.fetch_many: every series downloads as its own task."""
+    labelled = codes if isinstance(codes, dict) else {c: c for c in codes}
+    frames = await asyncio.gather(*(
+        fred_series(code, start, end, lbl) for lbl, code in labelled.items()
+    ))
+    return pd.concat(frames, axis=1)
+
+
+def _mirror(getter, *codes):
+    """
+    Async version of a fred.get_* helper: its series download concurrently,
+    then the (cheap) getter runs against the warm cache.
+    """
+    @functools.wraps(getter)
+    async def get(start: str=None, end: str=None, **kwargs):
+        await asyncio.gather(*(fred_series(c, start, end) for c in codes))
+        return await _call(getter, start, end, **kwargs)
+    return get
+
+
+get_employment_growth        = _mirror(fred.get_employment_growth, "PAYEMS")
+get_unemployment_rate        = _mirror(fred.get_unemployment_rate, "UNRATE")
+get_initial_claims           = _mirror(fred.get_initial_claims, "ICSA")
+get_continued_claims         = _mirror(fred.get_continued_claims, "CCSA")
+get_labour_market_conditions = _mirror(fred.get_labour_market_conditions, "FRBKCLMCILA")
+get_job_opening_per_person   = _mirror(fred.get_job_opening_per_person, "JTSJOL", "UNEMPLOY")
+get_labor_supply_demand      = _mirror(fred.get_labor_supply_demand, "JTSJOL", "PAYEMS", "CLF16OV")
+get_labor_balance            = _mirror(fred.get_labor_balance, "JTSJOL", "PAYEMS", "CLF16OV")
@@ -0,0 +1,69 @@
+import threading
+import time
+
+
+class CircuitOpen(ConnectionError):
+    """Raised instead of calling out while the breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing remote after repeated errors.
+      • closed    calls go through; `threshold` consecutive failures open it
+      • open      calls fail at once with CircuitOpen for `cooldown` seconds
+      • half-open after the cooldown a single trial call goes through;
+                  success closes the breaker, failure opens it again
+    Safe to share between threads.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 60):
+        self.threshold = threshold
+        self.cooldown  = cooldown
+        self._failures  = 0
+        self._opened_at = None           # monotonic time the breaker opened
+        self._trial     = False          # a half-open trial call is running
+        self._lock      = threading.Lock()
+        self.trips = self.rejected = 0
+
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.cooldown:
+            return "open"
+        return "half-open"
+
+    def call(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs) if the breaker lets it through."""
+        with self._lock:
+            state = self._state()
+            if state == "open" or (state == "half-open" and self._trial):
+                self.rejected += 1
+                raise CircuitOpen(f"circuit open after {self._failures} failures")
+            self._trial = state == "half-open"
+
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._trial = False
+                self._failures += 1
+                if self._opened_at is not None or self._failures >= self.threshold:
+                    if self._opened_at is None:
+                        self.trips += 1
+                    self._opened_at = time.monotonic()
+            raise
+
+        with self._lock:
+            self._trial     = False
+            self._failures  = 0
+            self._opened_at = None
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"state": self._state(), "failures": self._failures,
+                    "trips": self.trips, "rejected": self.rejected}
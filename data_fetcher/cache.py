@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class SeriesCache:
+    """
+    Process-wide memo for downloaded FRED frames.
+      • keyed on (code, start, end)
+      • entries expire after `ttl` seconds
+      • least-recently-used entries are evicted beyond `maxsize`
+      • concurrent misses on the same key share a single download
+    Safe to use from Streamlit's script threads and any worker threads.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl     = ttl
+        self._data     = OrderedDict()   # key -> (expires_at, value)
+        self._inflight = {}              # key -> threading.Event
+        self._lock     = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get_or_load(self, key, loader):
+        """Return the cached value for `key`, calling `loader()` on a miss."""
+        while True:
+            with self._lock:
+                entry = self._data.get(key)
+                if entry is not None:
+                    if entry[0] > time.monotonic():
+                        self._data.move_to_end(key)
+                        self.hits += 1
+                        return entry[1]
+                    del self._data[key]
+                    self.expirations += 1
+
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    self.misses += 1
+                    break
+            # another thread is already downloading this key – wait for it
+            event.wait()
+
+        try:
+            value = loader()
+        except BaseException:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+            raise
+
+        with self._lock:
+            self._put(key, value)
+            del self._inflight[key]
+        event.set()
+        return value
+
+    def _put(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, match):
+        """Drop every entry whose key satisfies `match(key)`."""
+        with self._lock:
+            for key in [k for k in self._data if match(k)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits"       : self.hits,
+                "misses"     : self.misses,
+                "evictions"  : self.evictions,
+                "expirations": self.expirations,
+                "size"       : len(self._data),
+                "maxsize"    : self.maxsize,
+                "ttl"        : self.ttl,
+            }
@@ -0,0 +1,127 @@
+"""
+Lean FRED client on one pooled keep-alive HTTP session.
+
+  • with FRED_API_KEY: the REST API (series/observations, JSON), asking only
+    for observations inside [start, end]
+  • without a key: the public fredgraph.csv download, limited to the same
+    window with its cosd / coed parameters
+Both are parsed straight into a float64 (or int64) array on a
+DatetimeIndex named DATE: the same frame, bit for bit, that
+pandas_datareader's FredReader returns. With a key, vintages() also reads
+ALFRED real-time periods (every published value of every observation).
+"""
+import os
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+API_KEY   = os.environ.get("FRED_API_KEY")
+API_URL   = "https://api.stlouisfed.org"
+GRAPH_URL = "https://fred.stlouisfed.org"
+
+
+class FredClient:
+    """
+    Thread-safe: every worker shares the session's connection pool, so
+    repeated downloads reuse open connections instead of new handshakes.
+    `base_url` points both endpoints at another host (the offline stand-in).
+    """
+
+    def __init__(self, api_key: str=None, base_url: str=None, pool_size: int=8):
+        self.api_key   = api_key
+        self.api_url   = base_url or API_URL
+        self.graph_url = base_url or GRAPH_URL
+        self.session   = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def series(self, code: str, start=None, end=None, timeout: float=None) -> pd.DataFrame:
+        """Observations of `code` within [start, end] as a one-column frame."""
+        start = pd.Timestamp(start) if start is not None else None
+        end   = pd.Timestamp(end)   if end   is not None else None
+        if self.api_key:
+            dates, values = self._observations(code, start, end, timeout)
+        else:
+            dates, values = self._graph_csv(code, start, end, timeout)
+        df = pd.DataFrame(
+            {code: _values(values)},
+            index=pd.to_datetime(dates, format="%Y-%m-%d").rename("DATE"),
+        )
+        return df.truncate(start, end)
+
+    @property
+    def has_vintages(self) -> bool:
+        """ALFRED real-time periods are only served by the REST API (or the stand-in)."""
+        return bool(self.api_key) or self.api_url != API_URL
+
+    def vintages(self, code: str, since=None, start=None, timeout: float=None) -> pd.DataFrame:
+        """
+        ALFRED real-time periods of `code` (output_type=1): one row per
+        observation value and the vintages it was current in, for vintages
+        from `since` and observations from `start` on. Columns, as int32
+        days since 1970-01-01: date, vintage_start, vintage_end (inclusive,
+        OPEN while current); value as float64.
+        """
+        params = {"series_id": code, "api_key": self.api_key or "", "file_type": "json",
+                  "output_type": 1, "limit": 100000, "offset": 0,
+                  "realtime_start": _day(since) if since is not None else "1776-07-04",
+                  "realtime_end": "9999-12-31"}
+        if start is not None:
+            params["observation_start"] = _day(start)
+        obs = []
+        while True:                                    # paged beyond `limit` rows
+            page = self._get(f"{self.api_url}/fred/series/observations", params, timeout).json()
+            obs += page["observations"]
+            if not page["observations"] or len(obs) >= page.get("count", len(obs)):
+                break
+            params["offset"] = len(obs)
+
+        days = lambda key: np.array([o[key] for o in obs], dtype="datetime64[D]").astype(np.int32)
+        return pd.DataFrame({
+            "date"         : days("date"),
+            "value"        : _values([o["value"] for o in obs]).astype(np.float64),
+            "vintage_start": days("realtime_start"),
+            "vintage_end"  : days("realtime_end"),
+        })
+
+    def _get(self, url: str, params: dict, timeout: float):
+        resp = self.session.get(url, params=params, timeout=timeout)
+        resp.raise_for_status()
+        return resp
+
+    def _observations(self, code, start, end, timeout):
+        params = {"series_id": code, "api_key": self.api_key, "file_type": "json"}
+        if start is not None:
+            params["observation_start"] = start.strftime("%Y-%m-%d")
+        if end is not None:
+            params["observation_end"] = end.strftime("%Y-%m-%d")
+        obs = self._get(f"{self.api_url}/fred/series/observations", params, timeout).json()["observations"]
+        return [o["date"] for o in obs], [o["value"] for o in obs]
+
+    def _graph_csv(self, code, start, end, timeout):
+        params = {"id": code}
+        if start is not None:
+            params["cosd"] = start.strftime("%Y-%m-%d")
+        if end is not None:
+            params["coed"] = end.strftime("%Y-%m-%d")
+        lines = self._get(f"{self.graph_url}/graph/fredgraph.csv", params, timeout).text.split()[1:]
+        return [line[:10] for line in lines], [line[11:] for line in lines]   # YYYY-MM-DD,value
+
+
+OPEN = int(np.datetime64("9999-12-31", "D").astype(np.int32))   # vintage_end of current values
+
+
+def _day(ts) -> str:
+    return pd.Timestamp(ts).strftime("%Y-%m-%d")
+
+
+def _values(values: list) -> np.ndarray:
+    """
+    FRED value strings → array, with the same conversion read_csv applies:
+    "." marks a missing value, and a column of whole numbers with nothing
+    missing stays int64.
+    """
+    v = np.array([np.nan if x == "." else x for x in values], dtype=object)
+    return pd.to_numeric(v) if len(v) else v.astype(np.float64)
@@ -0,0 +1,57 @@
+"""
+Opt-in compact form of cached panels (DASHBOARD_COMPACT=1).
+
+st.cache_data keeps every panel pickled and hands each run its own unpickled
+copy, once per Streamlit worker process. In compact mode a panel is shrunk
+before it is cached:
+  • float64 columns → float32 (7 significant digits; charts show at most 4)
+  • the recession flag (USREC) → bool
+  • frames of one panel with the same dates share one DatetimeIndex object,
+    which pickle then stores, and unpickling rebuilds, only once
+Derived values (diffs, % changes) are computed in float64 by the builders
+before this step, so only the stored results lose precision.
+"""
+import os
+import numpy as np
+import pandas as pd
+from data_fetcher.registry import RECESS
+
+ENABLED = os.environ.get("DASHBOARD_COMPACT") == "1"
+
+
+def _column(s: pd.Series) -> pd.Series:
+    if s.name == RECESS:
+        return s.fillna(0).astype(bool)
+    if s.dtype == np.float64:
+        return s.astype(np.float32)
+    return s
+
+
+def _shared(index: pd.Index, seen: list) -> pd.Index:
+    for other in seen:
+        if other is index or (len(other) == len(index) and other.equals(index)):
+            return other
+    seen.append(index)
+    return index
+
+
+def compact(obj, _seen: list=None):
+    """
+    Compact copy of a panel builder's result: a frame, a series, or a tuple,
+    list or dict of them (anything else is returned as is).
+    """
+    seen = [] if _seen is None else _seen
+    if isinstance(obj, pd.DataFrame):
+        out = pd.DataFrame({c: _column(obj[c]) for c in obj.columns}, index=obj.index)
+        out.columns = obj.columns
+        out.index = _shared(obj.index, seen)
+        return out
+    if isinstance(obj, pd.Series):
+        out = _column(obj)
+        out.index = _shared(obj.index, seen)
+        return out
+    if isinstance(obj, (tuple, list)):
+        return type(obj)(compact(v, seen) for v in obj)
+    if isinstance(obj, dict):
+        return {k: compact(v, seen) for k, v in obj.items()}
+    return obj
@@ -1,29 +1,475 @@
-import pandas_datareader.data as web
+import logging
+import os
+import random
+import threading
+import time
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from data_fetcher.breaker import CircuitBreaker, CircuitOpen
+from data_fetcher.cache import SeriesCache
+from data_fetcher.client import API_KEY, FredClient
+from data_fetcher.store import COPY_ON_WRITE, SeriesStore
+from data_fetcher.vintages import VintageStore
+from data_fetcher import offline, registry, schedule, trace, vintages as alfred
 
 DEFAULT_START = "1950-01-01"
 
+# One cache per server process, shared by every section and session.
+# FRED_CACHE_TTL (seconds) is how long a frame is held in memory before the
+# store is consulted again; FRED_CACHE_SIZE bounds entries.
+_CACHE = SeriesCache(
+    maxsize=int(os.environ.get("FRED_CACHE_SIZE", 256)),
+    ttl=float(os.environ.get("FRED_CACHE_TTL", 3600)),
+)
+
+
+# On-disk copy of every series, refreshed incrementally.
+# FRED_STORE_DIR moves it; FRED_REVISION_LOOKBACK (days) is how much of the
+# stored tail is re-downloaded to pick up revisions on each refresh.
+# Processes pointed at one store share it: one of them (the first to claim
+# it, or the one started with FRED_STORE_ROLE=writer) downloads and writes,
+# the others (FRED_STORE_ROLE=reader, or auto while another process writes)
+# map what it wrote and never refresh themselves.
+_STORE = SeriesStore(
+    os.environ.get("FRED_STORE_DIR", Path(__file__).resolve().parent.parent / ".fred_store"),
+    role=os.environ.get("FRED_STORE_ROLE", "auto"),
+)
+_VINTAGES = VintageStore(_STORE.root)
+REVISION_LOOKBACK = timedelta(days=int(os.environ.get("FRED_REVISION_LOOKBACK", 365)))
+
+# Failure handling for every download:
+#   FRED_TIMEOUT       seconds before a single request is abandoned
+#   FRED_RETRIES       retries after a failed request, with exponential
+#                      backoff from FRED_BACKOFF seconds (full jitter)
+#   FRED_BREAKER_FAILURES consecutive failures that stop all requests to
+#                      FRED for FRED_BREAKER_COOLDOWN seconds
+#   FRED_STALE_RETRY   seconds a series served stale is kept in the cache
+#                      before its download is tried again
+# Once a download has failed, the stored copy is served instead and the
+# series is flagged as stale until a later download succeeds.
+TIMEOUT = float(os.environ.get("FRED_TIMEOUT", 10))
+RETRIES = int(os.environ.get("FRED_RETRIES", 2))
+BACKOFF = float(os.environ.get("FRED_BACKOFF", 0.5))
+_BREAKER = CircuitBreaker(
+    threshold=int(os.environ.get("FRED_BREAKER_FAILURES", 5)),
+    cooldown=float(os.environ.get("FRED_BREAKER_COOLDOWN", 60)),
+)
+STALE_RETRY = float(os.environ.get("FRED_STALE_RETRY", 30))
+_stale = {}                      # code → last successful fetch of the copy served
+_retry = {}                      # code → time.monotonic() of its next download attempt
+
+log = logging.getLogger(__name__)
+
+
+def _request(code: str, start, end) -> pd.DataFrame:
+    """Single network call for one series (live FRED or the offline stand-in)."""
+    return _CLIENT.series(code, start, end, timeout=TIMEOUT)
+
+
+def _retrying(fn, *args):
+    """fn(*args) through the circuit breaker, retried with backoff on errors."""
+    for attempt in range(RETRIES + 1):
+        try:
+            return _BREAKER.call(fn, *args)
+        except CircuitOpen:
+            raise
+        except Exception:
+            if attempt == RETRIES:
+                raise
+            time.sleep(random.uniform(0, BACKOFF * 2 ** attempt))
+
+
+def _download(code: str, start, end) -> pd.DataFrame:
+    """_request with retries, traced and recorded."""
+    with trace.span(code, "download") as event:
+        df = _retrying(_request, code, start, end)
+        if event:
+            event["rows"]  = len(df)
+            event["bytes"] = len(df.to_csv(na_rep=".").encode())   # ≈ CSV payload
+    if offline.RECORD_DIR:
+        offline.record_series(code, df)
+    return df
+
+
+def _load(code: str, start: str, end: str) -> pd.DataFrame:
+    """
+    Cache-miss path of _fred_series:
+      • stored copy not due for a refresh (see schedule.is_due) → disk read
+      • due → download the tail since the last observation (minus
+        REVISION_LOOKBACK) and merge it in
+      • nothing stored, or stored history starts too late → full download
+      • download failed → the stored copy, if any, flagged as stale
+    Only the store's writer refreshes or writes (see SeriesStore.writable);
+    other processes serve the stored copy as is, and download into memory
+    only what is not stored yet.
+    """
+    meta   = _STORE.meta(code)
+    writer = _STORE.writable()
+    try:
+        if meta is None or meta["start"] > pd.Timestamp(start):
+            df = _download(code, start, datetime.now().strftime("%Y-%m-%d"))
+            if writer:
+                _STORE.write(code, df, start)
+                df = _STORE.read(code)      # serve the mapped copy, not ours
+            _stale.pop(code, None)
+            return df.loc[start:end]
+
+        stored = _STORE.read(code)
+        if not writer or not schedule.is_due(code, meta):
+            return stored.loc[start:end]
+
+        now  = datetime.now()
+        tail_start = meta["last_obs"] - REVISION_LOOKBACK
+        tail = _download(code, tail_start, now.strftime("%Y-%m-%d"))
+    except Exception as exc:
+        if meta is None:
+            raise
+        if code not in _stale:
+            log.warning("FRED download of %s failed, serving stored copy: %s", code, exc)
+        _stale[code] = meta["last_fetch"]
+        _retry[code] = time.monotonic() + STALE_RETRY
+        return _STORE.read(code).loc[start:end]
+
+    df = pd.concat([stored.loc[stored.index < tail_start], tail])
+    _STORE.write(code, df, meta["start"], fetched_at=now)
+    _stale.pop(code, None)
+    return _STORE.read(code).loc[start:end]
+
+
+def _load_vintages(code: str) -> pd.DataFrame:
+    """
+    Cache-miss path of vintages(): like _load, but over ALFRED real-time
+    periods. The first download covers the observations the panels read
+    them for (registry.vintage_window); a refresh asks only for vintages
+    since the last fetch and observations within REVISION_LOOKBACK of the
+    last one, and merges them in, so it costs what was revised rather than
+    the whole history again. A failed download flags "<code> vintages" as
+    stale, with no fetch time if nothing is stored.
+    """
+    rows, meta = _VINTAGES.read(code)
+    if rows is not None and (not _STORE.writable() or not schedule.is_due(code, meta)):
+        return rows
+
+    now = datetime.now()
+    with trace.span(code, "download") as event:
+        try:
+            if rows is None:
+                fetched = rows = _retrying(_CLIENT.vintages, code, None,
+                                           registry.vintage_window(code), TIMEOUT)
+            else:
+                since   = meta["last_fetch"].date()
+                start   = meta["last_obs"] - REVISION_LOOKBACK
+                fetched = _retrying(_CLIENT.vintages, code, since, start, TIMEOUT)
+                rows    = alfred.merge(rows, fetched, since, start)
+            event["rows"] = len(fetched)
+        except Exception as exc:
+            key = f"{code} vintages"
+            if key not in _stale:
+                log.warning("ALFRED download of %s failed, %s: %s", code,
+                            "no stored vintages" if rows is None else "serving stored vintages", exc)
+            _stale[key] = meta and meta["last_fetch"]
+            _retry[key] = time.monotonic() + STALE_RETRY
+            if rows is None:
+                raise
+            return rows
+    _stale.pop(f"{code} vintages", None)
+    if not _STORE.writable():
+        return rows
+    _VINTAGES.write(code, rows, fetched_at=now)
+    if offline.RECORD_DIR:
+        offline.record_vintages(code, rows)
+    return rows
+
+
+def vintages(code: str) -> pd.DataFrame:
+    """
+    Every value ever published for `code` with the vintages it was current
+    in (see data_fetcher.vintages). Needs FRED_API_KEY (or the stand-in).
+    """
+    if not _CLIENT.has_vintages:
+        raise RuntimeError("ALFRED vintages need FRED_API_KEY")
+    key = f"{code} vintages"
+    if key in _stale:
+        if time.monotonic() >= _retry.get(key, 0):
+            _CACHE.discard(lambda k: k == (code, "vintages"))          # try ALFRED again
+        elif _stale[key] is None:
+            raise RuntimeError(f"ALFRED vintages of {code} unavailable")
+    return _CACHE.get_or_load((code, "vintages"), lambda: _load_vintages(code))
+
+
+def vintage_version(codes) -> tuple:
+    """
+    (code, digest) of the stored vintages of every code, like data_version;
+    those not stored yet are loaded first (concurrently) and keep a None
+    digest if that fails. Empty without ALFRED vintages.
+    """
+    if not _CLIENT.has_vintages:
+        return ()
+    codes   = list(dict.fromkeys(codes))
+    missing = [c for c in codes if _VINTAGES.meta(c) is None]
+    for future in [trace.submit(_POOL, vintages, c) for c in missing]:
+        try:
+            future.result()
+        except Exception:
+            pass                  # flagged stale; the panel is built uncached
+    metas = {c: _VINTAGES.meta(c) for c in codes}
+    return tuple((c, m and m["digest"]) for c, m in metas.items())
+
+
+def series_as_of(code: str, when, name: str=None) -> pd.DataFrame:
+    """`code` as it was published on `when`, shaped like _fred_series."""
+    return alfred.as_of(vintages(code), when).to_frame(name or code)
+
+
 # Reusable Wrapper to pull FRED Data
 def _fred_series(code: str, start: str=None, end: str=None, name: str=None) -> pd.DataFrame:
-    start = start or DEFAULT_START
+    start = start or registry.window(code) or DEFAULT_START
     end   = end   or datetime.now().strftime("%Y-%m-%d")
-    df    = web.DataReader(code, "fred", start, end)
+    with trace.span(code, "series") as event:
+        if code in _stale and time.monotonic() >= _retry.get(code, 0):
+            _CACHE.discard(lambda key: key == (code, start, end))    # try FRED again
+        missed = []
+        df = _CACHE.get_or_load(
+            (code, start, end), lambda: missed.append(1) or _load(code, start, end)
+        )
+        # callers rename / add columns in place; with copy-on-write a
+        # shallow copy keeps those changes off the cached (mapped) frame
+        df = df.copy(deep=not COPY_ON_WRITE)
+        event["cache"] = "stale" if code in _stale else "miss" if missed else "hit"
+        event["rows"]  = len(df)
+    if name:
+        df.columns = [name]
+    return df
+
+
+def _load_moving_average(code: str, weeks: int, meta: dict) -> pd.DataFrame:
+    """
+    Cache-miss path of moving_average(). The average is stored next to the
+    series as "<code>.MA<weeks>", stamped with the digest of the stored
+    series it was computed from (`meta`, read before the series itself, so
+    a copy rewritten in between is only ever stamped as older). After a
+    refresh only the rows a refresh can change (REVISION_LOOKBACK before
+    the last stored one, plus `weeks` - 1 rows of warm-up) are averaged again.
+    """
+    key    = f"{code}.MA{weeks}"
+    stored = _STORE.meta(key)
+    if stored is not None and stored["source"] == meta["digest"]:
+        return _STORE.read(key)
+
+    raw = _STORE.read(code)
+
+    if stored is None or stored["start"] > meta["start"]:
+        df = raw.rolling(weeks).mean()
+    else:
+        since = stored["last_obs"] - REVISION_LOOKBACK
+        pos   = raw.index.searchsorted(since)
+        warm  = max(pos - weeks + 1, 0)
+        tail  = raw.iloc[warm:].rolling(weeks).mean().iloc[pos - warm:]
+        prev  = _STORE.read(key)
+        df    = pd.concat([prev.loc[prev.index < since], tail])
+    if not _STORE.writable():
+        return df
+    _STORE.write(key, df, meta["start"], fetched_at=meta["last_fetch"], source=meta["digest"])
+    return _STORE.read(key)
+
+
+def moving_average(code: str, weeks: int=4, start: str=None, end: str=None,
+                   name: str=None) -> pd.DataFrame:
+    """
+    Trailing `weeks`-observation mean of `code`, computed here from the
+    series itself rather than downloaded as a separate FRED series (e.g.
+    IC4WSA is the 4-week mean of ICSA). Shaped like _fred_series.
+    """
+    raw  = _fred_series(code)
+    meta = _STORE.meta(code)
+    with trace.span(f"{code}.MA{weeks}", "series") as event:
+        if meta is None:           # never stored: nothing to keep incremental
+            df = raw.rolling(weeks).mean()
+        else:
+            missed = []
+            df = _CACHE.get_or_load(
+                (code, f"MA{weeks}", meta["digest"]),
+                lambda: missed.append(1) or _load_moving_average(code, weeks, meta),
+            )
+            event["cache"] = "miss" if missed else "hit"
+        df = df.loc[start or registry.window(code) or DEFAULT_START:end].copy(deep=not COPY_ON_WRITE)
+        event["rows"] = len(df)
     if name:
         df.columns = [name]
     return df
 
 
-def get_employment_growth(start: str=None, end: str=None) -> pd.DataFrame:
+# Bounded pool shared by all sessions, so concurrent page loads cannot open
+# more than FRED_MAX_WORKERS connections to FRED at once; the client keeps
+# that many connections alive between downloads.
+MAX_WORKERS = int(os.environ.get("FRED_MAX_WORKERS", 8))
+_POOL   = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="fred")
+_CLIENT = FredClient(API_KEY, base_url=offline.STANDIN_URL or None, pool_size=MAX_WORKERS)
+
+
+def fetch_many(codes, start: str=None, end: str=None) -> pd.DataFrame:
+    """
+    Download several series concurrently and return them side by side.
+      • `codes` is either a list of FRED codes (columns keep the codes) or a
+        {label: code} dict like the SERIES* tables (columns use the labels)
+      • columns come back in the given order, outer-joined on date
+    """
+    labelled = codes if isinstance(codes, dict) else {c: c for c in codes}
+    futures  = [
+        trace.submit(_POOL, _fred_series, code, start, end, lbl)
+        for lbl, code in labelled.items()
+    ]
+    return pd.concat([f.result() for f in futures], axis=1)
+
+
+_prefetching = threading.Lock()
+
+
+def prefetch(codes) -> bool:
+    """
+    Warm the series cache for `codes` on a background thread.
+    Returns False (and does nothing) while an earlier prefetch is still running.
+    """
+    if not _prefetching.acquire(blocking=False):
+        return False
+
+    def run():
+        try:
+            fetch_many(list(dict.fromkeys(codes)))
+        except Exception:
+            pass                  # the foreground fetch will surface the error
+        finally:
+            _prefetching.release()
+
+    threading.Thread(target=run, name="fred-prefetch", daemon=True).start()
+    return True
+
+
+# Versions published by the warm-up worker once every panel for them is built.
+# While set, page runs read these instead of refreshing anything themselves.
+_published = None
+_live      = threading.local()
+_seen      = {}                  # code → digest of the stored copy last seen here
+
+
+def data_version(codes) -> tuple:
+    """
+    (code, digest) of the stored copy of every code, after refreshing those
+    the release schedule says may have a new observation out. Changes only
+    when the data itself changes, so it can key caches of derived panels.
+    Series another process has rewritten since this one last looked are
+    dropped from the series cache, so their next read maps the new copy.
+    """
+    codes = list(dict.fromkeys(codes))
+    published = _published
+    if published is not None and not getattr(_live, "on", False) \
+            and all(c in published for c in codes):
+        return tuple((c, published[c]) for c in codes)
+
+    metas = _STORE.metas(codes)
+    due   = set()
+    if _STORE.writable():
+        due = {c for c, m in metas.items() if m is not None and schedule.is_due(c, m)}
+    if due:
+        _CACHE.discard(lambda key: key[0] in due)
+        fetch_many(sorted(due))
+        metas = _STORE.metas(codes)
+    digests = {c: m and m["digest"] for c, m in metas.items()}
+    changed = {c for c, d in digests.items() if _seen.get(c) not in (None, d)}
+    if changed:
+        _CACHE.discard(lambda key: key[0] in changed)
+    _seen.update(digests)
+    return tuple(digests.items())
+
+
+@contextmanager
+def live_versions():
+    """Within the block, data_version on this thread ignores published versions."""
+    _live.on = True
+    try:
+        yield
+    finally:
+        _live.on = False
+
+
+def publish(versions) -> None:
+    """Swap in the versions page runs should read (see data_version)."""
+    global _published
+    _published = dict(versions)
+
+
+def cache_stats() -> dict:
+    """Hit / miss / eviction counters of the shared series cache."""
+    return _CACHE.stats()
+
+
+def store_role() -> str:
+    """"writer" if this process refreshes the series store, else "reader"."""
+    return "writer" if _STORE.writable() else "reader"
+
+
+def breaker_stats() -> dict:
+    """State and counters of the FRED circuit breaker."""
+    return _BREAKER.stats()
+
+
+def stale(codes) -> dict:
+    """
+    code → time of the last successful fetch, for codes (and "<code>
+    vintages") served stale; None where there was nothing stored to serve.
+    """
+    snapshot = dict(_stale)
+    return {key: snapshot[key] for c in dict.fromkeys(codes)
+            for key in (c, f"{c} vintages") if key in snapshot}
+
+
+def get_employment_growth(start: str=None, end: str=None, first_print: bool=False) -> pd.DataFrame:
     """
     Returns a DataFrame with:
       - 'Emp Growth': month-over-month diff in PAYEMS
       - '3M MA Emp Growth': 3-month rolling average
+      - 'First Print Emp Growth': the same diff as first published, if
+        `first_print` and ALFRED vintages are available (NaN otherwise)
     """
     df = _fred_series("PAYEMS", start, end, name="Payroll Level")
     df["Emp Growth"]       = df["Payroll Level"].diff()
     df["3M MA Emp Growth"] = df["Emp Growth"].rolling(3).mean()
-    return df[["Emp Growth", "3M MA Emp Growth"]]
+    if not first_print:
+        return df[["Emp Growth", "3M MA Emp Growth"]]
+
+    df["First Print Emp Growth"] = float("nan")
+    if _CLIENT.has_vintages:
+        try:
+            first = alfred.first_print_change(vintages("PAYEMS"))
+            df["First Print Emp Growth"] = first.reindex(df.index)
+        except Exception as exc:
+            log.warning("PAYEMS first print unavailable: %s", exc)
+    return df[["Emp Growth", "3M MA Emp Growth", "First Print Emp Growth"]]
+
+
+def get_first_prints(codes, start: str=None, end: str=None) -> pd.DataFrame:
+    """
+    Change over the previous observation of each code as first published
+    (see vintages.first_print_change), side by side like fetch_many; the
+    codes' vintages load concurrently. Empty without ALFRED vintages; a code
+    whose vintages cannot be loaded is all NaN (and flagged stale).
+    """
+    labelled = codes if isinstance(codes, dict) else {c: c for c in codes}
+    if not _CLIENT.has_vintages:
+        return pd.DataFrame(columns=list(labelled))
+    futures = {lbl: trace.submit(_POOL, vintages, code) for lbl, code in labelled.items()}
+    first   = {}
+    for lbl, future in futures.items():
+        try:
+            first[lbl] = alfred.first_print_change(future.result())
+        except Exception:
+            pass                  # logged and flagged stale by _load_vintages
+    if not first:
+        return pd.DataFrame(columns=list(labelled))
+    return pd.concat(first, axis=1).reindex(columns=list(labelled)).loc[start:end]
 
 
 def get_unemployment_rate(start: str=None, end: str=None) -> pd.DataFrame:
@@ -33,23 +479,23 @@ def get_unemployment_rate(start: str=None, end: str=None) -> pd.DataFrame:
     return _fred_series("UNRATE", start, end, name="Unemployment Rate")
 
 
-def get_initial_claims(start: str=None, end: str=None) -> pd.DataFrame:
+def get_initial_claims(start: str=None, end: str=None, weeks: int=4) -> pd.DataFrame:
     """
-    Returns a DataFrame with 'Initial Claims' (ICSA) and 4-week moving average (IC4WSA).
+    Returns a DataFrame with 'Initial Claims' (ICSA) and its `weeks`-week
+    moving average ('4 Week Moving Average' by default, as FRED's IC4WSA).
     """
     df_init = _fred_series("ICSA", start, end, name="Initial Claims")
-    df_init_4wma = _fred_series("IC4WSA", start, end, name="4 Week Moving Average")  # FRED series for 4-week MA
-    df_init = df_init.join(df_init_4wma)  # Join the two dataframes by date
-    return df_init
+    return df_init.join(moving_average("ICSA", weeks, start, end,
+                                   name=f"{weeks} Week Moving Average"))
 
-def get_continued_claims(start: str=None, end: str=None) -> pd.DataFrame:
+def get_continued_claims(start: str=None, end: str=None, weeks: int=4) -> pd.DataFrame:
     """
-    Returns a DataFrame with 'Continued Claims' (CCSA) and 4-week moving average (CC4WSA).
+    Returns a DataFrame with 'Continued Claims' (CCSA) and its `weeks`-week
+    moving average ('4 Week Moving Average' by default, as FRED's CC4WSA).
     """
     df_cont = _fred_series("CCSA", start, end, name="Continued Claims")
-    df_cont_4wma = _fred_series("CC4WSA", start, end, name="4 Week Moving Average")  # FRED series for 4-week MA
-    df_cont = df_cont.join(df_cont_4wma)  # Join the two dataframes by date
-    return df_cont
+    return df_cont.join(moving_average("CCSA", weeks, start, end,
+                                   name=f"{weeks} Week Moving Average"))
 
 def get_labour_market_conditions(start: str=None, end: str=None) -> pd.DataFrame:
     """
@@ -0,0 +1,194 @@
+"""
+Record / replay support for running the dashboard without FRED.
+
+  FRED_RECORD_DIR=fixtures streamlit run Home.py
+      every series and CSV the app downloads is also written to fixtures/
+
+  python -m data_fetcher.offline serve fixtures --port 8765 --latency 0.15 --error-rate 0.02
+  FRED_STANDIN_URL=http://127.0.0.1:8765 streamlit run Home.py
+      all downloads are answered by the local stand-in instead of the internet
+
+Series fixtures use FRED's own fredgraph CSV layout (DATE,<code>; "." = missing),
+other CSVs (e.g. the SF Fed PCE files) are stored verbatim under frbsf/. The
+stand-in serves each series both as fredgraph.csv (cosd / coed) and through
+the REST API's series/observations JSON (observation_start / _end), including
+ALFRED real-time periods from <code>.vintages.csv when recorded.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import threading
+import time
+import pandas as pd
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+from urllib.request import urlopen
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STANDIN_URL = os.environ.get("FRED_STANDIN_URL", "").rstrip("/")
+RECORD_DIR  = os.environ.get("FRED_RECORD_DIR")
+
+_record_lock = threading.Lock()
+
+
+# ── client side ─────────────────────────────────────────────────────────
+# Series downloads go through data_fetcher.client pointed at STANDIN_URL.
+
+
+def record_series(code: str, df: pd.DataFrame) -> None:
+    """Merge a downloaded frame into RECORD_DIR/<code>.csv (newer rows win)."""
+    path = Path(RECORD_DIR) / f"{code}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _record_lock:
+        if path.exists():
+            old = pd.read_csv(path, index_col=0, parse_dates=True, na_values=".")
+            old.index.name, old.columns = "DATE", [code]
+            df = pd.concat([old.loc[~old.index.isin(df.index)], df]).sort_index()
+        tmp = path.with_suffix(".tmp")
+        df.to_csv(tmp, index_label="DATE", na_rep=".")
+        os.replace(tmp, path)
+
+
+def read_csv(url: str, **kwargs) -> pd.DataFrame:
+    """
+    pd.read_csv for non-FRED downloads: served by the stand-in when
+    FRED_STANDIN_URL is set, copied into RECORD_DIR when recording.
+    """
+    name = Path(urlparse(url).path).name
+    if STANDIN_URL:
+        url = f"{STANDIN_URL}/frbsf/{name}"
+    if not RECORD_DIR:
+        return pd.read_csv(url, **kwargs)
+
+    with urlopen(url) as resp:
+        raw = resp.read()
+    path = Path(RECORD_DIR) / "frbsf" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(raw)
+    return pd.read_csv(io.BytesIO(raw), **kwargs)
+
+
+# ── stand-in server ─────────────────────────────────────────────────────
+def _series_body(text: str, start, end, kind: str) -> str:
+    """A fixture CSV cut to [start, end], as fredgraph CSV or API JSON."""
+    header, *rows = text.split()
+    rows = [r for r in rows
+            if (start is None or r[:10] >= start) and (end is None or r[:10] <= end)]
+    if kind == "csv":
+        return "\n".join([header, *rows]) + "\n"
+    obs = [dict(zip(("date", "value"), r.split(",", 1))) for r in rows]
+    return json.dumps({"count": len(obs), "observations": obs})
+
+
+def _vintage_body(fixtures: Path, code: str, query: dict) -> str:
+    """
+    ALFRED real-time periods (output_type=1) from <code>.vintages.csv
+    (date,value,realtime_start,realtime_end), or from <code>.csv as a series
+    whose values were each published on their own date and never revised.
+    """
+    path = fixtures / f"{code}.vintages.csv"
+    if path.is_file():
+        rows = [r.split(",") for r in path.read_text().split()[1:]]
+    else:
+        rows = [[*r.split(",", 1), r[:10], "9999-12-31"]
+                for r in (fixtures / f"{code}.csv").read_text().split()[1:]]
+    lo, rs, re = (query.get("observation_start", ""), query.get("realtime_start", ""),
+                  query.get("realtime_end", "9999-12-31"))
+    obs = [{"date": d, "value": v, "realtime_start": max(s, rs), "realtime_end": min(e, re)}
+           for d, v, s, e in rows if d >= lo and e >= rs and s <= re]
+    offset, limit = int(query.get("offset", 0)), int(query.get("limit", 100000))
+    return json.dumps({"count": len(obs), "offset": offset, "limit": limit,
+                       "observations": obs[offset:offset + limit]})
+
+
+def record_vintages(code: str, rows: pd.DataFrame) -> None:
+    """Write the stored real-time periods of `code` to RECORD_DIR/<code>.vintages.csv."""
+    path = Path(RECORD_DIR) / f"{code}.vintages.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    day = lambda col: rows[col].to_numpy().astype("datetime64[D]").astype(str)
+    out = pd.DataFrame({"date": day("date"), "value": rows["value"],
+                        "realtime_start": day("vintage_start"), "realtime_end": day("vintage_end")})
+    with _record_lock:
+        tmp = path.with_suffix(".tmp")
+        out.to_csv(tmp, index=False, na_rep=".")
+        os.replace(tmp, path)
+
+
+def _handler(fixtures: Path, latency: float, jitter: float, error_rate: float):
+    class StandIn(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"          # keep-alive, like FRED
+        disable_nagle_algorithm = True         # headers and body go out as separate writes
+
+        def do_GET(self):
+            time.sleep(max(0.0, latency + random.uniform(-jitter, jitter)))
+            if random.random() < error_rate:
+                self.send_error(503, "injected failure")
+                return
+
+            url   = urlparse(self.path)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            if url.path == "/graph/fredgraph.csv":
+                path = fixtures / f"{query.get('id')}.csv"
+                window, kind = (query.get("cosd"), query.get("coed")), "csv"
+            elif url.path == "/fred/series/observations" and query.get("output_type") == "1":
+                path, kind = fixtures / f"{query.get('series_id')}.csv", "vintages"
+            elif url.path == "/fred/series/observations":
+                path = fixtures / f"{query.get('series_id')}.csv"
+                window, kind = (query.get("observation_start"), query.get("observation_end")), "json"
+            elif url.path.startswith("/frbsf/"):
+                path, kind = fixtures / "frbsf" / Path(url.path).name, "raw"
+            else:
+                path = None
+
+            if path is None or not path.is_file():
+                self.send_error(404, "no fixture")
+                return
+            if kind == "vintages":
+                body = _vintage_body(fixtures, path.stem, query).encode()
+            elif kind != "raw":
+                body = _series_body(path.read_text(), *window, kind).encode()
+            else:
+                body = path.read_bytes()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/csv" if kind in ("csv", "raw") else "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return StandIn
+
+
+def serve(fixtures, host: str="127.0.0.1", port: int=8765,
+          latency: float=0.0, jitter: float=0.0, error_rate: float=0.0) -> ThreadingHTTPServer:
+    """Start the stand-in on a daemon thread and return the server."""
+    server = ThreadingHTTPServer(
+        (host, port), _handler(Path(fixtures), latency, jitter, error_rate)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve recorded FRED fixtures over HTTP.")
+    sub    = parser.add_subparsers(dest="cmd", required=True)
+    p      = sub.add_parser("serve")
+    p.add_argument("fixtures", nargs="?", default=RECORD_DIR or "fixtures")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    p.add_argument("--jitter", type=float, default=0.0, help="± seconds of random latency")
+    p.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 503")
+    args = parser.parse_args()
+
+    server = serve(args.fixtures, args.host, args.port,
+                   args.latency, args.jitter, args.error_rate)
+    print(f"FRED stand-in serving {args.fixtures} on http://{args.host}:{args.port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,71 @@
+import threading
+import numpy as np
+import pandas as pd
+from data_fetcher.fred import _fred_series
+from data_fetcher.registry import RECESS     # NBER recession flag (monthly, 1 = recession)
+
+
+class RecessionIndex:
+    """
+    NBER recession periods as three aligned datetime64 arrays:
+        starts  first flagged observation
+        ends    last flagged observation
+        stops   first observation after the recession (exclusive end)
+    Window queries are two binary searches.
+    """
+
+    def __init__(self, flags: pd.Series):
+        dates = flags.index.values
+        rec   = flags.fillna(0).to_numpy() > 0
+        edges = np.diff(np.r_[0, rec.astype(np.int8), 0])
+        first = np.flatnonzero(edges == 1)
+        last  = np.flatnonzero(edges == -1) - 1
+
+        self.starts = dates[first]
+        self.ends   = dates[last]
+        after = np.minimum(last + 1, len(dates) - 1)
+        self.stops  = np.where(last + 1 < len(dates), dates[after],
+                               self.ends + np.timedelta64(31, "D"))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def periods(self, x0=None, x1=None, exclusive_end: bool=False) -> list:
+        """
+        (start, end) Timestamps of recessions intersecting [x0, x1], clipped
+        to the window. exclusive_end=True ends each period at the first
+        non-recession observation instead of the last recession one.
+        """
+        ends = self.stops if exclusive_end else self.ends
+        lo = 0 if x0 is None else np.searchsorted(ends, np.datetime64(pd.Timestamp(x0)), "left")
+        hi = len(self) if x1 is None else np.searchsorted(self.starts, np.datetime64(pd.Timestamp(x1)), "right")
+
+        out = []
+        for s, e in zip(self.starts[lo:hi], ends[lo:hi]):
+            s, e = pd.Timestamp(s), pd.Timestamp(e)
+            if x0 is not None:
+                s = max(s, pd.Timestamp(x0))
+            if x1 is not None:
+                e = min(e, pd.Timestamp(x1))
+            out.append((s, e))
+        return out
+
+
+_lock = threading.Lock()
+_memo = (None, None)             # (fingerprint of USREC data, RecessionIndex)
+
+
+def recession_index() -> RecessionIndex:
+    """The shared index, rebuilt only when the USREC data itself changes."""
+    global _memo
+    flags = _fred_series(RECESS)[RECESS]
+    key   = (len(flags), flags.index[-1], hash(flags.to_numpy().tobytes()))
+    with _lock:
+        if _memo[0] != key:
+            _memo = (key, RecessionIndex(flags))
+        return _memo[1]
+
+
+def recession_periods(x0=None, x1=None, exclusive_end: bool=False) -> list:
+    """Recession (start, end) pairs visible in a chart spanning [x0, x1]."""
+    return recession_index().periods(x0, x1, exclusive_end)
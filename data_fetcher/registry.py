@@ -0,0 +1,257 @@
+"""
+Every FRED series the dashboard reads, and which panels read it.
+
+    SERIES   code → Series(code, label, frequency, units, transforms)
+    PANELS   panel name → Panel(series={label: code}, joins=(code, ...),
+                                start=first date shown, starts={code: date},
+                                vintages={code: date})
+
+Panels take their {label: code} tables from here (table()) instead of owning
+them, so the fetch layer can enumerate and batch every code up front
+(all_codes(), codes()) and a refreshed code maps back to the panels built
+from it (consumers()). Panels that only ever show a recent window declare
+it, and each code is downloaded from the earliest date any of its panels
+needs (window()) rather than from the start of its history. Panels charting
+first prints or revisions also list the codes whose ALFRED vintages they
+read, and from when (vintage_window()).
+"""
+from typing import NamedTuple
+import pandas as pd
+from data_fetcher.transforms import lookback
+
+RECESS = "USREC"
+
+
+class Series(NamedTuple):
+    code      : str
+    label     : str                # default label; panels may relabel
+    frequency : str                # schedule.FREQUENCIES key
+    units     : str
+    transforms: tuple = ()         # computed for it in the shared price-index block
+
+
+class Panel(NamedTuple):
+    series: dict                   # label → code, in chart order
+    joins : tuple = ()             # codes read alongside, e.g. the recession flag
+    start : str = None             # first date the panel uses; None = full history
+    starts: dict = {}              # code → first date, where it differs from `start`
+    vintages: dict = {}            # code → first date its ALFRED vintages are read from
+
+
+_PRICE = ("YoY", "3M")
+
+_SERIES = [
+    # code                    label                          freq units
+    Series(RECESS,            "USREC",                        "M", "+1 or 0"),
+
+    # employment / general
+    Series("PAYEMS",          "Payroll Level",                "M", "Thous. of Persons"),
+    Series("UNRATE",          "Unemployment Rate",            "M", "Percent"),
+    Series("ICSA",            "Initial Claims",               "W", "Number"),
+    Series("CCSA",            "Continued Claims",             "W", "Number"),
+    Series("FRBKCLMCILA",     "LMCI",                         "M", "Index"),
+    Series("JTSJOL",          "Job Openings",                 "M", "Thousands"),
+    Series("UNEMPLOY",        "Unemployed",                   "M", "Thous. of Persons"),
+    Series("CLF16OV",         "Labor Supply",                 "M", "Thous. of Persons"),
+
+    # payrolls by sector
+    Series("USPRIV",          "Total Private",                "M", "Thous. of Persons"),
+    Series("USGOVT",          "Government",                   "M", "Thous. of Persons"),
+    Series("CES0800000001",   "Private Service-Providing",    "M", "Thous. of Persons"),
+    Series("USGOOD",          "Goods-Producing",              "M", "Thous. of Persons"),
+    Series("CES9091000001",   "Federal",                      "M", "Thous. of Persons"),
+    Series("CES9092000001",   "State Government",             "M", "Thous. of Persons"),
+    Series("CES9093000001",   "Local Government",             "M", "Thous. of Persons"),
+    Series("USTPU",           "TTU",                          "M", "Thous. of Persons"),
+    Series("USINFO",          "Information",                  "M", "Thous. of Persons"),
+    Series("USFIRE",          "Financial",                    "M", "Thous. of Persons"),
+    Series("USPBS",           "Business",                     "M", "Thous. of Persons"),
+    Series("USEHS",           "Private Edu. & Health",        "M", "Thous. of Persons"),
+    Series("USLAH",           "Leisure & Hosp.",              "M", "Thous. of Persons"),
+    Series("USSERV",          "Other",                        "M", "Thous. of Persons"),
+    Series("USMINE",          "Mining and Logging",           "M", "Thous. of Persons"),
+    Series("USCONS",          "Construction",                 "M", "Thous. of Persons"),
+    Series("MANEMP",          "Manufacturing",                "M", "Thous. of Persons"),
+
+    # average hourly earnings by sector
+    Series("CES0500000003",   "Total Private",                "M", "Dollars per Hour"),
+    Series("CES0600000003",   "Goods-Producing",              "M", "Dollars per Hour"),
+    Series("CES0800000003",   "Private Service-Providing",    "M", "Dollars per Hour"),
+    Series("CES4000000003",   "TTU",                          "M", "Dollars per Hour"),
+    Series("CES5000000003",   "Information",                  "M", "Dollars per Hour"),
+    Series("CES5500000003",   "Financial",                    "M", "Dollars per Hour"),
+    Series("CES6000000003",   "Business",                     "M", "Dollars per Hour"),
+    Series("CES6500000003",   "Private Edu. & Health",        "M", "Dollars per Hour"),
+    Series("CES7000000003",   "Leisure & Hosp.",              "M", "Dollars per Hour"),
+    Series("CES1000000003",   "Mining and Logging",           "M", "Dollars per Hour"),
+    Series("CES2000000003",   "Construction",                 "M", "Dollars per Hour"),
+    Series("CES3000000003",   "Manufacturing",                "M", "Dollars per Hour"),
+    Series("AHETPI",          "Non-supervisory",              "M", "Dollars per Hour"),
+    Series("ECIWAG",          "ECI Wages",                    "Q", "Index Dec 2005=100"),
+
+    # alternative labour measures
+    Series("LNS12300060",     "EPOP 25-54 Yrs",               "M", "Percent"),
+    Series("U1RATE",          "Unemployed ≥15wks (U-1)",      "M", "Percent"),
+    Series("CES3000000004",   "OT – Manufacturing",           "M", "Hours"),
+    Series("CES3200000004",   "OT – Nondurable Goods",        "M", "Hours"),
+    Series("LNS12032194",     "Part-Time Econ Reasons",       "M", "Thous. of Persons"),
+    Series("JTSQUL",          "Quits – Total",                "M", "Thousands"),
+    Series("JTS540099QUL",    "Professional and Business Services", "M", "Thousands"),
+    Series("JTS3000QUL",      "Manufacturing",                "M", "Thousands"),
+    Series("JTS7000QUL",      "Leisure and Hospitality",      "M", "Thousands"),
+    Series("JTS4400QUL",      "Retail Trade",                 "M", "Thousands"),
+
+    # price indexes (seasonally adjusted unless noted)
+    Series("CPIAUCSL",        "Headline CPI",                 "M", "Index 1982-1984=100", _PRICE),
+    Series("CPILFESL",        "Core CPI",                     "M", "Index 1982-1984=100", _PRICE),
+    Series("CPIUFDSL",        "Food CPI",                     "M", "Index 1982-1984=100", _PRICE),
+    Series("CPIENGSL",        "Energy CPI",                   "M", "Index 1982-1984=100", _PRICE),
+    Series("CUSR0000SEHA",    "Rent of Primary Residence",    "M", "Index 1982-1984=100", _PRICE),
+    Series("CUSR0000SEHC",    "OER",                          "M", "Index Dec 1982=100",  _PRICE),
+    Series("CUSR0000SAS",     "Services",                     "M", "Index 1982-1984=100", _PRICE),
+    Series("CUSR0000SASLE",   "Services less Energy Services", "M", "Index 1982-1984=100", _PRICE),
+    Series("CUSR0000SASL2RS", "Services less Rent of Shelter", "M", "Index Dec 1982=100", _PRICE),
+    Series("PPIACO",          "Headline PPI",                 "M", "Index 1982=100 (NSA)", _PRICE),
+    Series("PPICOR",          "Core PPI",                     "M", "Index 1982=100 (NSA)", _PRICE),
+    # not charted yet, so not in the shared block: overview.pce builds its own
+    Series("PCEPI",           "Headline PCE",                 "M", "Index 2017=100"),
+    Series("PCEPILFE",        "Core PCE",                     "M", "Index 2017=100"),
+
+    # alternative core measures and expectations
+    Series("PCETRIM12M159SFRBDAL",  "Trimmed Mean PCE",       "M", "Percent Chg. from Yr Ago"),
+    Series("TRMMEANCPIM158SFRBCLE", "16% Trimmed-Mean CPI",   "M", "Percent Chg. at Annual Rate"),
+    Series("MEDCPIM158SFRBCLE",     "Median CPI",             "M", "Percent Chg. at Annual Rate"),
+    Series("T5YIE",           "5Y Breakeven",                 "D", "Percent"),
+    Series("T5YIFR",          "5Y5Y Forwards",                "D", "Percent"),
+    Series("STLPPM",          "Prob > 2.5% Next Yr",          "M", "Probability"),
+    Series("MICH",            "UMich 1-Yr Exp",               "M", "Percent"),
+]
+
+SERIES = {s.code: s for s in _SERIES}
+
+
+def _table(*codes, **relabel) -> dict:
+    """{label: code} from the default labels; relabel maps code → label."""
+    return {relabel.get(c, SERIES[c].label): c for c in codes}
+
+
+_NFP = _table(
+    # headline splits
+    "USPRIV", "USGOVT", "CES0800000001", "USGOOD",
+    "CES9091000001", "CES9092000001", "CES9093000001",
+    # service sub-sectors
+    "USTPU", "USINFO", "USFIRE", "USPBS", "USEHS", "USLAH", "USSERV",
+    # goods sub-sectors
+    "USMINE", "USCONS", "MANEMP",
+)
+
+# Panel names are "<section module>[.<panel>]".
+PANELS = {
+    "employment": Panel(_table(
+        "PAYEMS", "UNRATE", "ICSA", "CCSA",
+        "FRBKCLMCILA", "JTSJOL", "UNEMPLOY", "CLF16OV",
+    ), joins=(RECESS,), starts={
+        # payrolls, unemployment and claims rank the latest value against
+        # their whole history; these only feed charts cut to a window
+        "FRBKCLMCILA": "1995-01-01", "JTSJOL": "2001-01-01",
+        "UNEMPLOY": "2005-01-01", "CLF16OV": "2001-01-01",
+    }, vintages={"PAYEMS": "2020-01-01"}),          # first-print payroll changes
+
+    "nfp": Panel(_NFP, joins=(RECESS,), start="2020-01-01",     # cumulative change since Jan 2020
+                 vintages=dict.fromkeys(_NFP.values(), "2020-01-01")),   # revisions by sector
+    "wages": Panel(_table(
+        "CES0500000003", "CES0600000003", "CES0800000003", "CPIAUCSL",
+        "CES4000000003", "CES5000000003", "CES5500000003", "CES6000000003",
+        "CES6500000003", "CES7000000003", "CES1000000003", "CES2000000003",
+        "CES3000000003", "AHETPI", "ECIWAG",
+        CPIAUCSL="CPI",
+    ), joins=(RECESS,), start="2020-01-01",          # % change since Jan 2020
+       starts={"ECIWAG": None}),                     # …but ECI YoY shows it all
+    "alternatives"       : Panel(_table("LNS12300060", "U1RATE"), joins=(RECESS,)),
+    "alternatives.ot_pt" : Panel(_table("CES3000000004", "CES3200000004", "LNS12032194"),
+                                 joins=(RECESS,)),
+    "alternatives.quits" : Panel(_table("JTSQUL", "JTS540099QUL", "JTS3000QUL",
+                                        "JTS7000QUL", "JTS4400QUL"), joins=(RECESS,)),
+
+    "overview.cpi"       : Panel(_table("CPIAUCSL", "CPILFESL"), joins=(RECESS,)),
+    "overview.ppi"       : Panel(_table("PPIACO", "PPICOR"), joins=(RECESS,)),
+    "overview.pce"       : Panel(_table("PCEPI", "PCEPILFE"), joins=(RECESS,)),
+    "overview.alt_core"  : Panel(_table("PCETRIM12M159SFRBDAL", "TRMMEANCPIM158SFRBCLE",
+                                        "MEDCPIM158SFRBCLE"), joins=(RECESS,)),
+    "overview.infl_exp"  : Panel(_table("T5YIE", "T5YIFR")),
+    "overview.prob_next_year"  : Panel(_table("STLPPM")),
+    "overview.umich_next_year" : Panel(_table("MICH")),
+
+    "cpi.components"     : Panel(_table("CPILFESL", "CPIUFDSL", "CPIENGSL"), joins=(RECESS,)),
+    "cpi.housing"        : Panel(_table("CUSR0000SEHA", "CUSR0000SEHC"), joins=(RECESS,)),
+    "cpi.services"       : Panel(_table("CUSR0000SAS", "CUSR0000SASLE", "CUSR0000SASL2RS"),
+                                 joins=(RECESS,)),
+
+    "recessions"         : Panel(_table(RECESS)),
+}
+
+
+def table(panel: str) -> dict:
+    """The {label: code} table of `panel`, as passed to fetch_many."""
+    return PANELS[panel].series
+
+
+def codes(*panels) -> list:
+    """Every code the given panels read (tables, then joins), without repeats."""
+    return list(dict.fromkeys(
+        code for name in panels
+        for code in (*PANELS[name].series.values(), *PANELS[name].joins)
+    ))
+
+
+def all_codes() -> list:
+    """Every code any panel reads."""
+    return codes(*PANELS)
+
+
+def consumers(code: str) -> list:
+    """Names of the panels that read `code`."""
+    return [name for name in PANELS if code in codes(name)]
+
+
+def with_transforms(transforms) -> list:
+    """Codes whose registered transforms include all of `transforms`."""
+    return [s.code for s in _SERIES if set(transforms) <= set(s.transforms)]
+
+
+def _window(code: str):
+    starts = [PANELS[name].starts.get(code, PANELS[name].start) for name in consumers(code)]
+    if not starts or None in starts:
+        return None
+    series = SERIES.get(code)
+    first  = min(pd.Timestamp(s) for s in starts) - lookback(series.transforms if series else ())
+    return first.strftime("%Y-%m-%d")
+
+
+_WINDOWS = {code: _window(code) for code in all_codes()}
+
+
+def window(code: str):
+    """
+    First date `code` is needed from: the union of the windows of every
+    panel reading it, less its transforms' warm-up (e.g. 12 months for YoY).
+    None when some panel uses its full history.
+    """
+    return _WINDOWS.get(code)
+
+
+def vintage_codes(panel: str) -> list:
+    """Codes whose ALFRED vintages `panel` reads."""
+    return list(PANELS[panel].vintages)
+
+
+def vintage_window(code: str):
+    """
+    First date the ALFRED vintages of `code` are needed from: the earliest
+    any panel reads them from. None when no panel declares them (or one
+    reads their full history).
+    """
+    starts = [p.vintages[code] for p in PANELS.values() if code in p.vintages]
+    if not starts or None in starts:
+        return None
+    return min(pd.Timestamp(s) for s in starts).strftime("%Y-%m-%d")
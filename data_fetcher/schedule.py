@@ -0,0 +1,178 @@
+import functools
+import os
+import pandas as pd
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from data_fetcher import compact, registry
+from data_fetcher.store import COPY_ON_WRITE
+
+# FRED publishes on US Eastern time; fall back to server time without tzdata.
+try:
+    _ET = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:
+    _ET = None
+
+# A stored series is refreshed when a new observation could have been
+# released since it was last fetched, and in any case after MAX_AGE (to pick
+# up revisions and anything the release rules below get wrong).
+MAX_AGE = timedelta(days=float(os.environ.get("FRED_MAX_AGE_DAYS", 7)))
+
+#        step   : next observation date after `last_obs`
+#        period : observation date → last day it covers
+#        lag    : earliest release after the end of the period (ET)
+#        poll   : re-check interval while a release is due but not yet out
+FREQUENCIES = {
+    "D": dict(step=pd.offsets.BDay(1),        period=pd.DateOffset(days=0),
+              lag=timedelta(hours=16),        poll=timedelta(hours=1)),
+    "W": dict(step=pd.DateOffset(days=7),     period=pd.DateOffset(days=0),
+              lag=timedelta(days=5, hours=8.5), poll=timedelta(minutes=15)),
+    "M": dict(step=pd.DateOffset(months=1),   period=pd.DateOffset(months=1, days=-1),
+              lag=timedelta(days=1, hours=8.5), poll=timedelta(hours=1)),
+    "Q": dict(step=pd.DateOffset(months=3),   period=pd.DateOffset(months=3, days=-1),
+              lag=timedelta(days=25),         poll=timedelta(hours=6)),
+    "A": dict(step=pd.DateOffset(years=1),    period=pd.DateOffset(years=1, days=-1),
+              lag=timedelta(days=30),         poll=timedelta(days=1)),
+}
+
+# Release lags that differ from their frequency's default, by code or code prefix.
+RELEASE_LAG = {
+    "CCSA"    : timedelta(days=12, hours=8.5),   # continued claims trail initial by a week
+    "CPI"     : timedelta(days=9, hours=8.5),    # CPI / core CPI around the 10th-15th
+    "CUSR"    : timedelta(days=9, hours=8.5),
+    "PPI"     : timedelta(days=10, hours=8.5),   # PPI the day after / around CPI
+    "PCEPI"   : timedelta(days=25, hours=8.5),   # personal income & outlays, month end
+    "PCEPILFE": timedelta(days=25, hours=8.5),
+    "JTS"     : timedelta(days=33, hours=10),    # JOLTS, about five weeks after the month
+    "ECIWAG"  : timedelta(days=28, hours=8.5),   # ECI, about four weeks after the quarter
+}
+
+
+def frequency(step_days) -> str:
+    """Frequency key for a median spacing between observations, in days."""
+    if step_days is None:
+        return "M"
+    for key, upper in (("D", 3), ("W", 8), ("M", 35), ("Q", 100)):
+        if step_days <= upper:
+            return key
+    return "A"
+
+
+def _lag(code: str, freq: str) -> timedelta:
+    for key, lag in RELEASE_LAG.items():
+        if code.startswith(key):
+            return lag
+    return FREQUENCIES[freq]["lag"]
+
+
+def next_release(code: str, last_obs, freq: str) -> datetime:
+    """Earliest ET time the observation after `last_obs` could be published."""
+    rule = FREQUENCIES[freq]
+    obs  = pd.Timestamp(last_obs) + rule["step"]
+    return (obs + rule["period"]).to_pydatetime() + _lag(code, freq)
+
+
+def _now_et() -> datetime:
+    return datetime.now(_ET).replace(tzinfo=None) if _ET else datetime.now()
+
+
+def is_due(code: str, meta: dict) -> bool:
+    """
+    True when the stored copy of `code` (SeriesStore.meta) should be
+    refreshed: a new observation could be out by now and it has not been
+    checked within its poll interval, or it is older than MAX_AGE.
+    """
+    age = datetime.now() - meta["last_fetch"]
+    if age >= MAX_AGE:
+        return True
+    series = registry.SERIES.get(code)
+    freq = series.frequency if series else frequency(meta.get("step_days"))
+    if age < FREQUENCIES[freq]["poll"]:
+        return False
+    return _now_et() >= next_release(code, meta["last_obs"], freq)
+
+
+def cache_panel(codes, max_entries: int=2):
+    """
+    Cache for a panel builder that also keys on the data version of the FRED
+    series it reads, so the panel is rebuilt only when one of them was
+    refreshed with new data. `codes` is a registry panel name, a list of
+    codes or a callable returning one from the builder's arguments. With
+    DASHBOARD_COMPACT=1 the result is cached in compact form (see compact).
+
+    At most `max_entries` versions are kept (least recently used dropped):
+    the default holds the current one and the one pages still read while
+    the warm-up builds its successor. Raise it for builders called with
+    several argument combinations.
+
+    A series that is not stored yet has no version, so it is downloaded
+    first and the panel keyed on the version that stores; if there is still
+    no stored copy (e.g. a store reader, see SeriesStore.writable) the panel
+    is built without being cached. A registry panel that reads ALFRED
+    vintages (registry.vintage_codes) is also keyed on theirs
+    (fred.vintage_version), and built uncached while any is missing.
+
+    Panels are held once per process in st.cache_resource and every call
+    gets shallow copies (shared(): no data is copied), so a rerun costs no
+    unpickling. pandas' copy-on-write keeps the cached panel intact when a
+    caller writes to its copy; without it (pandas < 3) panels fall back to
+    st.cache_data, which hands out a full copy per call.
+    """
+    import streamlit as st
+    from data_fetcher.fred import data_version, fetch_many, vintage_version
+
+    vintages = []
+    if isinstance(codes, str):
+        codes, vintages = registry.codes(codes), registry.vintage_codes(codes)
+
+    def deco(fn):
+        def cached(version, *args, **kwargs):
+            result = fn(*args, **kwargs)
+            return compact.compact(result) if compact.ENABLED else result
+        # st.cache_* key on module + qualname, so keep each panel distinct
+        cached.__module__, cached.__qualname__ = fn.__module__, fn.__qualname__
+        as_data     = st.cache_data(show_spinner=False, max_entries=max_entries)(cached)
+        as_resource = st.cache_resource(show_spinner=False, max_entries=max_entries)(cached)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            deps    = codes(*args, **kwargs) if callable(codes) else codes
+            version = data_version(deps)
+            missing = [c for c, digest in version if digest is None]
+            if missing:
+                fetch_many(missing)
+                version = data_version(deps)
+                if any(digest is None for _, digest in version):
+                    return cached(version, *args, **kwargs)
+            if vintages:
+                alfred = vintage_version(vintages)
+                if any(digest is None for _, digest in alfred):
+                    return cached(version, *args, **kwargs)
+                version = (*version, *((f"{c} vintages", d) for c, d in alfred))
+            if SHARED_PANELS:
+                return shared(as_resource(version, *args, **kwargs))
+            return as_data(version, *args, **kwargs)
+
+        def clear():
+            as_data.clear()
+            as_resource.clear()
+        wrapper.clear = clear
+        return wrapper
+    return deco
+
+
+# Shared panels need copy-on-write, which pandas always applies from 3.0 on.
+SHARED_PANELS = COPY_ON_WRITE
+
+
+def shared(obj):
+    """
+    A caller's handle on a cached panel: shallow copies of its frames and
+    series (tuples, lists and dicts of them walked), sharing the data.
+    """
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return obj.copy(deep=False)
+    if isinstance(obj, (tuple, list)):
+        return type(obj)(shared(v) for v in obj)
+    if isinstance(obj, dict):
+        return {k: shared(v) for k, v in obj.items()}
+    return obj
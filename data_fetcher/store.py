@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from pathlib import Path
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:              # Windows: lock a byte of the file instead
+    fcntl = None
+    import msvcrt
+
+# With copy-on-write (always on from pandas 3) a shallow copy of a frame is
+# safe to hand out: writes to it never reach the frame it was copied from.
+COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+
+def _lock_file(fd: int, wait: bool) -> bool:
+    """
+    Exclusive lock on the open file `fd`, released by the OS when the
+    process exits. Returns False if another process holds it and not `wait`.
+    """
+    if fcntl is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if wait else fcntl.LOCK_NB))
+        except BlockingIOError:
+            return False
+        return True
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not wait:
+                return False
+            time.sleep(1)
+
+
+class SeriesStore:
+    """
+    Local columnar copy of every FRED series the app has downloaded.
+      • one uncompressed Arrow IPC (Feather v2) file per code
+      • index.json holds, per code, the first date covered, the last
+        observation, the time of the last successful FRED fetch, the median
+        spacing of observations and a digest of the stored values
+    Files are replaced atomically, so a reader never sees a half-written copy.
+
+    Several processes can share one store (e.g. in /dev/shm): read() maps the
+    file and returns frames viewing the mapped pages, so every process on the
+    host reads the same physical copy. Only one process at a time writes,
+    the one holding the store's writer lock (see writable()).
+    """
+
+    def __init__(self, root, role: str="auto"):
+        self.root  = Path(root)
+        self.role  = role        # "auto" | "writer" | "reader"
+        self._lock = threading.Lock()
+        self._writer_lock = threading.Lock()
+        self._writer_fd   = None
+
+    # -- writer election ---------------------------------------------------
+    def writable(self) -> bool:
+        """
+        True if this process may write to the store. The first process to
+        ask takes an exclusive lock on <root>/.writer.lock and keeps it until
+        it exits; the others read only and ask again on later calls, so one
+        takes over when the writer goes away. role="writer" waits for the
+        lock, role="reader" never writes.
+        """
+        if self._writer_fd is not None:
+            return True
+        if self.role == "reader":
+            return False
+        with self._writer_lock:
+            if self._writer_fd is not None:
+                return True
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.root / ".writer.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            if not _lock_file(fd, wait=self.role == "writer"):
+                os.close(fd)
+                return False
+            self._writer_fd = fd
+            return True
+
+    # -- metadata ---------------------------------------------------------
+    def _index_path(self) -> Path:
+        return self.root / "index.json"
+
+    def _read_index(self) -> dict:
+        try:
+            return json.loads(self._index_path().read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _parse(meta: dict) -> dict:
+        return {
+            "start"     : pd.Timestamp(meta["start"]),
+            "last_obs"  : pd.Timestamp(meta["last_obs"]),
+            "last_fetch": datetime.fromisoformat(meta["last_fetch"]),
+            "rows"      : meta["rows"],
+            "step_days" : meta.get("step_days"),
+            "digest"    : meta.get("digest", meta["last_fetch"]),
+            "source"    : meta.get("source"),
+        }
+
+    def meta(self, code: str):
+        """Return the index entry for `code` or None if it was never stored."""
+        meta = self._read_index().get(code)
+        return None if meta is None else self._parse(meta)
+
+    def metas(self, codes) -> dict:
+        """meta() for several codes from a single read of the index."""
+        index = self._read_index()
+        return {c: self._parse(index[c]) if c in index else None for c in codes}
+
+    # -- data -------------------------------------------------------------
+    def _path(self, code: str) -> Path:
+        return self.root / f"{code}.arrow"
+
+    def read(self, code: str):
+        """
+        Stored frame for `code` (index DATE, one float column) or None.
+        Its arrays are read-only views of the memory-mapped file.
+        """
+        try:
+            table = feather.read_table(self._path(code), memory_map=True)
+        except FileNotFoundError:
+            return None
+        return table.to_pandas(split_blocks=True)
+
+    def write(self, code: str, df: pd.DataFrame, start, fetched_at: datetime=None,
+              source: str=None):
+        """
+        Persist `df` as the full history of `code` from `start` onward.
+        `source` is the digest of the series it was derived from, if any.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(code)
+        tmp  = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        table = pa.Table.from_pandas(df)
+        for i, col in enumerate(df.columns):
+            # keep NaN as a value rather than a null, so read() can map the
+            # column without filling nulls into a copy
+            table = table.set_column(i, table.field(i), pa.array(df[col].to_numpy(), from_pandas=False))
+        feather.write_feather(table, tmp, compression="uncompressed")
+        os.replace(tmp, path)
+
+        last_obs = df.index.max() if len(df) else pd.Timestamp(start)
+        step     = np.diff(df.index.values).astype("timedelta64[D]").astype(float)
+        digest   = hashlib.blake2b(pd.util.hash_pandas_object(df).to_numpy().tobytes(),
+                                   digest_size=8).hexdigest()
+        with self._lock:
+            index = self._read_index()
+            index[code] = {
+                "start"     : pd.Timestamp(start).strftime("%Y-%m-%d"),
+                "last_obs"  : last_obs.strftime("%Y-%m-%d"),
+                "last_fetch": (fetched_at or datetime.now()).isoformat(timespec="seconds"),
+                "rows"      : int(len(df)),
+                "step_days" : float(np.median(step)) if len(step) else None,
+                "digest"    : digest,
+            }
+            if source is not None:
+                index[code]["source"] = source
+            tmp = self._index_path().with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(index, indent=1, sort_keys=True))
+            os.replace(tmp, self._index_path())
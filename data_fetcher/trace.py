@@ -0,0 +1,122 @@
+import contextvars
+import functools
+import os
+import threading
+import time
+import pandas as pd
+from contextlib import contextmanager
+
+# Opt-in: DASHBOARD_TRACE=1 traces every run, otherwise only runs started
+# with ?diagnostics=1 in the URL (see Home.py).
+ENABLED = os.environ.get("DASHBOARD_TRACE") == "1"
+
+_trace = contextvars.ContextVar("trace", default=None)
+_depth = contextvars.ContextVar("trace_depth", default=0)
+
+
+class Trace:
+    """Timed events of one script run; appended to from any thread."""
+
+    def __init__(self):
+        self.t0     = time.perf_counter()
+        self.events = []
+        self._lock  = threading.Lock()
+
+    def add(self, event: dict):
+        with self._lock:
+            self.events.append(event)
+
+    def frame(self) -> pd.DataFrame:
+        with self._lock:
+            events = list(self.events)
+        cols = ["start_ms", "ms", "kind", "name", "depth", "thread",
+                "cache", "rows", "bytes"]
+        if not events:
+            return pd.DataFrame(columns=cols)
+        return pd.DataFrame(events).reindex(columns=cols).sort_values("start_ms")
+
+
+def start() -> Trace:
+    """Begin tracing the current script run and return its Trace."""
+    t = Trace()
+    _trace.set(t)
+    return t
+
+
+def active() -> bool:
+    return _trace.get() is not None
+
+
+@contextmanager
+def span(name: str, kind: str):
+    """
+    Time the enclosed block. Yields a dict the caller may annotate with
+    `rows`, `bytes` or `cache`; a throw-away dict when tracing is off.
+    """
+    t = _trace.get()
+    if t is None:
+        yield {}
+        return
+
+    depth = _depth.get()
+    token = _depth.set(depth + 1)
+    event = {"name": name, "kind": kind, "depth": depth,
+             "thread": threading.current_thread().name}
+    start = time.perf_counter()
+    try:
+        yield event
+    finally:
+        end = time.perf_counter()
+        _depth.reset(token)
+        event["start_ms"] = round((start - t.t0) * 1000, 2)
+        event["ms"]       = round((end - start) * 1000, 2)
+        t.add(event)
+
+
+def _rows(result):
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return len(result)
+    if isinstance(result, tuple):
+        return sum(_rows(r) or 0 for r in result) or None
+    return None
+
+
+def traced(kind: str):
+    """Decorator form of span(); records rows for DataFrame results."""
+    def deco(fn):
+        name = f"{fn.__module__.split('.')[-1]}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _trace.get() is None:
+                return fn(*args, **kwargs)
+            with span(name, kind) as event:
+                result = fn(*args, **kwargs)
+                event["rows"] = _rows(result)
+                return result
+
+        if hasattr(fn, "clear"):          # keep st.cache_data's .clear()
+            wrapper.clear = fn.clear
+        return wrapper
+    return deco
+
+
+def submit(pool, fn, *args):
+    """pool.submit that keeps the caller's trace in the worker thread."""
+    return pool.submit(contextvars.copy_context().run, fn, *args)
+
+
+def instrument_streamlit():
+    """Wrap st.plotly_chart so figure serialisation shows up in the trace."""
+    import streamlit as st
+    if getattr(st.plotly_chart, "_traced", False):
+        return
+    original = st.plotly_chart
+
+    @functools.wraps(original)
+    def plotly_chart(fig, *args, **kwargs):
+        with span("st.plotly_chart", "plotly"):
+            return original(fig, *args, **kwargs)
+
+    plotly_chart._traced = True
+    st.plotly_chart = plotly_chart
@@ -0,0 +1,62 @@
+import re
+import numpy as np
+import pandas as pd
+
+# Transform specs understood by compute():
+#   "YoY"            12-month % change
+#   "MoM"            1-month % change
+#   "<n>M"           n-month % change, annualised   e.g. "3M", "6M"
+#   "Cum@YYYY-MM-DD" % change since the anchor date (first row on/after it)
+_ANNUALISED = re.compile(r"^(\d+)M$")
+
+
+def _parse(spec: str):
+    if spec == "YoY":
+        return "pct", 12
+    if spec == "MoM":
+        return "pct", 1
+    if spec.startswith("Cum@"):
+        return "cum", pd.Timestamp(spec[4:])
+    m = _ANNUALISED.match(spec)
+    if m:
+        return "ann", int(m.group(1))
+    raise ValueError(f"unknown transform {spec!r}")
+
+
+def lookback(transforms) -> pd.DateOffset:
+    """
+    History needed before the first date a transform is shown, e.g. 12
+    months for "YoY" (anchored changes need none beyond their anchor).
+    """
+    months = [arg for kind, arg in map(_parse, transforms) if kind != "cum"]
+    return pd.DateOffset(months=max(months, default=0))
+
+
+def compute(idx: pd.DataFrame, transforms) -> pd.DataFrame:
+    """
+    Apply every transform in `transforms` to every column of a wide
+    monthly index panel in one vectorised pass over a contiguous 2-D array.
+    Output columns are "<column> <spec>", grouped by transform in the order
+    given, e.g. ["Headline CPI YoY", "Core CPI YoY", "Headline CPI 3M", ...].
+    Rows where an input is missing give NaN for that column only.
+    """
+    x = np.ascontiguousarray(idx.to_numpy(dtype=np.float64))
+    n, k = x.shape
+    out = np.full((n, k * len(transforms)), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for j, spec in enumerate(transforms):
+            kind, arg = _parse(spec)
+            dst = out[:, j * k:(j + 1) * k]
+            if kind == "cum":
+                row = idx.index.searchsorted(arg)
+                if row < n:
+                    dst[:] = (x / x[row] - 1.0) * 100.0
+            elif arg < n:
+                ratio = x[arg:] / x[:-arg]
+                if kind == "ann":
+                    ratio = ratio ** (12.0 / arg)
+                dst[arg:] = (ratio - 1.0) * 100.0
+
+    columns = [f"{c} {spec}" for spec in transforms for c in idx.columns]
+    return pd.DataFrame(out, index=idx.index, columns=columns)
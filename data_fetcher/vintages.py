@@ -0,0 +1,167 @@
+"""
+Revision history of a series, stored as ALFRED real-time periods.
+
+Each row is one published value of one observation and the range of
+vintages (release dates) it was current in:
+
+    date   value   vintage_start   vintage_end      (days since 1970-01-01)
+
+A new release only closes the rows it revised and adds rows for the new and
+revised values, so a series takes one row per distinct value ever published,
+not one copy of the history per vintage, and any as-of view is a single mask.
+"""
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from datetime import datetime
+from pathlib import Path
+from data_fetcher.client import OPEN
+
+COLUMNS = ["date", "value", "vintage_start", "vintage_end"]
+
+
+def _day(ts) -> int:
+    return int(np.datetime64(pd.Timestamp(ts).date(), "D").astype(np.int32))
+
+
+def _index(days) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(np.asarray(days, dtype="datetime64[D]").astype("datetime64[ns]"),
+                            name="DATE")
+
+
+def merge(stored: pd.DataFrame, fetched: pd.DataFrame, since, start=None) -> pd.DataFrame:
+    """
+    Fold `fetched` (real-time periods for vintages >= `since`, observations
+    >= `start`) into `stored`. Stored rows outside that window are kept as
+    they are; a stored row still current at `since` is extended when the
+    fetched value is unchanged and closed the day before `since` otherwise.
+    """
+    since = _day(since)
+    lo    = _day(start) if start is not None else np.iinfo(np.int32).min
+    fetched = fetched.assign(vintage_start=np.maximum(fetched["vintage_start"], since))
+
+    overlap = (stored["vintage_end"] >= since) & (stored["date"] >= lo)
+    keep, live = stored[~overlap], stored[overlap]
+
+    # fetched rows starting at `since` continue a stored row when the value matches
+    first = fetched[fetched["vintage_start"] == since]
+    both  = live.merge(first, on="date", how="left", suffixes=("", "_new"), indicator=True)
+    same  = (both["_merge"] == "both") & (
+        (both["value"] == both["value_new"]) | (both["value"].isna() & both["value_new"].isna())
+    )
+    same  = same.to_numpy()
+
+    continued = both.loc[same, COLUMNS].assign(vintage_end=both.loc[same, "vintage_end_new"].to_numpy())
+    closed    = both.loc[~same, COLUMNS].assign(vintage_end=since - 1)
+    closed    = closed[closed["vintage_end"] >= closed["vintage_start"]]
+    joined    = set(both.loc[same, "date"])
+    added     = fetched[~((fetched["vintage_start"] == since) & fetched["date"].isin(joined))]
+
+    out = pd.concat([keep, continued, closed, added], ignore_index=True)
+    return (out.astype({"date": np.int32, "vintage_start": np.int32, "vintage_end": np.int32})
+               .sort_values(["date", "vintage_start"], ignore_index=True))
+
+
+def as_of(rows: pd.DataFrame, when=None) -> pd.Series:
+    """Values as published on `when` (default: the latest vintage)."""
+    day  = OPEN if when is None else _day(when)
+    hit  = rows[(rows["vintage_start"] <= day) & (rows["vintage_end"] >= day)]
+    return pd.Series(hit["value"].to_numpy(), index=_index(hit["date"]))
+
+
+def first_release(rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per observation: its first published value and that vintage's date
+    (columns value, vintage on a DATE index).
+    """
+    first = rows.sort_values(["date", "vintage_start"]).drop_duplicates("date")
+    return pd.DataFrame({"value": first["value"].to_numpy(),
+                         "vintage": _index(first["vintage_start"])},
+                        index=_index(first["date"]))
+
+
+def first_print_change(rows: pd.DataFrame) -> pd.Series:
+    """
+    Change over the previous observation as first published: the first
+    value of each observation minus the previous observation's value in
+    that same vintage (e.g. the headline payrolls change on release day).
+    """
+    first = rows.sort_values(["date", "vintage_start"]).drop_duplicates("date", ignore_index=True)
+    query = pd.DataFrame({"prev"   : first["date"].shift(1),
+                          "vintage": first["vintage_start"],
+                          "date"   : first["date"],
+                          "value"  : first["value"]}).iloc[1:]
+    prior = rows.rename(columns={"date": "prev", "value": "prev_value"})
+    out   = pd.merge_asof(query.astype({"prev": np.int32}).sort_values("vintage"),
+                          prior.sort_values("vintage_start"),
+                          left_on="vintage", right_on="vintage_start", by="prev")
+    out   = out.sort_values("date")
+    valid = (out["vintage_end"] >= out["vintage"]).to_numpy()
+    return pd.Series(np.where(valid, out["value"] - out["prev_value"], np.nan),
+                     index=_index(out["date"]))
+
+
+class VintageStore:
+    """
+    One Arrow file of real-time periods per code (<code>.vintages.arrow next
+    to the latest-vintage store); its schema metadata holds what
+    schedule.is_due needs.
+    """
+
+    def __init__(self, root):
+        self.root  = Path(root)
+        self._lock = threading.Lock()
+
+    def _path(self, code: str) -> Path:
+        return self.root / f"{code}.vintages.arrow"
+
+    @staticmethod
+    def _parse(meta: bytes) -> dict:
+        meta = json.loads(meta)
+        return {
+            "last_fetch": datetime.fromisoformat(meta["last_fetch"]),
+            "last_obs"  : pd.Timestamp(meta["last_obs"]),
+            "step_days" : meta["step_days"],
+            "digest"    : meta.get("digest", meta["last_fetch"]),
+        }
+
+    def read(self, code: str):
+        """(rows, meta) for `code`, or (None, None) if it was never stored."""
+        try:
+            table = feather.read_table(self._path(code), memory_map=True)
+        except FileNotFoundError:
+            return None, None
+        return table.to_pandas(), self._parse(table.schema.metadata[b"vintages"])
+
+    def meta(self, code: str):
+        """The meta of read() alone (only the file's schema is read), or None."""
+        try:
+            with pa.memory_map(str(self._path(code))) as source:
+                schema = pa.ipc.open_file(source).schema
+        except FileNotFoundError:
+            return None
+        return self._parse(schema.metadata[b"vintages"])
+
+    def write(self, code: str, rows: pd.DataFrame, fetched_at: datetime=None):
+        self.root.mkdir(parents=True, exist_ok=True)
+        dates = np.unique(rows["date"].to_numpy())
+        meta  = {
+            "last_fetch": (fetched_at or datetime.now()).isoformat(timespec="seconds"),
+            "last_obs"  : str(np.datetime64(int(dates[-1]), "D")) if len(dates) else "1970-01-01",
+            "step_days" : float(np.median(np.diff(dates))) if len(dates) > 1 else None,
+            "digest"    : hashlib.blake2b(pd.util.hash_pandas_object(rows[COLUMNS], index=False)
+                                          .to_numpy().tobytes(), digest_size=8).hexdigest(),
+        }
+        table = pa.Table.from_pandas(rows[COLUMNS], preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               b"vintages": json.dumps(meta).encode()})
+        path = self._path(code)
+        tmp  = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._lock:
+            feather.write_feather(table, tmp, compression="uncompressed")
+            os.replace(tmp, path)
@@ -1,75 +1,47 @@
 import streamlit as st
-import pandas as pd
 import plotly.graph_objects as go
 from datetime import date
-from data_fetcher.fred import _fred_series 
+from data_fetcher.fred import _fred_series, fetch_many 
+from data_fetcher import registry
+from data_fetcher.trace import traced
+from data_fetcher.schedule import cache_panel
+from data_fetcher.recessions import recession_periods
+from sections.charts import add_recessions
 
 FIG_H   = 390
 RECESS  = "USREC"
 
-SERIES = {
-    "EPOP 25-54 Yrs"           : "LNS12300060",   # Employment-Population, 25-54
-    "Unemployed ≥15wks (U-1)"  : "U1RATE",        # U-1 unemployment rate
-}
-
-SERIES_OT_PT = {
-    "OT – Manufacturing"       : "CES3000000004",   # Avg weekly OT hrs, all emp. – manufacturing :contentReference[oaicite:0]{index=0}
-    "OT – Nondurable Goods"    : "CES3200000004",   # Avg weekly OT hrs, all emp. – nondurable goods :contentReference[oaicite:1]{index=1}
-    "Part-Time Econ Reasons"   : "LNS12032194",     # Employment level, part-time for economic reasons :contentReference[oaicite:2]{index=2}
-}
-
-SERIES_QUITS = {
-    "Quits – Total"                        : "JTSQUL",
-    "Professional and Business Services"   : "JTS540099QUL",
-    "Manufacturing"                        : "JTS3000QUL",
-    "Leisure and Hospitality"              : "JTS7000QUL",
-    "Retail Trade"                         : "JTS4400QUL",
-}
+SERIES       = registry.table("alternatives")
+SERIES_OT_PT = registry.table("alternatives.ot_pt")
+SERIES_QUITS = registry.table("alternatives.quits")
 
 
+@traced("panel")
 def _panel():
-    df = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES.items()],
-        axis=1
-    )
+    df = fetch_many(SERIES)
     rec = _fred_series(RECESS, name="USREC")      # NBER recession flags
     return df.join(rec, how="inner").dropna()
 
-@st.cache_data(show_spinner=False)
+@traced("panel")
+@cache_panel("alternatives.ot_pt")
 def _panel_ot_pt():
-    df   = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_OT_PT.items()],
-        axis=1
-    )
+    df   = fetch_many(SERIES_OT_PT)
     rec  = _fred_series(RECESS, name="USREC")
     return df.join(rec, how="inner").dropna()
 
-@st.cache_data(show_spinner=False)
+@traced("panel")
+@cache_panel("alternatives.quits")
 def _panel_quits():
-    df  = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_QUITS.items()],
-        axis=1
-    )
+    df  = fetch_many(SERIES_QUITS)
     rec = _fred_series(RECESS, name="USREC")
     return df.join(rec, how="inner").dropna()
 
 
-def _recession_periods(rec):
-    rec = rec.astype(bool)
-    start = rec & ~rec.shift(1, fill_value=False)
-    end   = rec & ~rec.shift(-1, fill_value=False)
-    return list(zip(start[start].index, end[end].index))
-
-def _add_recessions(fig, periods):
-    for s, e in periods:
-        fig.add_vrect(x0=s, x1=e, fillcolor="grey",
-                      opacity=0.25, line_width=0, layer="below")
-        
-
+@traced("render")
 def render_alt_labor() -> None:
     """Render EPOP 25-54 and U-1 unemployment side by side."""
     df      = _panel()
-    recess  = _recession_periods(df["USREC"])
+    recess  = recession_periods(df.index.min(), df.index.max())
 
     col1, col2 = st.columns(2, gap="large")
 
@@ -87,7 +59,7 @@ def render_alt_labor() -> None:
             x=df.index, y=df["EPOP 25-54 Yrs"],
             mode="lines", name="EPOP 25-54", line=dict(width=3, color="#18A5C2")
         )
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25),
@@ -107,7 +79,7 @@ def render_alt_labor() -> None:
             x=df.index, y=df["Unemployed ≥15wks (U-1)"],
             mode="lines", name="U-1", line=dict(width=3, color="#0D1F2D")
         )
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25),
@@ -116,13 +88,14 @@ def render_alt_labor() -> None:
         st.plotly_chart(fig, use_container_width=True)
 
 
+@traced("render")
 def render_overtime_and_parttime() -> None:
     """
     (1) Average Weekly Overtime Hours – Manufacturing vs Nondurable Goods
     (2) Part-Time for Economic Reasons (millions), bar chart
     """
     df     = _panel_ot_pt()
-    recess = _recession_periods(df["USREC"])
+    recess = recession_periods(df.index.min(), df.index.max())
 
     start_date = "2021-01-01"
     end_date   = df.index.max().strftime("%Y-%m-%d")
@@ -146,7 +119,7 @@ def render_overtime_and_parttime() -> None:
         fig.add_scatter(x=df.index, y=df["OT – Nondurable Goods"],
                         mode="lines", name="Nondurable Goods",
                         line=dict(width=3, color="#0D1F2D"))
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25),
@@ -167,7 +140,7 @@ def render_overtime_and_parttime() -> None:
         fig.add_bar(x=df_pt_mln.index, y=df_pt_mln,
                     name="Part-Time Econ Reasons",
                     marker_color="#9EC9E2")
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25),
@@ -177,12 +150,13 @@ def render_overtime_and_parttime() -> None:
         st.plotly_chart(fig, use_container_width=True)
 
 
+@traced("render")
 def render_quits() -> None:
     """
     (1) Total quits (bar); (2) stacked quits for four headline sectors.
     """
     df      = _panel_quits()
-    recess  = _recession_periods(df["USREC"])
+    recess  = recession_periods(df.index.min(), df.index.max())
 
     # -- zoom window: Jan-2021 to latest date in df
     start_date = "2020-01-01"
@@ -203,7 +177,7 @@ def render_quits() -> None:
             x=df.index, y=df["Quits – Total"],   # thousands → thousands (keep scale)
             name="Total Quits", marker_color="#84C2E5"
         )
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25),
@@ -233,7 +207,7 @@ def render_quits() -> None:
                 x=df.index, y=df[lbl], name=lbl,
                 marker_color=col
             )
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             barmode="stack", height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25),
@@ -0,0 +1,175 @@
+import os
+from functools import lru_cache, wraps
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from data_fetcher.cache import SeriesCache
+
+# Assumed on-screen width of a chart; long traces are thinned to two points
+# (min and max) per pixel outside the default window. 0 turns this off.
+PLOT_WIDTH_PX = int(os.environ.get("DASHBOARD_PLOT_WIDTH", "640"))
+
+# Trace renderer: "svg", "webgl", or "auto" = WebGL once a figure has more
+# than WEBGL_POINTS points (plotly.express uses the same 1000 cut-off).
+RENDER_MODE  = os.environ.get("DASHBOARD_RENDER", "auto")
+WEBGL_POINTS = int(os.environ.get("DASHBOARD_WEBGL_POINTS", "1000"))
+
+# Built figures, keyed on builder + a fingerprint of the data behind them.
+# Entries only go stale when the data changes, which changes the key.
+_FIGURES = SeriesCache(
+    maxsize=int(os.environ.get("DASHBOARD_FIGURE_CACHE_SIZE", "128")),
+    ttl=float(os.environ.get("DASHBOARD_FIGURE_CACHE_TTL", "86400")),
+)
+
+# Default recession band, as drawn on the employment / inflation pages.
+RECESSION_STYLE = dict(fillcolor="grey", opacity=0.25, line_width=0, layer="below")
+
+
+@lru_cache(maxsize=128)
+def _recession_shapes(periods: tuple, style: tuple) -> tuple:
+    return tuple(
+        go.layout.Shape(type="rect", xref="x", yref="y domain",
+                        x0=s, x1=e, y0=0, y1=1, **dict(style))
+        for s, e in periods
+    )
+
+
+def recession_shapes(periods, **style) -> tuple:
+    """
+    Validated vrect shapes for (start, end) recession periods, built once per
+    (periods, style) and shared by every figure that draws the same bands.
+    Same JSON as fig.add_vrect(x0=s, x1=e, **style) on a single-axis figure.
+    """
+    return _recession_shapes(tuple(periods), tuple(sorted((style or RECESSION_STYLE).items())))
+
+
+def add_recessions(fig: go.Figure, periods, **style) -> go.Figure:
+    """
+    Append the recession bands to `fig` in one layout update. add_vrect
+    re-validates the whole layout per call, which made shading the slowest
+    part of building full-history figures.
+    """
+    fig.layout.shapes = fig.layout.shapes + recession_shapes(periods, **style)
+    return fig
+
+
+def stale_badge(stale: dict) -> str:
+    """
+    Header line for a page drawn partly from stored copies because FRED
+    could not be reached; `stale` is fred.stale(codes). Entries without a
+    fetch time had no stored copy, so their charts are left out.
+    """
+    def names(keys):
+        return ", ".join(keys[:4]) + (f" +{len(keys) - 4} more" if len(keys) > 4 else "")
+
+    stored  = {c: t for c, t in stale.items() if t is not None}
+    missing = [c for c, t in stale.items() if t is None]
+    parts   = []
+    if stored:
+        oldest = min(stored.values()).strftime("%Y-%m-%d %H:%M")
+        parts.append(f"showing stored data for {names(list(stored))} (as of {oldest})")
+    if missing:
+        parts.append(f"no data for {names(missing)}")
+    return (
+        "<div style='font-size:14px;font-weight:600;color:#ff572f;margin-left:85px;'>"
+        f"&#9888; FRED unavailable: {'; '.join(parts)}</div>"
+    )
+
+
+def use_webgl(points: int) -> bool:
+    if RENDER_MODE == "webgl":
+        return True
+    return RENDER_MODE == "auto" and points > WEBGL_POINTS
+
+
+def scatter(points: int=None, **kwargs):
+    """
+    go.Scatter, or go.Scattergl with the same styling when use_webgl().
+    `points` is the point count of the whole figure so that all its traces
+    switch together; defaults to this trace's len(x).
+    """
+    if points is None:
+        points = len(kwargs.get("x", ()))
+    return (go.Scattergl if use_webgl(points) else go.Scatter)(**kwargs)
+
+
+def _minmax_rows(x: np.ndarray, y: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    Row positions to keep from a sorted run of x: the first and last row,
+    and in each of `buckets` equal-width x buckets the rows holding every
+    column's min and max.
+    """
+    edges = np.linspace(x[0], x[-1], buckets + 1)
+    b     = np.clip(np.searchsorted(edges, x, "right") - 1, 0, buckets - 1)
+    first = np.flatnonzero(np.r_[True, b[1:] != b[:-1]])
+    count = np.diff(np.r_[first, len(x)])
+
+    keep = [np.array([0, len(x) - 1])]
+    for col in y.T:
+        for fill, reduce in ((np.inf, np.minimum), (-np.inf, np.maximum)):
+            v    = np.where(np.isnan(col), fill, col)
+            hits = np.flatnonzero(v == np.repeat(reduce.reduceat(v, first), count))
+            keep.append(hits[np.unique(b[hits], return_index=True)[1]])
+    return np.unique(np.concatenate(keep))
+
+
+def downsample(data, x0=None, x1=None, width_px: int=None):
+    """
+    Thin a long line-chart Series / DataFrame before it is shipped to the
+    browser. Rows inside the default visible window [x0, x1] (either end may be
+    open) are kept as is.
+    Each region outside it gets one bucket per pixel it spans when the chart
+    is fully zoomed out, and only every column's min and max per bucket are
+    kept (min-max decimation), so the drawn line is unchanged at that width.
+    """
+    width_px = PLOT_WIDTH_PX if width_px is None else width_px
+    if not width_px or len(data) <= 2 * width_px:
+        return data
+
+    x    = data.index.values.astype("datetime64[ns]").astype(np.int64)
+    y    = data.to_numpy(dtype=np.float64).reshape(len(data), -1)
+    lo   = 0 if x0 is None else data.index.searchsorted(pd.Timestamp(x0))
+    hi   = len(x) if x1 is None else data.index.searchsorted(pd.Timestamp(x1), "right")
+    if x0 is None and x1 is None:         # no default window: thin everything
+        lo = hi = len(x)
+    span = float(max(x[-1] - x[0], 1))
+
+    def region(a, b):
+        pixels = max(int(np.ceil(width_px * float(x[b - 1] - x[a]) / span)), 1) if b > a else 1
+        if b - a <= 2 * pixels:
+            return np.arange(a, b)
+        return a + _minmax_rows(x[a:b], y[a:b], pixels)
+
+    rows = np.concatenate([region(0, lo), np.arange(lo, hi), region(hi, len(x))])
+    return data.iloc[rows]
+
+
+def _fingerprint(obj):
+    """Hashable stand-in for a builder argument; frames hash by content."""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        cols = tuple(obj.columns) if isinstance(obj, pd.DataFrame) else (obj.name,)
+        digest = int(pd.util.hash_pandas_object(obj, index=True).to_numpy().sum())
+        return type(obj).__name__, obj.shape, cols, digest
+    if isinstance(obj, dict):
+        return tuple((k, _fingerprint(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(_fingerprint(v) for v in obj)
+    return obj
+
+
+def cached_figure(build):
+    """
+    Memoise a figure builder on a fingerprint of its arguments, so reruns
+    that feed it the same data reuse the built go.Figure instead of
+    rebuilding it. The figure is shared: callers must not modify it.
+    """
+    @wraps(build)
+    def wrapper(*args, **kwargs):
+        key = (build.__module__, build.__qualname__, RENDER_MODE,
+               _fingerprint(args), _fingerprint(kwargs))
+        return _FIGURES.get_or_load(key, lambda: build(*args, **kwargs))
+    return wrapper
+
+
+def figure_cache_stats() -> dict:
+    return _FIGURES.stats()
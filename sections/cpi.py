@@ -2,58 +2,34 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-from data_fetcher.fred import _fred_series      
+from data_fetcher import registry
+from data_fetcher.trace import traced
+from data_fetcher.recessions import recession_periods
+from sections.charts import add_recessions
+from sections import price_indexes
 import numpy as np    
 
 FIG_H   = 390
 RECESS  = "USREC"
 
-# CPI components (seasonally-adjusted indexes, 1982-84 = 100)
-SERIES_CPI_COMP = {
-    "Core CPI"   : "CPILFESL",   # CPI ex-Food & Energy
-    "Food CPI"   : "CPIUFDSL",   # Food
-    "Energy CPI" : "CPIENGSL",   # Energy
-}
-
-SERIES_CPI_HOUSING = {
-    "Rent of Primary Residence" : "CUSR0000SEHA",   # SA
-    "OER"                       : "CUSR0000SEHC",   # Owners’ Equivalent Rent
-}
-
-SERIES_CPI_SERVICES = {
-    "Services"                       : "CUSR0000SAS",      # All services
-    "Services less Energy Services"  : "CUSR0000SASLE",    # :contentReference[oaicite:0]{index=0}
-    "Services less Rent of Shelter"  : "CUSR0000SASL2RS",  # :contentReference[oaicite:1]{index=1}
-}
-
-@st.cache_data(show_spinner=False)
+SERIES_CPI_COMP     = registry.table("cpi.components")
+SERIES_CPI_HOUSING  = registry.table("cpi.housing")
+SERIES_CPI_SERVICES = registry.table("cpi.services")
+
+@traced("panel")
 def _panel_housing() -> pd.DataFrame:
     """
     Build YoY % and 3-month annualised % changes for Rent & OER,
     plus US recession flag.
     """
-    idx = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_CPI_HOUSING.items()],
-        axis=1
-    ).dropna()
-
-    yoy  = idx.pct_change(12) * 100
-    yoy.columns = [f"{c} YoY" for c in idx.columns]
-
-    ann3 = (idx / idx.shift(3)) ** 4 - 1
-    ann3 = ann3 * 100
-    ann3.columns = [f"{c} 3M" for c in idx.columns]
-
-    rec = _fred_series(RECESS, name="USREC")
-
-    return pd.concat([yoy, ann3, rec], axis=1).dropna()
+    return price_indexes.panel(SERIES_CPI_HOUSING)
 
 
 # Fed’s average-inflation-target band
 AIT_LOW, AIT_HIGH = 2.0, 2.5
 
 
-@st.cache_data(show_spinner=False)
+@traced("panel")
 def _panel_components() -> pd.DataFrame:
     """
     Returns a DataFrame with:
@@ -61,56 +37,13 @@ def _panel_components() -> pd.DataFrame:
         • 3-month rolling annualised % change for the same
         • NBER recession flag
     """
-    idx = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_CPI_COMP.items()],
-        axis=1
-    ).dropna()
-
-    yoy = idx.pct_change(12) * 100
-    yoy.columns = [f"{c} YoY" for c in idx.columns]
-
-    ann3 = (idx / idx.shift(3)) ** 4 - 1
-    ann3 = ann3 * 100
-    ann3.columns = [f"{c} 3M" for c in idx.columns]
-
-    rec = _fred_series(RECESS, name="USREC")
-
-    return pd.concat([yoy, ann3, rec], axis=1).dropna()
+    return price_indexes.panel(SERIES_CPI_COMP)
 
-@st.cache_data(show_spinner=False)
+@traced("panel")
 def _panel_services() -> pd.DataFrame:
     """YoY %, 3-month annualised %, plus USREC for the three services series."""
-    idx = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_CPI_SERVICES.items()],
-        axis=1
-    ).dropna()
+    return price_indexes.panel(SERIES_CPI_SERVICES)
 
-    yoy = idx.pct_change(12) * 100
-    yoy.columns = [f"{c} YoY" for c in idx.columns]
-
-    ann3 = (idx / idx.shift(3)) ** 4 - 1
-    ann3 = ann3 * 100
-    ann3.columns = [f"{c} 3M" for c in idx.columns]
-
-    rec = _fred_series(RECESS, name="USREC")
-
-    return pd.concat([yoy, ann3, rec], axis=1).dropna()
-
-
-
-def _recession_periods(rec: pd.Series):
-    rec = rec.astype(bool)
-    s = rec & ~rec.shift(1, fill_value=False)
-    e = rec & ~rec.shift(-1, fill_value=False)
-    return list(zip(s[s].index, e[e].index))
-
-
-def _add_recessions(fig: go.Figure, periods):
-    for s, e in periods:
-        fig.add_vrect(
-            x0=s, x1=e, fillcolor="grey",
-            opacity=0.25, line_width=0, layer="below"
-        )
 
 
 def _add_fed_ait_band(fig: go.Figure):
@@ -126,13 +59,14 @@ def _add_fed_ait_band(fig: go.Figure):
     )
 
 
+@traced("render")
 def render_cpi_core_ex() -> None:
     """
     (L) YoY – Core CPI vs Food & Energy
     (R) 3-month rolling annualised – same three series
     """
     df      = _panel_components()
-    recess  = _recession_periods(df["USREC"])
+    recess  = recession_periods(df.index.min(), df.index.max())
 
     df_yoy = df[[f"{k} YoY" for k in ["Core CPI", "Food CPI", "Energy CPI"]]]
     df_3m  = df[[f"{k} 3M"  for k in ["Core CPI", "Food CPI", "Energy CPI"]]]
@@ -158,7 +92,7 @@ def render_cpi_core_ex() -> None:
 
         _add_fed_ait_band(fig)
         fig.add_hline(y=0, line_width=1, line_dash="dash", line_color="#000")
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25, r=10),
@@ -186,7 +120,7 @@ def render_cpi_core_ex() -> None:
             )
 
         _add_fed_ait_band(fig)
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25, r=10),
@@ -201,13 +135,14 @@ def render_cpi_core_ex() -> None:
         st.plotly_chart(fig, use_container_width=True)
 
 
+@traced("render")
 def render_cpi_housing() -> None:
     """
     (L) YoY – Rent of Primary Residence & OER
     (R) 3-month rolling annualised – same two series
     """
     df      = _panel_housing()
-    recess  = _recession_periods(df["USREC"])
+    recess  = recession_periods(df.index.min(), df.index.max())
 
     df_yoy = df[[f"{k} YoY" for k in SERIES_CPI_HOUSING.keys()]]
     df_3m  = df[[f"{k} 3M"  for k in SERIES_CPI_HOUSING.keys()]]
@@ -232,7 +167,7 @@ def render_cpi_housing() -> None:
             )
         _add_fed_ait_band(fig)
         fig.add_hline(y=0, line_width=1, line_dash="dash", line_color="#000")
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25, r=10),
@@ -258,7 +193,7 @@ def render_cpi_housing() -> None:
                 line=dict(width=3, color=col)
             )
         _add_fed_ait_band(fig)
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25, r=10),
@@ -271,13 +206,14 @@ def render_cpi_housing() -> None:
         )
         st.plotly_chart(fig, use_container_width=True)
 
+@traced("render")
 def render_cpi_services() -> None:
     """
     (L) YoY – Services vs ex-energy, ex-rent-of-shelter
     (R) 3-month rolling annualised – same three series
     """
     df      = _panel_services()
-    recess  = _recession_periods(df["USREC"])
+    recess  = recession_periods(df.index.min(), df.index.max())
 
     df_yoy = df[[f"{k} YoY" for k in SERIES_CPI_SERVICES.keys()]]
     df_3m  = df[[f"{k} 3M"  for k in SERIES_CPI_SERVICES.keys()]]
@@ -302,7 +238,7 @@ def render_cpi_services() -> None:
             )
         _add_fed_ait_band(fig)
         fig.add_hline(y=0, line_width=1, line_dash="dash", line_color="#000")
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25, r=10),
@@ -328,7 +264,7 @@ def render_cpi_services() -> None:
                 line=dict(width=3, color=col)
             )
         _add_fed_ait_band(fig)
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25, r=10),
@@ -0,0 +1,71 @@
+import streamlit as st
+import plotly.graph_objects as go
+from data_fetcher.fred import breaker_stats, cache_stats
+from data_fetcher.trace import Trace
+from sections.charts import figure_cache_stats
+from sections import warmup
+
+KIND_COLOURS = {
+    "render"  : "#0D1F2D",
+    "panel"   : "#18A5C2",
+    "series"  : "#86C7DE",
+    "download": "#ff572f",
+    "plotly"  : "#F4B400",
+}
+
+
+def render(trace: Trace) -> None:
+    """Waterfall of everything timed during this script run."""
+    df = trace.frame()
+    if df.empty:
+        st.info("Nothing was traced in this run.")
+        return
+
+    downloads = df[df["kind"] == "download"]
+    series    = df[df["kind"] == "series"]
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Run time", f"{(df['start_ms'] + df['ms']).max():,.0f} ms")
+    c2.metric("Downloads", f"{len(downloads)}")
+    c3.metric("Bytes downloaded", f"{downloads['bytes'].sum():,.0f}")
+    c4.metric("Series cache hits", f"{(series['cache'] == 'hit').sum()} / {len(series)}")
+
+    # ---- waterfall -------------------------------------------------------
+    labels = ["  " * int(d) + n for d, n in zip(df["depth"], df["name"])]
+    rows   = list(range(len(df)))         # one row per event, in start order
+    fig = go.Figure()
+    for kind, colour in KIND_COLOURS.items():
+        mask = (df["kind"] == kind).values
+        if not mask.any():
+            continue
+        fig.add_bar(
+            y=[r for r, m in zip(rows, mask) if m],
+            x=df.loc[mask, "ms"], base=df.loc[mask, "start_ms"],
+            orientation="h", name=kind, marker_color=colour,
+            customdata=df.loc[mask, ["thread", "cache", "rows"]].astype(str).values,
+            text=[n for n, m in zip(df["name"], mask) if m], textposition="none",
+            hovertemplate="%{text}<br>%{base:.0f} → +%{x:.1f} ms"
+                          "<br>%{customdata[0]} · cache %{customdata[1]} · rows %{customdata[2]}"
+                          "<extra></extra>",
+        )
+    fig.update_layout(
+        height=max(300, 14 * len(df)), template="simple_white",
+        margin=dict(t=20, b=25, l=10, r=10),
+        xaxis=dict(title="ms since run start"),
+        yaxis=dict(autorange="reversed", tickmode="array", tickvals=rows,
+                   ticktext=labels, tickfont=dict(size=10)),
+        legend=dict(orientation="h", yanchor="bottom", y=1.0, x=0.01),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    # ---- flame table -----------------------------------------------------
+    st.dataframe(df.assign(name=labels), use_container_width=True, hide_index=True)
+
+    c1, c2, c3 = st.columns(3)
+    c1.markdown("**Series cache**")
+    c1.json(cache_stats())
+    c1.markdown("**FRED circuit breaker**")
+    c1.json(breaker_stats())
+    c2.markdown("**Figure cache**")
+    c2.json(figure_cache_stats())
+    c3.markdown("**Last warm-up pass**")
+    c3.json(warmup.last_pass())
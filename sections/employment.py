@@ -15,17 +15,29 @@ from data_fetcher.fred import (
     get_job_opening_per_person,
     get_labor_supply_demand,
     get_labor_balance,
-    _fred_series,
+    fetch_many,
 )
+from data_fetcher import registry
+from data_fetcher.trace import traced
+from data_fetcher.schedule import cache_panel
+from data_fetcher.recessions import recession_periods
+from sections.charts import add_recessions, downsample, scatter, use_webgl
 
 FIG_HEIGHT = 390
 TOP_GAP_PX = 18
 
+# FRED codes behind the get_* helpers used by _load()
+LABOR_CODES = registry.codes("employment")
+
 
 # Load data from the API
-@st.cache_data(show_spinner=False)
+@traced("panel")
+@cache_panel("employment")
 def _load():
-    df_emp, df_unr = get_employment_growth(), get_unemployment_rate()
+    # download every code the getters below need in one concurrent batch,
+    # so they only read from the shared series cache
+    fetch_many(LABOR_CODES)
+    df_emp, df_unr = get_employment_growth(first_print=True), get_unemployment_rate()
     df_init, df_cont = get_initial_claims(), get_continued_claims()
     df_lmci, df_ratio = get_labour_market_conditions(), get_job_opening_per_person()
     df_supdem, df_balance = get_labor_supply_demand(), get_labor_balance()
@@ -34,6 +46,7 @@ def _load():
 
 
 # ── subsection helpers ──────────────────────────────────────────────────
+@traced("render")
 def _render_general(df_emp, df_unr):
     """Employment Growth and Unemployment Rate Graphs."""
     # Calculating percentile ranks 
@@ -65,22 +78,34 @@ def _render_general(df_emp, df_unr):
         mask      = (df_emp.index >= start_default) & (df_emp.index <= end_default)
         y_visible = np.concatenate([
             df_emp.loc[mask, "Emp Growth"].values,
-            df_emp.loc[mask, "3M MA Emp Growth"].values
+            df_emp.loc[mask, "3M MA Emp Growth"].values,
+            df_emp.loc[mask, "First Print Emp Growth"].dropna().values,
         ])
         y_pad   = 0.05 * (y_visible.max() - y_visible.min())
         y_range = [y_visible.min() - y_pad, y_visible.max() + y_pad]
+        # first prints only exist with ALFRED vintages (FRED_API_KEY)
+        first   = df_emp["First Print Emp Growth"].dropna()
+        first   = downsample(first, start_default, end_default)
+        df_emp  = downsample(df_emp[["Emp Growth", "3M MA Emp Growth"]],
+                             start_default, end_default)
 
         fig_emp = go.Figure()
-        fig_emp.add_trace(go.Scatter(
+        fig_emp.add_trace(scatter(
             x=df_emp.index, y=df_emp["Emp Growth"],
             name="All Employees, Total Nonfarm",
             line=dict(color="#049CA4", width=2)
         ))
-        fig_emp.add_trace(go.Scatter(
+        fig_emp.add_trace(scatter(
             x=df_emp.index, y=df_emp["3M MA Emp Growth"],
             name="3-Month MA",
             line=dict(color="black", width=2)
         ))
+        if len(first):
+            fig_emp.add_trace(scatter(
+                x=first.index, y=first,
+                name="First Print",
+                line=dict(color="#049CA4", width=1.5, dash="dot"),
+            ))
         fig_emp.update_layout(
             height=FIG_HEIGHT,
             yaxis_title="Change (Thousands of persons)",
@@ -118,11 +143,13 @@ def _render_general(df_emp, df_unr):
         st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
 
 
+        plotted = downsample(df_unr)
         fig_unr = px.line(
-            df_unr,
+            plotted,
             labels={"index": "", "value": "% Percentage points"},
             height=FIG_HEIGHT,
             color_discrete_sequence=["#1B65C0"],
+            render_mode="webgl" if use_webgl(plotted.size) else "svg",
         )
 
         avg = df_unr["Unemployment Rate"].mean()
@@ -133,11 +160,8 @@ def _render_general(df_emp, df_unr):
             annotation_yshift=150,
         )
 
-        rec = _fred_series("USREC", name="USREC")
-        for s, e in zip(rec[rec["USREC"].diff() == 1].index,
-                        rec[rec["USREC"].diff() == -1].index):
-            fig_unr.add_vrect(x0=s, x1=e, fillcolor="lightgrey",
-                              opacity=0.30, line_width=0)
+        add_recessions(fig_unr, recession_periods(exclusive_end=True),
+                       fillcolor="lightgrey", opacity=0.30, line_width=0)
 
         fig_unr.update_layout(
             template="simple_white",
@@ -154,6 +178,7 @@ def _render_general(df_emp, df_unr):
         st.plotly_chart(fig_unr, use_container_width=True)
 
 #Render initial claims and continued claims
+@traced("render")
 def _render_initial_vs_continued(df_init, df_cont):
     """Render Initial Claims vs Continued Claims charts with 4-week moving average."""
     left, right = st.columns(2, gap="large")  # Create two columns for side-by-side layout
@@ -173,6 +198,7 @@ def _render_initial_vs_continued(df_init, df_cont):
     ])
     y_pad_init = 0.05 * (y_visible_init.max() - y_visible_init.min())  # 5% padding
     y_range_init = [y_visible_init.min() - y_pad_init, y_visible_init.max() + y_pad_init]
+    df_init = downsample(df_init, start_default, end_default)  # full resolution from 2023
 
     # Plot Initial Claims with 4-week moving average in the left column
     with left:
@@ -186,13 +212,15 @@ def _render_initial_vs_continued(df_init, df_cont):
         
         fig_init = go.Figure()
 
-        fig_init.add_trace(go.Scatter(
+        fig_init.add_trace(scatter(
+            points=df_init.size,
             x=df_init.index, y=df_init['Initial Claims'],
             name="Initial Claims",
             line=dict(color="#1F77B4", width=2)
         ))
 
-        fig_init.add_trace(go.Scatter(
+        fig_init.add_trace(scatter(
+            points=df_init.size,
             x=df_init.index, y=df_init['4 Week Moving Average'],
             name="4 Week Moving Average",
             line=dict(color="black", width=2)
@@ -226,6 +254,7 @@ def _render_initial_vs_continued(df_init, df_cont):
     ])
     y_pad_cont = 0.05 * (y_visible_cont.max() - y_visible_cont.min())  # 5% padding
     y_range_cont = [y_visible_cont.min() - y_pad_cont, y_visible_cont.max() + y_pad_cont]
+    df_cont = downsample(df_cont, start_default, end_default)
 
     # Plot Continued Claims with 4-week moving average in the right column
     with right:
@@ -239,13 +268,15 @@ def _render_initial_vs_continued(df_init, df_cont):
         
         fig_cont = go.Figure()
 
-        fig_cont.add_trace(go.Scatter(
+        fig_cont.add_trace(scatter(
+            points=df_cont.size,
             x=df_cont.index, y=df_cont['Continued Claims'],
             name="Continued Claims",
             line=dict(color="#FF7F0E", width=2)
         ))
 
-        fig_cont.add_trace(go.Scatter(
+        fig_cont.add_trace(scatter(
+            points=df_cont.size,
             x=df_cont.index, y=df_cont['4 Week Moving Average'],
             name="4 Week Moving Average",
             line=dict(color="black", width=2)
@@ -273,6 +304,7 @@ def _render_initial_vs_continued(df_init, df_cont):
         st.plotly_chart(fig_cont, use_container_width=True)
 
 
+@traced("render")
 def _render_lmci_vs_jobratio(df_lmci, df_ratio):
     """KC-Fed LMCI and Job-Openings-per-Unemployed Ratio."""
     left, right = st.columns(2, gap="large")
@@ -281,7 +313,7 @@ def _render_lmci_vs_jobratio(df_lmci, df_ratio):
     START_2005 = "2005-01-01"
     df_lmci  = df_lmci.loc[df_lmci.index  >= START_1995]          
     df_ratio = df_ratio.loc[df_ratio.index >= START_2005]          
-    rec      = _fred_series("USREC", name="USREC").loc[START_1995:]
+    recess   = recession_periods(START_1995, exclusive_end=True)
 
     # ---------- percentile rank for the ratio (for the heading) ----------
     pct_rank = (df_ratio["Jobs per Unemployed"]
@@ -299,17 +331,14 @@ def _render_lmci_vs_jobratio(df_lmci, df_ratio):
         )
 
         fig_lmci = go.Figure()
-        fig_lmci.add_trace(go.Scatter(
+        fig_lmci.add_trace(scatter(
             x=df_lmci.index, y=df_lmci["LMCI"],
             name="LMCI", line=dict(color="#1f77b4", width=2)
         ))
         fig_lmci.add_hline(y=0, line_dash="dash")
 
         # recession shading
-        for s, e in zip(rec[rec["USREC"].diff() == 1].index,
-                        rec[rec["USREC"].diff() == -1].index):
-            fig_lmci.add_vrect(x0=s, x1=e, fillcolor="lightgrey",
-                                opacity=.30, line_width=0)
+        add_recessions(fig_lmci, recess, fillcolor="lightgrey", opacity=.30, line_width=0)
 
         fig_lmci.update_layout(
             height=FIG_HEIGHT, template="simple_white",
@@ -332,16 +361,13 @@ def _render_lmci_vs_jobratio(df_lmci, df_ratio):
         )
 
         fig_ratio = go.Figure()
-        fig_ratio.add_trace(go.Scatter(
+        fig_ratio.add_trace(scatter(
             x=df_ratio.index, y=df_ratio["Jobs per Unemployed"],
             name="Jobs / Unemployed", line=dict(color="#049CA4", width=2)
         ))
         fig_ratio.add_hline(y=1, line_dash="dash")
 
-        for s, e in zip(rec[rec["USREC"].diff() == 1].index,
-                        rec[rec["USREC"].diff() == -1].index):
-            fig_ratio.add_vrect(x0=s, x1=e, fillcolor="lightgrey",
-                                opacity=.30, line_width=0)
+        add_recessions(fig_ratio, recess, fillcolor="lightgrey", opacity=.30, line_width=0)
 
         fig_ratio.update_layout(
             height=FIG_HEIGHT, template="simple_white",
@@ -354,12 +380,13 @@ def _render_lmci_vs_jobratio(df_lmci, df_ratio):
         )
         st.plotly_chart(fig_ratio, use_container_width=True)
 
+@traced("render")
 def _render_supply_demand(df_supdem, df_balance):
     """Labor Supply & Demand (level) + Balance (excess jobs)."""
     START = "2001-01-01" 
     df_supdem  = df_supdem.loc[START:]
     df_balance = df_balance.loc[START:]
-    rec        = _fred_series("USREC", name="USREC").loc[START:]
+    recess     = recession_periods(START, exclusive_end=True)
 
     left, right = st.columns(2, gap="large")
 
@@ -373,22 +400,20 @@ def _render_supply_demand(df_supdem, df_balance):
         )
 
         fig_sd = go.Figure()
-        fig_sd.add_trace(go.Scatter(
+        fig_sd.add_trace(scatter(
             x=df_supdem.index,
             y=df_supdem["Labor Demand (Openings + Employment)"],
             name="Labor Demand (Openings + Employment)",
             line=dict(color="#049CA4", width=2)
         ))
-        fig_sd.add_trace(go.Scatter(
+        fig_sd.add_trace(scatter(
             x=df_supdem.index,
             y=df_supdem["Labor Supply (Civilian Labor Force)"],
             name="Supply (Civilian Labor Force)",
             line=dict(color="#0D1B2A", width=2)
         ))
 
-        for s, e in zip(rec[rec["USREC"].diff() == 1].index,
-                        rec[rec["USREC"].diff() == -1].index):
-            fig_sd.add_vrect(x0=s, x1=e, fillcolor="lightgrey", line_width=0)
+        add_recessions(fig_sd, recess, fillcolor="lightgrey", line_width=0)
             
         fig_sd.update_layout(
             height=FIG_HEIGHT, template="simple_white",
@@ -421,16 +446,14 @@ def _render_supply_demand(df_supdem, df_balance):
         )
 
         fig_bal = go.Figure()
-        fig_bal.add_trace(go.Scatter(
+        fig_bal.add_trace(scatter(
             x=df_balance.index, y=df_balance["Excess Jobs"],
             line=dict(color="#67B7D1", width=2),
             name="Excess Jobs"
         ))
 
-        for s, e in zip(rec[rec["USREC"].diff() == 1].index,
-                        rec[rec["USREC"].diff() == -1].index):
-            fig_bal.add_vrect(x0=s, x1=e, fillcolor="lightgrey",
-                              line_width=0, layer="below")
+        add_recessions(fig_bal, recess, fillcolor="lightgrey",
+                       line_width=0, layer="below")
  
         fig_bal.update_yaxes(
             range=[-5, df_balance["Excess Jobs"].max()],
@@ -460,21 +483,27 @@ def _render_supply_demand(df_supdem, df_balance):
 
 
 
-# ── public entry-point ─────────────────────────────────────────────────
-def render():
-    """Top-level call from Home.py – builds the sub-tabs."""
+# ── public entry-points ────────────────────────────────────────────────
+@traced("render")
+def render_general():
+    """General sub-tab: payrolls, unemployment, claims, LMCI, supply & demand."""
     df_emp, df_unr, df_init, df_cont, df_lmci, df_ratio, df_supdem, df_balance = _load()
 
+    _render_general(df_emp, df_unr)
+    _render_initial_vs_continued(df_init, df_cont)
+    _render_lmci_vs_jobratio(df_lmci, df_ratio)
+    _render_supply_demand(df_supdem, df_balance)
+
+
+@traced("render")
+def render():
+    """All employment sub-tabs at once (Streamlit runs every tab body)."""
     gen_tab, nfp_tab, wages_tab, alt_tab = st.tabs(
         ["General", "NFP", "Wages", "Alternatives"]
     )
 
     with gen_tab:
-        _render_general(df_emp, df_unr)
-        _render_initial_vs_continued(df_init, df_cont)
-        _render_lmci_vs_jobratio(df_lmci, df_ratio)
-        _render_supply_demand(df_supdem, df_balance)
-
+        render_general()
 
     with nfp_tab:
         render_nfp()
@@ -489,4 +518,3 @@ def render():
         render_alt_labor()
         render_overtime_and_parttime()
         render_quits()
-
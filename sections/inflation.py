@@ -1,9 +1,12 @@
 import streamlit as st
+from data_fetcher.trace import traced
 from sections.overview import render_cpi_overview, render_ppi_overview, render_alt_core_and_expectations, render_year_ahead_expectations
 from sections.cpi import render_cpi_core_ex, render_cpi_housing, render_cpi_services
 
 
+@traced("render")
 def render():
+    """All inflation sub-tabs at once (Streamlit runs every tab body)."""
     overview_tab, cpi_tab = st.tabs(
         ["Overview", "CPI"]
     )
@@ -2,58 +2,47 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import date
-from data_fetcher.fred import _fred_series
+from data_fetcher.fred import _fred_series, fetch_many, get_first_prints
+from data_fetcher import registry
+from data_fetcher.trace import traced
+from data_fetcher.schedule import cache_panel
+from data_fetcher.recessions import recession_periods
+from sections.charts import add_recessions, cached_figure
 
 FIG_H   = 390
 ANCHOR  = date(2020, 1, 1)       # baseline for cumulative Δ
 RECESS  = "USREC"                # recession flag
+REVISED = 12                     # months shown in the revisions chart
 
-SERIES = {
-    # headline splits
-    "Total Private"             : "USPRIV",
-    "Government"                : "USGOVT",
-    "Private Service-Providing" : "CES0800000001",   
-    "Goods-Producing"           : "USGOOD",
-    "Federal"                   : "CES9091000001",
-    "State Government"          : "CES9092000001",
-    "Local Government"          : "CES9093000001",
-
-    # service sub-sectors  ❱❱ use the short IDs
-    "TTU"                       : "USTPU",
-    "Information"               : "USINFO",
-    "Financial"                 : "USFIRE",
-    "Business"                  : "USPBS",
-    "Private Edu. & Health"     : "USEHS",
-    "Leisure & Hosp."           : "USLAH",
-    "Other"                     : "USSERV",
-
-    # goods sub-sectors      
-    "Mining and Logging"        : "USMINE",
-    "Construction"              : "USCONS",
-    "Manufacturing"             : "MANEMP",
-}
-
-
-@st.cache_data(show_spinner=False)
+SERIES = registry.table("nfp")
+
+
+@traced("panel")
+@cache_panel("nfp")
 def _panel():
-    jobs = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES.items()], axis=1
-    )
+    jobs = fetch_many(SERIES)
     rec  = _fred_series(RECESS, name="USREC")
     return jobs.join(rec, how="inner").dropna()
 
+@traced("panel")
+@cache_panel("nfp")
+def _revisions():
+    """
+    Latest estimate of each sector's monthly change minus its first print
+    (thousands), for the last REVISED months; empty without ALFRED vintages.
+    """
+    first = get_first_prints(SERIES)
+    if first.empty:
+        return first
+    return (fetch_many(SERIES).diff() - first).dropna().iloc[-REVISED:]
+
 def _cumulative(df: pd.DataFrame, anchor: date) -> pd.DataFrame:
     anchor = pd.to_datetime(anchor)
     if anchor not in df.index:
         anchor = df.index[df.index.get_loc(anchor, method="bfill")]
     return df.sub(df.loc[anchor])
 
-def _recession_periods(rec):
-    rec = rec.astype(bool)
-    start = rec & ~rec.shift(1, fill_value=False)
-    end   = rec & ~rec.shift(-1, fill_value=False)
-    return list(zip(start[start].index, end[end].index))
-
+@traced("panel")
 def _prepared():
     """
     Returns
@@ -65,16 +54,25 @@ def _prepared():
     df_raw = base.drop(columns="USREC")
     df_cum = _cumulative(df_raw, ANCHOR)
     df_m   = df_cum.loc["2020-01-01":] / 1_000.0        # millions
-    recess = _recession_periods(base["USREC"])
+    recess = recession_periods(df_m.index.min(), df_m.index.max())
     x_rng  = ["2020-01-01", df_m.index.max().strftime("%Y-%m-%d")]
     return df_m, recess, x_rng
 
-def _add_recessions(fig, periods):
-    for s, e in periods:
-        fig.add_vrect(x0=s, x1=e, fillcolor="grey",
-                      opacity=0.25, line_width=0, layer="below")
-
+@cached_figure
+def _stacked_bars(df, labels, colors, recess, x_rng, yaxis=None) -> go.Figure:
+    fig = go.Figure()
+    for lbl, col in zip(labels, colors):
+        fig.add_bar(x=df.index, y=df[lbl], name=lbl, marker_color=col)
+    add_recessions(fig, recess)
+    fig.update_layout(
+        barmode="stack", height=FIG_H, template="simple_white",
+        margin=dict(t=20, b=25),
+        xaxis=dict(range=x_rng),
+        yaxis=yaxis or dict(title="Jobs (millions)", tickformat=".0f", ticksuffix=" M"),
+    )
+    return fig
 
+@traced("render")
 def render_nfp() -> None:
     df, recess, x_rng = _prepared()
 
@@ -87,18 +85,8 @@ def render_nfp() -> None:
             "margin-left:85px;'>Jobs Private vs Government</div>",
             unsafe_allow_html=True,
         )
-        fig = go.Figure()
-        fig.add_bar(x=df.index, y=df["Total Private"],
-                    name="Total Private", marker_color="#0E84C8")
-        fig.add_bar(x=df.index, y=df["Government"],
-                    name="Government", marker_color="#002B45")
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            barmode="stack", height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Jobs (millions)", tickformat=".0f", ticksuffix=" M"),
-        )
+        fig = _stacked_bars(df, ["Total Private", "Government"],
+                            ["#0E84C8", "#002B45"], recess, x_rng)
         st.plotly_chart(fig, use_container_width=True)
 
     # ---- Service-led breakdown -----------------------------------------
@@ -111,21 +99,13 @@ def render_nfp() -> None:
         labels = ["Goods-Producing", "Private Service-Providing",
                   "Local Government", "State Government", "Federal"]
         colors = ["#FDBE4C", "#0E84C8", "#6C8EBF", "#2A4B7C", "#F28E2B"]
-        fig = go.Figure()
-        for lbl, col in zip(labels, colors):
-            fig.add_bar(x=df.index, y=df[lbl], name=lbl, marker_color=col)
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            barmode="stack", height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Jobs (millions)", tickformat=".0f", ticksuffix=" M"),
-        )
+        fig = _stacked_bars(df, labels, colors, recess, x_rng)
         st.plotly_chart(fig, use_container_width=True)
 
     st.caption("Source: BLS CES & NBER recession dates via FRED. Figures in millions.")
 
 # Sub-sector charts  
+@traced("render")
 def render_nfp_subsector() -> None:
    
     df, recess, x_rng = _prepared()
@@ -144,16 +124,7 @@ def render_nfp_subsector() -> None:
                        "Leisure & Hosp.", "Other"]
         serv_colors = ["#FDBE4C", "#FABB2A", "#F29D35",
                        "#0E84C8", "#1F5673", "#2A7F9C", "#8DB7C7"]
-        fig = go.Figure()
-        for lbl, col in zip(serv_order, serv_colors):
-            fig.add_bar(x=df.index, y=df[lbl], name=lbl, marker_color=col)
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            barmode="stack", height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Jobs (millions)", tickformat=".0f", ticksuffix=" M"),
-        )
+        fig = _stacked_bars(df, serv_order, serv_colors, recess, x_rng)
         st.plotly_chart(fig, use_container_width=True)
 
     # --- Goods by sub-sector --------------------------------------------
@@ -165,14 +136,45 @@ def render_nfp_subsector() -> None:
         )
         goods_order  = ["Mining and Logging", "Construction", "Manufacturing"]
         goods_colors = ["#FDBE4C", "#0E84C8", "#6C8EBF"]
-        fig = go.Figure()
-        for lbl, col in zip(goods_order, goods_colors):
-            fig.add_bar(x=df.index, y=df[lbl], name=lbl, marker_color=col)
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            barmode="stack", height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Jobs (millions)", tickmode="linear", dtick=0.5, tickformat=".1f", ticksuffix=" M"),
-        )
-        st.plotly_chart(fig, use_container_width=True)
\ No newline at end of file
+        fig = _stacked_bars(df, goods_order, goods_colors, recess, x_rng,
+                            yaxis=dict(title="Jobs (millions)", tickmode="linear", dtick=0.5,
+                                       tickformat=".1f", ticksuffix=" M"))
+        st.plotly_chart(fig, use_container_width=True)
+
+@cached_figure
+def _revision_bars(df, labels, colors) -> go.Figure:
+    fig = go.Figure()
+    for lbl, col in zip(labels, colors):
+        fig.add_bar(x=df.index, y=df[lbl], name=lbl, marker_color=col)
+    fig.update_layout(
+        barmode="relative", height=FIG_H, template="simple_white",
+        margin=dict(t=20, b=25),
+        yaxis=dict(title="Revision (thousands)", tickformat=",.0f"),
+    )
+    return fig
+
+# Revisions since first print (ALFRED vintages)
+@traced("render")
+def render_nfp_revisions() -> None:
+    df = _revisions()
+    if df.empty:                 # needs FRED_API_KEY (or the offline stand-in)
+        return
+
+    st.markdown(
+        "<div style='font-size:26px;font-weight:700;"
+        "margin-left:85px;'>Revisions Since First Print</div>",
+        unsafe_allow_html=True,
+    )
+    # sub-sectors and government levels add up to total nonfarm
+    labels = ["Mining and Logging", "Construction", "Manufacturing",
+              "TTU", "Information", "Financial", "Business",
+              "Private Edu. & Health", "Leisure & Hosp.", "Other",
+              "Federal", "State Government", "Local Government"]
+    colors = ["#FDBE4C", "#FABB2A", "#F29D35",
+              "#0E84C8", "#1F5673", "#2A7F9C", "#8DB7C7",
+              "#6C8EBF", "#2A4B7C", "#BFD3E6",
+              "#F28E2B", "#9C6B30", "#5B3A1A"]
+    fig = _revision_bars(df, labels, colors)
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption("Latest estimate of each month's job change minus its first print, "
+               "by sector; the bars of a month sum to the total nonfarm revision.")
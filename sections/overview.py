@@ -2,7 +2,13 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import date
-from data_fetcher.fred import _fred_series 
+from data_fetcher.fred import _fred_series, fetch_many 
+from data_fetcher import registry
+from data_fetcher.trace import traced
+from data_fetcher.schedule import cache_panel
+from data_fetcher.recessions import recession_periods
+from sections.charts import add_recessions, downsample, cached_figure
+from sections import price_indexes
 
 
 FIG_H   = 390
@@ -12,41 +18,19 @@ RECESS  = "USREC"                # recession flag
 FIG_H   = 390
 RECESS  = "USREC"
 
-SERIES_CPI = {
-    "Headline CPI" : "CPIAUCSL",   # All-items CPI (SA, 1982-84=100)
-    "Core CPI"     : "CPILFESL",   # CPI ex-Food & Energy (SA)
-}
-
-       
-SERIES_PPI = {
-    "Headline PPI": "PPIACO",   # All Commodities PPI (not seasonally adjusted)                             
-    "Core PPI"    : "PPICOR",   # Final Demand: Less Foods & Energy (not seasonally adjusted)          
-}
-
-SERIES_ALT_CORE = {
-        "Trimmed Mean PCE"     : "PCETRIM12M159SFRBDAL",       
-        "16% Trimmed-Mean CPI" : "TRMMEANCPIM158SFRBCLE",     
-        "Median CPI"           : "MEDCPIM158SFRBCLE",          
-}
-
-SERIES_INFL_EXP = {
-    "5Y Breakeven" : "T5YIE",   # 5-Year Breakeven Inflation Rate
-    "5Y5Y Forwards": "T5YIFR",  # 5-Year, 5-Year Forward Inflation Expectation
-}
-
-SERIES_PROB_YR_AHEAD = {
-    "Prob > 2.5% Next Yr" : "STLPPM",   
-}
-
-SERIES_UMICH_YR_AHEAD = {
-    "UMich 1-Yr Exp"      : "MICH",     
-}
+SERIES_CPI            = registry.table("overview.cpi")
+SERIES_PPI            = registry.table("overview.ppi")
+SERIES_PCE            = registry.table("overview.pce")
+SERIES_ALT_CORE       = registry.table("overview.alt_core")
+SERIES_INFL_EXP       = registry.table("overview.infl_exp")
+SERIES_PROB_YR_AHEAD  = registry.table("overview.prob_next_year")
+SERIES_UMICH_YR_AHEAD = registry.table("overview.umich_next_year")
 
 # Fed’s Average-Inflation-Target (AIT) band, expressed in %-pts
 AIT_BAND_LOW  = 2.0
 AIT_BAND_HIGH = 2.5
 
-@st.cache_data(show_spinner=False)
+@traced("panel")
 def _panel_cpi() -> pd.DataFrame:
     """
     Returns a DataFrame containing:
@@ -57,27 +41,10 @@ def _panel_cpi() -> pd.DataFrame:
         Headline CPI YoY,  Core CPI YoY,
         Headline CPI 3M,   Core CPI 3M,  USREC
     """
-    # raw indices
-    df_idx = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_CPI.items()],
-        axis=1
-    ).dropna()
-
-    # YoY %
-    yoy = df_idx.pct_change(12) * 100
-    yoy.columns = [f"{c} YoY" for c in df_idx.columns]
+    return price_indexes.panel(SERIES_CPI)
 
-    # 3-month rolling annualised %
-    ann3 = (df_idx / df_idx.shift(3)) ** 4 - 1
-    ann3 = ann3 * 100
-    ann3.columns = [f"{c} 3M" for c in df_idx.columns]
 
-    rec = _fred_series(RECESS, name="USREC")
-
-    return pd.concat([yoy, ann3, rec], axis=1).dropna()
-
-
-@st.cache_data(show_spinner=False)
+@traced("panel")
 def _panel_ppi() -> pd.DataFrame:
     """
     Build a DataFrame with:
@@ -85,43 +52,24 @@ def _panel_ppi() -> pd.DataFrame:
       • 3-month rolling annualised % change
       • NBER recession flag
     """
-    df_idx = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_PPI.items()],
-        axis=1
-    ).dropna()
-
-    # YoY %
-    yoy = df_idx.pct_change(12) * 100
-    yoy.columns = [f"{c} YoY" for c in df_idx.columns]
+    return price_indexes.panel(SERIES_PPI)
 
-    # 3-month rolling annualised %
-    ann3 = (df_idx / df_idx.shift(3)) ** 4 - 1
-    ann3 = ann3 * 100
-    ann3.columns = [f"{c} 3M" for c in df_idx.columns]
 
-    rec = _fred_series(RECESS, name="USREC")
-
-    return pd.concat([yoy, ann3, rec], axis=1).dropna()
-
-
-@st.cache_data(show_spinner=False)
+@traced("panel")
+@cache_panel("overview.alt_core")
 def _panel_alt_core() -> pd.DataFrame:
-    df = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_ALT_CORE.items()],
-        axis=1
-    ).dropna()
+    df = fetch_many(SERIES_ALT_CORE).dropna()
     rec = _fred_series(RECESS, name="USREC")
     return df.join(rec, how="inner").dropna()
 
 
-@st.cache_data(show_spinner=False)
+@traced("panel")
+@cache_panel("overview.infl_exp")
 def _panel_infl_exp() -> pd.DataFrame:
-    return pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_INFL_EXP.items()],
-        axis=1
-    ).dropna()
+    return fetch_many(SERIES_INFL_EXP).dropna()
 
-@st.cache_data(show_spinner=False)
+@traced("panel")
+@cache_panel("overview.prob_next_year")
 def _panel_prob_next_year() -> pd.DataFrame:
     """Return probability series converted to percent (0–100)."""
     df = _fred_series(SERIES_PROB_YR_AHEAD["Prob > 2.5% Next Yr"],
@@ -129,28 +77,14 @@ def _panel_prob_next_year() -> pd.DataFrame:
     return (df * 100.0).dropna()              # decimal → percent
 
 
-@st.cache_data(show_spinner=False)
+@traced("panel")
+@cache_panel("overview.umich_next_year")
 def _panel_umich_next_year() -> pd.DataFrame:
     """Return UMich median 1-year inflation expectation (%)."""
     return _fred_series(SERIES_UMICH_YR_AHEAD["UMich 1-Yr Exp"],
                         name="UMich 1-Yr Exp").dropna()
 
 
-def _recession_periods(rec: pd.Series):
-    """Return list of (start, end) timestamps where rec == 1."""
-    rec = rec.astype(bool)
-    starts = rec & ~rec.shift(1, fill_value=False)
-    ends   = rec & ~rec.shift(-1, fill_value=False)
-    return list(zip(starts[starts].index, ends[ends].index))
-
-
-def _add_recessions(fig: go.Figure, periods):
-    for s, e in periods:
-        fig.add_vrect(
-            x0=s, x1=e, fillcolor="grey",
-            opacity=0.25, line_width=0, layer="below"
-        )
-
 def _add_fed_ait_band(fig: go.Figure):
     """Grey horizontal band for the Fed’s 2-2.5 % average-inflation target."""
     fig.add_hrect(
@@ -164,16 +98,72 @@ def _add_fed_ait_band(fig: go.Figure):
         font=dict(size=11, color="#444"), bgcolor="rgba(0,0,0,0)"
     )
 
+
+@cached_figure
+def _trend_figure(df_yoy: pd.DataFrame, recess) -> go.Figure:
+    """Core / headline YoY lines over the full history."""
+    df_yoy = downsample(df_yoy)
+    core, headline = df_yoy.columns
+
+    fig = go.Figure()
+    fig.add_scatter(
+        x=df_yoy.index, y=df_yoy[core],
+        mode="lines", name="Core",
+        line=dict(width=3, color="#18A5C2")
+    )
+    fig.add_scatter(
+        x=df_yoy.index, y=df_yoy[headline],
+        mode="lines", name="Headline",
+        line=dict(width=3, color="#0D1F2D")
+    )
+    _add_fed_ait_band(fig)
+    fig.add_hline(y=0, line_width=1, line_dash="dash", line_color="#000")
+    add_recessions(fig, recess)
+    fig.update_layout(
+        height=FIG_H, template="simple_white",
+        margin=dict(t=20, b=25),
+        yaxis=dict(title="YoY", tickformat=".1f", ticksuffix="%"),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01)
+    )
+    return fig
+
+
+@cached_figure
+def _short_term_figure(df_3m: pd.DataFrame, recess, yaxis: dict) -> go.Figure:
+    """Core / headline 3-month annualised lines, zoomed to the last 24 months."""
+    start_zoom = df_3m.index.max() - pd.DateOffset(months=24)
+    df_3m      = downsample(df_3m, start_zoom)
+    core, headline = df_3m.columns
+
+    fig = go.Figure()
+    fig.add_scatter(
+        x=df_3m.index, y=df_3m[core],
+        mode="lines", name="Core",
+        line=dict(width=3, color="#18A5C2")
+    )
+    fig.add_scatter(
+        x=df_3m.index, y=df_3m[headline],
+        mode="lines", name="Headline",
+        line=dict(width=3, color="#0D1F2D")
+    )
+    _add_fed_ait_band(fig)
+    add_recessions(fig, recess)
+    fig.update_layout(
+        height=FIG_H, template="simple_white",
+        margin=dict(t=20, b=25),
+        xaxis=dict(range=[start_zoom, df_3m.index.max()]),
+        yaxis=yaxis,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01)
+    )
+    return fig
+
+
+@traced("render")
 def render_cpi_overview() -> None:
     """Render CPI YoY trend and 3-month annualised change side-by-side."""
     df      = _panel_cpi()
-    recess  = _recession_periods(df["USREC"])
-
-    # split out the two panels
-    df_yoy = df[["Core CPI YoY", "Headline CPI YoY"]]
-    df_3m  = df[["Core CPI 3M",  "Headline CPI 3M"]]
+    recess  = recession_periods(df.index.min(), df.index.max())
 
-    # ----- layout --------------------------------------------------------
     col1, col2 = st.columns(2, gap="large")
 
     # 1) CPI YoY trend ----------------------------------------------------
@@ -183,27 +173,7 @@ def render_cpi_overview() -> None:
             "US CPI Trend&nbsp;–&nbsp;YoY</div>",
             unsafe_allow_html=True,
         )
-
-        fig = go.Figure()
-        fig.add_scatter(
-            x=df_yoy.index, y=df_yoy["Core CPI YoY"],
-            mode="lines", name="Core",
-            line=dict(width=3, color="#18A5C2")
-        )
-        fig.add_scatter(
-            x=df_yoy.index, y=df_yoy["Headline CPI YoY"],
-            mode="lines", name="Headline",
-            line=dict(width=3, color="#0D1F2D")
-        )
-        _add_fed_ait_band(fig)
-        fig.add_hline(y=0, line_width=1, line_dash="dash", line_color="#000")
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            yaxis=dict(title="YoY", tickformat=".1f", ticksuffix="%"),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01)
-        )
+        fig = _trend_figure(df[["Core CPI YoY", "Headline CPI YoY"]], recess)
         st.plotly_chart(fig, use_container_width=True)
 
     # 2) Short-term (3-month annualised) change --------------------------
@@ -213,39 +183,19 @@ def render_cpi_overview() -> None:
             "US CPI Short&nbsp;Term&nbsp;Change</div>",
             unsafe_allow_html=True,
         )
-
-        # Zoom to ~last 24 months for readability
-        start_zoom = df_3m.index.max() - pd.DateOffset(months=24)
-
-        fig = go.Figure()
-        fig.add_scatter(
-            x=df_3m.index, y=df_3m["Core CPI 3M"],
-            mode="lines", name="Core",
-            line=dict(width=3, color="#18A5C2")
-        )
-        fig.add_scatter(
-            x=df_3m.index, y=df_3m["Headline CPI 3M"],
-            mode="lines", name="Headline",
-            line=dict(width=3, color="#0D1F2D")
-        )
-        _add_fed_ait_band(fig)
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=[start_zoom, df_3m.index.max()]),
+        fig = _short_term_figure(
+            df[["Core CPI 3M", "Headline CPI 3M"]], recess,
             yaxis=dict(
                 title="3-Month Rolling Annualised CPI",
                 tickformat=".1f", ticksuffix="%", range=[0, 5]
             ),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01)
         )
         st.plotly_chart(fig, use_container_width=True)
 
 
 
 
-@st.cache_data(show_spinner=False)
+@traced("panel")
 def _panel_pce() -> pd.DataFrame:
     """
     Same construction as _panel_cpi(), but for PCE:
@@ -253,30 +203,14 @@ def _panel_pce() -> pd.DataFrame:
         • 3-month rolling annualised % change
         • US recession indicator
     """
-    df_idx = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES_PCE.items()],
-        axis=1
-    ).dropna()
-
-    yoy = df_idx.pct_change(12) * 100
-    yoy.columns = [f"{c} YoY" for c in df_idx.columns]
-
-    ann3 = (df_idx / df_idx.shift(3)) ** 4 - 1
-    ann3 = ann3 * 100
-    ann3.columns = [f"{c} 3M" for c in df_idx.columns]
-
-    rec = _fred_series(RECESS, name="USREC")
-
-    return pd.concat([yoy, ann3, rec], axis=1).dropna()
+    return price_indexes.panel(SERIES_PCE)
 
 
+@traced("render")
 def render_ppi_overview() -> None:
     """Render PPI YoY trend and 3-month annualised change (side-by-side)."""
     df      = _panel_ppi()
-    recess  = _recession_periods(df["USREC"])
-
-    df_yoy = df[["Core PPI YoY", "Headline PPI YoY"]]
-    df_3m  = df[["Core PPI 3M",  "Headline PPI 3M"]]
+    recess  = recession_periods(df.index.min(), df.index.max())
 
     col1, col2 = st.columns(2, gap="large")
 
@@ -287,26 +221,7 @@ def render_ppi_overview() -> None:
             "US PPI Trend&nbsp;–&nbsp;YoY</div>",
             unsafe_allow_html=True,
         )
-        fig = go.Figure()
-        fig.add_scatter(
-            x=df_yoy.index, y=df_yoy["Core PPI YoY"],
-            mode="lines", name="Core",
-            line=dict(width=3, color="#18A5C2")
-        )
-        fig.add_scatter(
-            x=df_yoy.index, y=df_yoy["Headline PPI YoY"],
-            mode="lines", name="Headline",
-            line=dict(width=3, color="#0D1F2D")
-        )
-        _add_fed_ait_band(fig)
-        fig.add_hline(y=0, line_width=1, line_dash="dash", line_color="#000")
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            yaxis=dict(title="YoY", tickformat=".1f", ticksuffix="%"),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01)
-        )
+        fig = _trend_figure(df[["Core PPI YoY", "Headline PPI YoY"]], recess)
         st.plotly_chart(fig, use_container_width=True)
 
     # 2) Short-term (3-month annualised) change --------------------------
@@ -316,38 +231,18 @@ def render_ppi_overview() -> None:
             "US PPI Short&nbsp;Term&nbsp;Change</div>",
             unsafe_allow_html=True,
         )
-
-        # show last 24 months
-        start_zoom = df_3m.index.max() - pd.DateOffset(months=24)
-
-        fig = go.Figure()
-        fig.add_scatter(
-            x=df_3m.index, y=df_3m["Core PPI 3M"],
-            mode="lines", name="Core",
-            line=dict(width=3, color="#18A5C2")
-        )
-        fig.add_scatter(
-            x=df_3m.index, y=df_3m["Headline PPI 3M"],
-            mode="lines", name="Headline",
-            line=dict(width=3, color="#0D1F2D")
-        )
-        _add_fed_ait_band(fig)
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=[start_zoom, df_3m.index.max()]),
+        fig = _short_term_figure(
+            df[["Core PPI 3M", "Headline PPI 3M"]], recess,
             yaxis=dict(
                 title="3-Month Rolling Annualised PPI",
-                tickformat=".1f", ticksuffix="%",
-                range=[0, 7]
+                tickformat=".1f", ticksuffix="%", range=[0, 7]
             ),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01)
         )
         st.plotly_chart(fig, use_container_width=True)
 
 
 
+@traced("render")
 def render_alt_core_and_expectations() -> None:
     """
     (L) Alternative core CPI/PCE measures (YoY)
@@ -419,6 +314,7 @@ def render_alt_core_and_expectations() -> None:
         )
         st.plotly_chart(fig, use_container_width=True)
 
+@traced("render")
 def render_year_ahead_expectations() -> None:
     """
     (L) Probability inflation > 2.5 % in next 12 months (STLPPM)
@@ -0,0 +1,126 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Callable, NamedTuple
+import streamlit as st
+from data_fetcher import aio, fred
+from data_fetcher.registry import codes
+from sections.charts import stale_badge
+from sections import employment, nfp, wages, alternatives, overview, cpi
+from sections.price_indexes import INDEX_CODES
+
+log = logging.getLogger(__name__)
+
+
+class Page(NamedTuple):
+    renders: list[Callable[[], None]]   # drawn top to bottom
+    codes  : list[str]                  # FRED codes behind those charts
+    panels : list[Callable[[], object]] # cached data builders those charts read
+
+
+def reads(render: Callable[[], None], *panels, shared=()) -> Callable[[], None]:
+    """
+    Tag `render` with the codes it needs before it can draw: those of the
+    registry panels it charts plus any `shared` block they are cut from.
+    """
+    render.codes = list(dict.fromkeys([*codes(*panels), *shared]))
+    return render
+
+
+# Section → sub-page registry driving the navigation in Home.py.
+# Only the selected page's render functions run on a rerun.
+PAGES = {
+    "Employment": {
+        "General": Page(
+            [reads(employment.render_general, "employment")],
+            codes("employment"),
+            [employment._load],
+        ),
+        "NFP": Page(
+            [reads(nfp.render_nfp, "nfp"), reads(nfp.render_nfp_subsector, "nfp"),
+             reads(nfp.render_nfp_revisions, "nfp")],
+            codes("nfp"),
+            [nfp._panel, nfp._revisions],
+        ),
+        "Wages": Page(
+            [reads(wages.render_wages_vs_cpi, "wages"),
+             reads(wages.render_wages_subsector, "wages"),
+             reads(wages.render_wage_benchmarks, "wages")],
+            codes("wages"),
+            [wages._panel],
+        ),
+        "Alternatives": Page(
+            [reads(alternatives.render_alt_labor, "alternatives"),
+             reads(alternatives.render_overtime_and_parttime, "alternatives.ot_pt"),
+             reads(alternatives.render_quits, "alternatives.quits")],
+            codes("alternatives", "alternatives.ot_pt", "alternatives.quits"),
+            [alternatives._panel, alternatives._panel_ot_pt, alternatives._panel_quits],
+        ),
+    },
+    "Inflation": {
+        "Overview": Page(
+            [reads(overview.render_cpi_overview, "overview.cpi", shared=INDEX_CODES),
+             reads(overview.render_ppi_overview, "overview.ppi", shared=INDEX_CODES),
+             reads(overview.render_alt_core_and_expectations,
+                   "overview.alt_core", "overview.infl_exp"),
+             reads(overview.render_year_ahead_expectations,
+                   "overview.prob_next_year", "overview.umich_next_year")],
+            codes("overview.cpi", "overview.ppi", "overview.alt_core",
+                  "overview.infl_exp", "overview.prob_next_year",
+                  "overview.umich_next_year"),
+            [overview._panel_cpi, overview._panel_ppi, overview._panel_alt_core,
+             overview._panel_infl_exp, overview._panel_prob_next_year,
+             overview._panel_umich_next_year],
+        ),
+        "CPI": Page(
+            [reads(cpi.render_cpi_core_ex, "cpi.components", shared=INDEX_CODES),
+             reads(cpi.render_cpi_housing, "cpi.housing", shared=INDEX_CODES),
+             reads(cpi.render_cpi_services, "cpi.services", shared=INDEX_CODES)],
+            codes("cpi.components", "cpi.housing", "cpi.services"),
+            [cpi._panel_components, cpi._panel_housing, cpi._panel_services],
+        ),
+    },
+}
+
+
+def render(section: str, page: str) -> None:
+    """
+    Draw the page. Every chart's downloads start at once on the async data
+    layer and each chart gets a placeholder, filled as soon as its own series
+    are in, so the first chart does not wait for the page's slowest series.
+    A chart whose data cannot be loaded shows an error in its place instead
+    of ending the run, and a badge on top lists any series served from
+    stored copies because FRED was unreachable.
+    """
+    p     = PAGES[section][page]
+    badge = st.empty()
+    slots = {}
+    for fn in p.renders:
+        slot = st.empty()
+        slot.caption("Loading…")
+        slots[aio.submit(aio.fetch_many(fn.codes))] = (fn, slot)
+
+    pending = set(slots)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in sorted(done, key=list(slots).index):     # page order within a batch
+            fn, slot = slots[future]
+            try:
+                with slot.container():
+                    fn()          # download errors resurface here, served stale if stored
+            except Exception as exc:
+                log.exception("rendering %s failed", fn.__name__)
+                slot.error(f"This chart could not be loaded: {exc}")
+    # every code a chart is cut from, e.g. the price indexes of a shared block
+    stale = fred.stale([*p.codes, *(code for fn in p.renders for code in fn.codes)])
+    if stale:
+        badge.markdown(stale_badge(stale), unsafe_allow_html=True)
+
+
+def prefetch_others(section: str, page: str) -> None:
+    """Download the series of every other page in the background."""
+    fred.prefetch([
+        code
+        for sec, pages in PAGES.items()
+        for name, p in pages.items() if (sec, name) != (section, page)
+        for code in p.codes
+    ])
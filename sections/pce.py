@@ -4,7 +4,10 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from datetime import date
-from data_fetcher.fred import _fred_series   # for US recession flags only
+from data_fetcher.trace import traced
+from data_fetcher.recessions import recession_periods
+from sections.charts import add_recessions
+from data_fetcher import offline
 
 # ------------------------------------------------------------------------
 FIG_H  = 390
@@ -19,6 +22,7 @@ AIT_LOW, AIT_HIGH = 2.0, 2.5
 # ------------------------------------------------------------------------
 
 
+@traced("panel")
 @st.cache_data(show_spinner=False)
 def _load_cyclical_acyclical() -> tuple[pd.DataFrame, pd.DataFrame]:
     """
@@ -27,30 +31,15 @@ def _load_cyclical_acyclical() -> tuple[pd.DataFrame, pd.DataFrame]:
       * MoM DF — columns: Cyclical, Acyclical  (MoM annualised pct)
     Index for both is datetime (period end of month).
     """
-    yoy = pd.read_csv(URL_YOY, parse_dates=["DATE"], index_col="DATE")
+    yoy = offline.read_csv(URL_YOY, parse_dates=["DATE"], index_col="DATE")
     yoy = yoy.rename(columns=lambda c: c.strip().title())  # tidy -> Cyclical / Acyclical
 
-    mom = pd.read_csv(URL_MOM, parse_dates=["DATE"], index_col="DATE")
+    mom = offline.read_csv(URL_MOM, parse_dates=["DATE"], index_col="DATE")
     mom = mom.rename(columns=lambda c: c.strip().title())
 
     return yoy, mom
 
 
-def _recession_periods(rec: pd.Series):
-    rec = rec.astype(bool)
-    start = rec & ~rec.shift(1, fill_value=False)
-    end   = rec & ~rec.shift(-1, fill_value=False)
-    return list(zip(start[start].index, end[end].index))
-
-
-def _add_recessions(fig: go.Figure, periods):
-    for s, e in periods:
-        fig.add_vrect(
-            x0=s, x1=e, fillcolor="grey",
-            opacity=0.25, line_width=0, layer="below"
-        )
-
-
 def _add_fed_ait_band(fig: go.Figure):
     fig.add_hrect(
         y0=AIT_LOW, y1=AIT_HIGH,
@@ -66,11 +55,11 @@ def _add_fed_ait_band(fig: go.Figure):
 
 # ========================== main render =================================
 
+@traced("render")
 def render_pce_cyclical() -> None:
     """(L) YoY Cyclical vs Acyclical; (R) MoM-annualised stacked bars."""
     df_yoy, df_mom = _load_cyclical_acyclical()
-    rec = _fred_series(RECESS, name="USREC").squeeze()
-    recess = _recession_periods(rec)
+    recess = recession_periods(df_yoy.index.min(), df_yoy.index.max())
 
     col1, col2 = st.columns(2, gap="large")
 
@@ -92,7 +81,7 @@ def render_pce_cyclical() -> None:
             )
         _add_fed_ait_band(fig)
         fig.add_hline(y=0, line_width=1, line_dash="dash", line_color="#000")
-        _add_recessions(fig, recess)
+        add_recessions(fig, recess)
         fig.update_layout(
             height=FIG_H, template="simple_white",
             margin=dict(t=20, b=25, r=10),
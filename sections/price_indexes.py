@@ -0,0 +1,40 @@
+import pandas as pd
+from data_fetcher.fred import _fred_series, fetch_many
+from data_fetcher import registry
+from data_fetcher.transforms import compute
+from data_fetcher.trace import traced
+from data_fetcher.schedule import cache_panel
+
+RECESS     = "USREC"
+TRANSFORMS = ("YoY", "3M")       # 12-month %, 3-month annualised %
+
+# Every price index the inflation pages chart, computed together in one block.
+INDEX_CODES = registry.with_transforms(TRANSFORMS)
+
+
+@traced("panel")
+@cache_panel(lambda codes, transforms: [*codes, RECESS])
+def _block(codes: tuple, transforms: tuple) -> pd.DataFrame:
+    """
+    Every index in the registry under every transform, computed in one pass,
+    plus the recession flag. Columns: "<code> <transform>", USREC.
+    """
+    idx = fetch_many(list(codes))
+    rec = _fred_series(RECESS, name="USREC")
+    return compute(idx, transforms).join(rec, how="left")
+
+
+def panel(series: dict) -> pd.DataFrame:
+    """
+    Column selection from the shared block for one {label: code} table:
+        <label> YoY …, <label> 3M …, USREC   (rows with any gap dropped)
+    """
+    codes = tuple(sorted(set(INDEX_CODES) | set(series.values())))
+    block = _block(codes, TRANSFORMS)
+    cols  = {
+        f"{code} {spec}": f"{lbl} {spec}"
+        for spec in TRANSFORMS for lbl, code in series.items()
+    }
+    return (block[[*cols, "USREC"]]
+            .rename(columns=cols)
+            .dropna())
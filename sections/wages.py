@@ -2,37 +2,24 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import date
-from data_fetcher.fred import _fred_series    
+from data_fetcher.fred import _fred_series, fetch_many    
+from data_fetcher import registry
+from data_fetcher.trace import traced
+from data_fetcher.schedule import cache_panel
+from data_fetcher.recessions import recession_periods
+from sections.charts import add_recessions, cached_figure, scatter
 
 FIG_H   = 390
 ANCHOR  = date(2020, 1, 1)       
 RECESS  = "USREC"                
 
-SERIES = {
-    "Total Private"             : "CES0500000003",
-    "Goods-Producing"           : "CES0600000003",
-    "Private Service-Providing" : "CES0800000003",
-    "CPI"                       : "CPIAUCSL",
-    "TTU"                       : "CES4000000003",   
-    "Information"               : "CES5000000003",  
-    "Financial"                 : "CES5500000003",   
-    "Business"                  : "CES6000000003",   
-    "Private Edu. & Health"     : "CES6500000003",   
-    "Leisure & Hosp."           : "CES7000000003",   
-    "Mining and Logging"        : "CES1000000003",  
-    "Construction"              : "CES2000000003",   
-    "Manufacturing"             : "CES3000000003",
-    "Non-supervisory"           : "AHETPI",   
-    "ECI Wages"                 : "ECIWAG", 
-}
-
-
-@st.cache_data(show_spinner=False)
+SERIES = registry.table("wages")
+
+
+@traced("panel")
+@cache_panel("wages")
 def _panel():
-    wages = pd.concat(
-        [_fred_series(code, name=lbl) for lbl, code in SERIES.items()],
-        axis=1
-    )
+    wages = fetch_many(SERIES)
     rec   = _fred_series(RECESS, name="USREC")
     return wages.join(rec, how="inner").dropna()
 
@@ -42,12 +29,7 @@ def _pct_change(df: pd.DataFrame, anchor: date) -> pd.DataFrame:
         anchor = df.index[df.index.get_loc(anchor, method="bfill")]
     return (df.div(df.loc[anchor]).sub(1)).mul(100)
 
-def _recession_periods(rec):
-    rec = rec.astype(bool)
-    start = rec & ~rec.shift(1, fill_value=False)
-    end   = rec & ~rec.shift(-1, fill_value=False)
-    return list(zip(start[start].index, end[end].index))
-
+@traced("panel")
 def _prepared():
     """
     Returns
@@ -58,15 +40,32 @@ def _prepared():
     base   = _panel()
     df_raw = base.drop(columns="USREC")
     df_pct = _pct_change(df_raw, ANCHOR).loc["2020-01-01":]
-    recess = _recession_periods(base["USREC"])
+    recess = recession_periods(df_pct.index.min(), df_pct.index.max())
     x_rng  = ["2020-01-01", df_pct.index.max().strftime("%Y-%m-%d")]
     return df_pct, recess, x_rng
 
-def _add_recessions(fig, periods):
-    for s, e in periods:
-        fig.add_vrect(x0=s, x1=e, fillcolor="grey",
-                      opacity=0.25, line_width=0, layer="below")
-        
+@cached_figure
+def _lines(df, labels, colors, recess, x_rng, legend_font=None) -> go.Figure:
+    fig = go.Figure()
+    for lbl, col in zip(labels, colors):
+        fig.add_trace(scatter(df[labels].size,
+                              x=df.index, y=df[lbl],
+                              name=lbl, mode="lines",
+                              line=dict(width=3, color=col)))
+    add_recessions(fig, recess)
+    legend = dict(orientation="h", yanchor="bottom", y=1.02, x=0.01)
+    if legend_font:
+        legend["font"] = legend_font
+    fig.update_layout(
+        height=FIG_H, template="simple_white",
+        margin=dict(t=20, b=25),
+        xaxis=dict(range=x_rng),
+        yaxis=dict(title="Percent", tickformat=".1f", ticksuffix="%"),
+        legend=legend,
+    )
+    return fig
+
+@traced("render")
 def render_wages_vs_cpi() -> None:
     df, recess, x_rng = _prepared()
 
@@ -80,21 +79,8 @@ def render_wages_vs_cpi() -> None:
             unsafe_allow_html=True,
         )
 
-        fig1 = go.Figure()
-        fig1.add_scatter(x=df.index, y=df["Total Private"],
-                         name="Total Private", mode="lines",
-                         line=dict(width=3, color="#18A5C2"))
-        fig1.add_scatter(x=df.index, y=df["CPI"],
-                         name="CPI", mode="lines",
-                         line=dict(width=3, color="#0D1F2D"))
-        _add_recessions(fig1, recess)
-        fig1.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Percent", tickformat=".1f", ticksuffix="%"),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01),
-        )
+        fig1 = _lines(df, ["Total Private", "CPI"], ["#18A5C2", "#0D1F2D"],
+                      recess, x_rng)
         st.plotly_chart(fig1, use_container_width=True)
 
     # ---------- (2) Goods & services wages vs CPI -----------------------
@@ -108,23 +94,12 @@ def render_wages_vs_cpi() -> None:
         order  = ["Goods-Producing", "Private Service-Providing", "CPI"]
         colors = ["#18A5C2", "#9EC9E2", "#F4B400"]
 
-        fig2 = go.Figure()
-        for lbl, col in zip(order, colors):
-            fig2.add_scatter(x=df.index, y=df[lbl],
-                             name=lbl, mode="lines",
-                             line=dict(width=3, color=col))
-        _add_recessions(fig2, recess)
-        fig2.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Percent", tickformat=".1f", ticksuffix="%"),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01),
-        )
+        fig2 = _lines(df, order, colors, recess, x_rng)
         st.plotly_chart(fig2, use_container_width=True)
 
 
 # Sub-sector wage lines vs CPI  
+@traced("render")
 def render_wages_subsector() -> None:
     df, recess, x_rng = _prepared()
 
@@ -144,20 +119,8 @@ def render_wages_subsector() -> None:
         serv_colors = ["#0E84C8", "#6C8EBF", "#2A7F9C",
                        "#002B45", "#FABB2A", "#FDBE4C", "#F28E2B"]
 
-        fig = go.Figure()
-        for lbl, col in zip(serv_order, serv_colors):
-            fig.add_scatter(x=df.index, y=df[lbl],
-                            name=lbl, mode="lines",
-                            line=dict(width=3, color=col))
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Percent", tickformat=".1f", ticksuffix="%"),
-            legend=dict(orientation="h", yanchor="bottom",
-                        y=1.02, x=0.01, font=dict(size=11)),
-        )
+        fig = _lines(df, serv_order, serv_colors, recess, x_rng,
+                     legend_font=dict(size=11))
         st.plotly_chart(fig, use_container_width=True)
 
     # ---------- (b) Goods detail -----------------------------------------
@@ -172,31 +135,20 @@ def render_wages_subsector() -> None:
                         "Mining and Logging", "CPI"]
         goods_colors = ["#9EC9E2", "#18A5C2", "#F4B400", "#F28E2B"]
 
-        fig = go.Figure()
-        for lbl, col in zip(goods_order, goods_colors):
-            fig.add_scatter(x=df.index, y=df[lbl],
-                            name=lbl, mode="lines",
-                            line=dict(width=3, color=col))
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Percent", tickformat=".1f", ticksuffix="%"),
-            legend=dict(orientation="h", yanchor="bottom",
-                        y=1.02, x=0.01, font=dict(size=11)),
-        )
+        fig = _lines(df, goods_order, goods_colors, recess, x_rng,
+                     legend_font=dict(size=11))
         st.plotly_chart(fig, use_container_width=True)
 
 
 
 # Non-supervisory AHE vs CPI  +  Employment-Cost-Index YoY           #
+@traced("render")
 def render_wage_benchmarks() -> None:
     df_pct, recess, x_rng = _prepared()         
-    base     = _panel()                         
+    eci      = _fred_series("ECIWAG", name="ECI Wages")   # full history, unlike _panel()
 
     # ---- build ECI YoY (quarterly) ------------------------------
-    eci_yoy = base["ECI Wages"].pct_change(4) * 100   # 4 quarters ⇒ YoY
+    eci_yoy = eci["ECI Wages"].pct_change(4) * 100   # 4 quarters ⇒ YoY
     eci_yoy = eci_yoy.dropna()
 
     col1, col2 = st.columns(2, gap="large")
@@ -209,25 +161,8 @@ def render_wage_benchmarks() -> None:
             unsafe_allow_html=True,
         )
 
-        fig = go.Figure()
-        fig.add_scatter(
-            x=df_pct.index, y=df_pct["Non-supervisory"],
-            name="Non-supervisory", mode="lines",
-            line=dict(width=3, color="#18A5C2")
-        )
-        fig.add_scatter(
-            x=df_pct.index, y=df_pct["CPI"],
-            name="CPI", mode="lines",
-            line=dict(width=3, color="#0D1F2D")
-        )
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Percent", tickformat=".1f", ticksuffix="%"),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01)
-        )
+        fig = _lines(df_pct, ["Non-supervisory", "CPI"], ["#18A5C2", "#0D1F2D"],
+                     recess, x_rng)
         st.plotly_chart(fig, use_container_width=True)
 
     # ---------- Employment Cost Index YoY ---------------------
@@ -238,19 +173,7 @@ def render_wage_benchmarks() -> None:
             unsafe_allow_html=True,
         )
 
-        fig = go.Figure()
-        fig.add_scatter(
-            x=eci_yoy.index, y=eci_yoy,
-            name="ECI Wages YoY", mode="lines",
-            line=dict(width=3, color="#F4B400")
-        )
-        _add_recessions(fig, recess)
-        fig.update_layout(
-            height=FIG_H, template="simple_white",
-            margin=dict(t=20, b=25),
-            xaxis=dict(range=x_rng),
-            yaxis=dict(title="Percent", tickformat=".1f", ticksuffix="%"),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0.01)
-        )
+        fig = _lines(eci_yoy.to_frame("ECI Wages YoY"), ["ECI Wages YoY"], ["#F4B400"],
+                     recess, x_rng)
         st.plotly_chart(fig, use_container_width=True)
 
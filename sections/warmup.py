@@ -0,0 +1,106 @@
+"""
+Background warm-up: keeps every series and panel the pages read built ahead
+of the visitors who will read them.
+
+    python -m sections.warmup               # one pass, e.g. from a deploy hook
+    python -m sections.warmup --loop 300    # keep refreshing every 5 minutes
+
+Inside the app, Home.py calls start() and one daemon thread per server
+process repeats the pass every DASHBOARD_WARMUP_INTERVAL seconds. A pass
+refreshes whatever the release schedule says is due, builds every page's
+panels under the new data versions and only then publishes those versions,
+so page runs switch from the old panels to the new ones in one step and
+never build a panel themselves. A separate CLI process shares only the
+on-disk series store with the app, not its in-memory panels; started with
+FRED_STORE_ROLE=writer it is the only process that downloads, and every
+app process maps the series it writes (see data_fetcher.fred).
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+from data_fetcher import fred
+from sections.pages import PAGES
+
+INTERVAL = float(os.environ.get("DASHBOARD_WARMUP_INTERVAL", 300))   # 0 = off
+
+log = logging.getLogger(__name__)
+
+_started = False
+_lock    = threading.Lock()
+_last    = {}                    # summary of the latest pass, for diagnostics
+
+
+def all_codes() -> list:
+    return list(dict.fromkeys(
+        code for pages in PAGES.values() for p in pages.values() for code in p.codes
+    ))
+
+
+def all_panels() -> list:
+    return list(dict.fromkeys(
+        panel for pages in PAGES.values() for p in pages.values() for panel in p.panels
+    ))
+
+
+def warm() -> dict:
+    """One pass: refresh due series, build every panel, publish the versions."""
+    t0 = time.perf_counter()
+    codes = all_codes()
+    with fred.live_versions():
+        fred.fetch_many(codes)                    # anything never stored yet
+        versions = fred.data_version(codes)       # refreshes whatever is due
+        panels   = all_panels()
+        for panel in panels:
+            panel()
+    fred.publish(versions)
+
+    _last.update(
+        finished=time.strftime("%Y-%m-%d %H:%M:%S"),
+        seconds=round(time.perf_counter() - t0, 2),
+        codes=len(codes), panels=len(panels), store=fred.store_role(),
+    )
+    return dict(_last)
+
+
+def last_pass() -> dict:
+    return dict(_last)
+
+
+def start(interval: float=None) -> bool:
+    """
+    Start the warm-up thread for this process; later calls do nothing.
+    Returns True if this call started it.
+    """
+    global _started
+    interval = INTERVAL if interval is None else interval
+    with _lock:
+        if _started or interval <= 0:
+            return False
+        _started = True
+
+    def run():
+        while True:
+            try:
+                warm()
+            except Exception:
+                log.exception("warm-up pass failed")   # page runs fall back to live fetches
+            time.sleep(interval)
+
+    threading.Thread(target=run, name="warmup", daemon=True).start()
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--loop", type=float, default=0,
+                        help="repeat every LOOP seconds instead of a single pass")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    while True:
+        print(warm())
+        if not args.loop:
+            break
+        time.sleep(args.loop)
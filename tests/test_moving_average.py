@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime
+from data_fetcher import fred
+from data_fetcher.store import SeriesStore
+
+CODE = "ICSA"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(fred, "_STORE", SeriesStore(tmp_path))
+    fred._CACHE.clear()
+    yield fred._STORE
+    fred._CACHE.clear()
+
+
+def _weekly(values) -> pd.DataFrame:
+    index = pd.date_range("2024-01-06", periods=len(values), freq="7D", name="DATE")
+    return pd.DataFrame({CODE: np.asarray(values, dtype=float)}, index=index)
+
+
+def _expected(df: pd.DataFrame, weeks: int) -> np.ndarray:
+    return df[CODE].rolling(weeks).mean().to_numpy()
+
+
+def test_refresh_within_the_same_second_recomputes_the_average(store):
+    fetched = datetime.now().replace(microsecond=0)
+    first   = _weekly(np.arange(40) * 10.0)
+    store.write(CODE, first, "1950-01-01", fetched_at=fetched)
+    np.testing.assert_allclose(fred.moving_average(CODE, 4)[CODE], _expected(first, 4))
+
+    revised = first.copy()
+    revised.iloc[-3:, 0] += 50.0               # revised tail, same fetch stamp
+    store.write(CODE, revised, "1950-01-01", fetched_at=fetched)
+    fred._CACHE.discard(lambda key: key[0] == CODE)
+
+    np.testing.assert_allclose(fred.moving_average(CODE, 4)[CODE], _expected(revised, 4))
+    assert store.meta(f"{CODE}.MA4")["source"] == store.meta(CODE)["digest"]
+
+
+def test_average_is_reused_while_the_series_is_unchanged(store):
+    df = _weekly(np.arange(40) * 10.0)
+    store.write(CODE, df, "1950-01-01", fetched_at=datetime.now())
+    fred.moving_average(CODE, 4)
+    stamp = store.meta(f"{CODE}.MA4")
+
+    fred._CACHE.clear()
+    fred.moving_average(CODE, 4)
+    assert store.meta(f"{CODE}.MA4") == stamp